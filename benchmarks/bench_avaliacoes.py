@@ -0,0 +1,52 @@
+"""Vazão do motor de avaliações entre vizinhos, em eventos de avaliação por segundo.
+
+Para cada tamanho de população, gera a rede por `gerar_arestas` (grau médio
+`--grau`) e aplica `--eventos` avaliações por dia durante `--dias` dias,
+medindo só o laço de avaliações.
+
+Uso: python benchmarks/bench_avaliacoes.py --tamanhos 10000 100000 1000000 --grau 20 --eventos 1000000 --dias 10
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from socialdive.avaliacoes import MotorAvaliacoes
+from socialdive.grafo import GrafoEsparso
+from socialdive.populacao import criar_populacao
+from socialdive.rede import gerar_arestas
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--grau', type=int, default=20, help="grau médio da rede")
+    parser.add_argument('--eventos', type=int, default=1000000, help="avaliações por dia")
+    parser.add_argument('--dias', type=int, default=10)
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'n_pessoas':>10} {'conexões':>10} {'eventos/dia':>12} {'s/dia':>8} {'eventos/s':>12}")
+    for n_pessoas in args.tamanhos:
+        rng = np.random.RandomState(args.semente)
+        populacao = criar_populacao(n_pessoas, rng)
+        origem, destino = gerar_arestas(populacao['pontuacao_inicial'], n_pessoas * args.grau // 2, rng=rng)
+        grafo = GrafoEsparso.de_arestas(origem, destino, n_pessoas)
+        motor = MotorAvaliacoes(grafo.adjacencia, args.eventos, rng=rng)
+        pontuacoes = populacao['pontuacao_inicial'].copy()
+
+        motor.aplicar(pontuacoes)  # aquecimento
+        inicio = time.perf_counter()
+        for _ in range(args.dias):
+            motor.aplicar(pontuacoes)
+        duracao = time.perf_counter() - inicio
+        print(f"{n_pessoas:>10} {grafo.n_arestas:>10} {args.eventos:>12} {duracao / args.dias:>8.3f} "
+              f"{args.eventos * args.dias / duracao:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
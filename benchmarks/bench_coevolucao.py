@@ -0,0 +1,86 @@
+"""Custo de acompanhar a rede ao longo da simulação: co-evolução incremental vs. reconstrução diária.
+
+A reconstrução diária gera a rede do zero por `gerar_arestas` com as
+pontuações do dia, monta o `GrafoEsparso`, calcula as duas assortatividades
+e detecta comunidades por propagação de rótulos sem partição inicial.
+A co-evolução (`RedeCoevolutiva`) religa só as arestas de quem se moveu e
+atualiza as mesmas métricas incrementalmente.
+
+Uso: python benchmarks/bench_coevolucao.py --tamanhos 10000 100000 --grau 20 --dias 60 --intervalo 1
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from socialdive.coevolucao import RedeCoevolutiva
+from socialdive.comunidades import propagar_rotulos
+from socialdive.estratos import classificar
+from socialdive.grafo import GrafoEsparso
+from socialdive.historico import Registrador
+from socialdive.populacao import criar_populacao
+from socialdive.rede import gerar_arestas
+from socialdive.simulacao import PARAMETROS_PADRAO, evoluir
+
+
+class Reconstrucao(Registrador):
+    """Rede e métricas refeitas do zero a cada `intervalo` dias."""
+
+    def __init__(self, n_conexoes, intervalo, rng):
+        self.n_conexoes = n_conexoes
+        self.intervalo = intervalo
+        self.rng = rng
+
+    def registrar(self, dia, pontuacoes):
+        if dia % self.intervalo:
+            return
+        origem, destino = gerar_arestas(pontuacoes, self.n_conexoes, rng=self.rng)
+        grafo = GrafoEsparso.de_arestas(origem, destino, len(pontuacoes),
+                                        pontuacao=pontuacoes, estrato=classificar(pontuacoes))
+        grafo.assortatividade('pontuacao')
+        grafo.assortatividade_categorica('estrato')
+        propagar_rotulos(grafo.adjacencia, rng=self.rng)
+
+
+class _SemRede(Registrador):
+    def registrar(self, dia, pontuacoes):
+        pass
+
+
+def cronometrar(populacao, n_dias, registrador):
+    inicio = time.perf_counter()
+    evoluir(populacao, PARAMETROS_PADRAO, n_dias, rng=np.random.RandomState(0), registradores=[registrador])
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--grau', type=int, default=20, help="grau médio da rede")
+    parser.add_argument('--dias', type=int, default=60)
+    parser.add_argument('--intervalo', type=int, default=1, help="dias entre atualizações da rede")
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'n_pessoas':>10} {'conexões':>10} {'sem rede (s)':>13} {'reconstrução (s)':>17} "
+          f"{'co-evolução (s)':>16} {'fração':>7}")
+    for n_pessoas in args.tamanhos:
+        rng = np.random.RandomState(args.semente)
+        populacao = criar_populacao(n_pessoas, rng)
+        n_conexoes = n_pessoas * args.grau // 2
+        origem, destino = gerar_arestas(populacao['pontuacao_inicial'], n_conexoes, rng=rng)
+
+        t_base = cronometrar(populacao, args.dias, _SemRede())
+        t_reconstrucao = cronometrar(populacao, args.dias, Reconstrucao(n_conexoes, args.intervalo, rng)) - t_base
+        rede = RedeCoevolutiva(origem, destino, n_pessoas, intervalo=args.intervalo, rng=rng)
+        t_coevolucao = cronometrar(populacao, args.dias, rede) - t_base
+        print(f"{n_pessoas:>10} {n_conexoes:>10} {t_base:>13.2f} {t_reconstrucao:>17.2f} "
+              f"{t_coevolucao:>16.2f} {t_coevolucao / t_reconstrucao:>7.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,305 @@
+"""Suíte de benchmarks de todos os estágios, em várias escalas, com comparação contra uma base.
+
+Cada caso (estágio, n_pessoas, dias) roda num processo novo, com sementes
+fixas: a preparação (população, pontuações, arestas) fica fora da medição,
+e o estágio é repetido até `--repeticoes` vezes (ou até ~20 s), guardando o
+melhor tempo. Para cada caso são registrados a vazão (pessoas·dia/s,
+arestas/s, ...), o pico de memória alocada pelo estágio (tracemalloc, numa
+execução extra fora da medição de tempo) e um valor de verificação derivado
+do resultado, que acusa mudanças de comportamento.
+
+Com `--base` (padrão: base_estagios.json ao lado deste arquivo), cada caso é
+comparado à base: vazão abaixo de (1 - tolerância) × base, memória acima de
+(1 + tolerância) × base ou verificação diferente contam como regressão, e o
+processo termina com código 1. Verificações inteiras (contagens) têm de ser
+iguais; as de ponto flutuante (somas, assortatividades) são comparadas com
+tolerância `TOLERANCIA_VERIFICACAO`, porque outra versão do NumPy, outra
+BLAS ou outro número de threads muda a ordem das somas. `--salvar-base`
+grava os resultados como a nova base (mesclando com os casos já existentes).
+
+Uso: python benchmarks/bench_estagios.py [--tamanhos 1000 100000 1000000] [--dias 30 365]
+                                         [--estagios laco_diario arestas ...] [--tolerancia 0.25]
+                                         [--salvar-base]
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, RAIZ)
+
+BASE_PADRAO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'base_estagios.json')
+SEMENTE = 42
+GRAU = 10  # grau médio da rede nos estágios de rede
+TOLERANCIA_VERIFICACAO = 1e-6  # relativa (e absoluta perto de zero), só para verificações de ponto flutuante
+TEMPO_MAXIMO_S = 20  # repetições param quando a soma dos tempos passa disto
+
+
+# Cada estágio: preparação (fora da medição) e execução medida.
+# `preparar(n_pessoas, n_dias)` retorna o contexto; `executar(contexto)` retorna
+# (quantidade processada, valor de verificação).
+
+def _populacao(n_pessoas):
+    from socialdive.populacao import criar_populacao
+
+    return criar_populacao(n_pessoas, np.random.RandomState(SEMENTE))
+
+
+def _final(populacao, n_dias):
+    from socialdive.simulacao import PARAMETROS_PADRAO, evoluir
+
+    return evoluir(populacao, PARAMETROS_PADRAO, n_dias, rng=np.random.RandomState(SEMENTE))
+
+
+def _arestas(pontuacoes):
+    from socialdive.rede import gerar_arestas
+
+    return gerar_arestas(pontuacoes, len(pontuacoes) * GRAU // 2, rng=np.random.RandomState(SEMENTE))
+
+
+def _grafo(populacao, pontuacoes):
+    from socialdive.estratos import classificar
+    from socialdive.grafo import GrafoEsparso
+
+    origem, destino = _arestas(pontuacoes)
+    return GrafoEsparso.de_arestas(origem, destino, len(pontuacoes), pontuacao=pontuacoes,
+                                   estrato=classificar(pontuacoes),
+                                   classe=populacao['classe_socioeconomica'])
+
+
+def _executar_populacao(n_pessoas):
+    populacao = _populacao(n_pessoas)
+    return n_pessoas, float(populacao['pontuacao_inicial'].sum())
+
+
+def _executar_laco(contexto):
+    from socialdive.historico import RegistroAgregados, RegistroEstratos
+    from socialdive.populacao import CATEGORIAS
+    from socialdive.simulacao import PARAMETROS_PADRAO, evoluir
+
+    populacao, n_dias = contexto
+    # Mesmos registradores da linha de comando
+    classes = populacao['classe_socioeconomica']
+    n_classes = len(CATEGORIAS['classe_socioeconomica'])
+    registradores = [RegistroAgregados(classes, n_classes, n_dias),
+                     RegistroEstratos(n_dias, grupos=classes, n_grupos=n_classes)]
+    final = evoluir(populacao, PARAMETROS_PADRAO, n_dias, rng=np.random.RandomState(SEMENTE),
+                    registradores=registradores)
+    return len(populacao) * (n_dias - 1), float(final.sum())
+
+
+def _executar_arestas(pontuacoes):
+    origem, destino = _arestas(pontuacoes)
+    return len(origem), int(origem.sum() + destino.sum())
+
+
+def _executar_grafo(contexto):
+    from socialdive.grafo import GrafoEsparso
+
+    populacao, pontuacoes, (origem, destino) = contexto
+    grafo = GrafoEsparso.de_arestas(origem, destino, len(pontuacoes), pontuacao=pontuacoes,
+                                    classe=populacao['classe_socioeconomica'])
+    verificacao = grafo.assortatividade('pontuacao') + grafo.assortatividade_categorica('classe')
+    return grafo.n_arestas, round(float(verificacao), 12)
+
+
+def _executar_comunidades(grafo):
+    from socialdive.comunidades import detectar_comunidades
+
+    rotulos, _ = detectar_comunidades(grafo, 'propagacao', semente=SEMENTE)
+    return grafo.n_arestas, int(rotulos.max()) + 1
+
+
+def _executar_analises(populacao):
+    from socialdive.analise import (contagem_estratos, correlacoes_mobilidade, mobilidade_por_classe,
+                                    momentos_mobilidade, registrar_resultado, tabela_classe_estrato)
+
+    registrar_resultado(populacao, populacao['pontuacao_final'])
+    contagem = contagem_estratos(populacao)
+    tabela_classe_estrato(populacao)
+    # Como no main(): uma só passada de momentos para as ANÁLISES 4 e 5
+    momentos = momentos_mobilidade(populacao)
+    mobilidade_por_classe(populacao, momentos)
+    correlacoes_mobilidade(populacao, momentos)
+    return len(populacao), int(contagem @ np.arange(len(contagem)))
+
+
+def _executar_avaliacoes(contexto):
+    motor, pontuacoes, n_dias = contexto
+    motor.rng.seed(SEMENTE)
+    atual = pontuacoes.copy()
+    for _ in range(n_dias):
+        motor.aplicar(atual)
+    return motor.n_interacoes * n_dias, float(atual.sum())
+
+
+def _preparar_laco(n_pessoas, n_dias):
+    return _populacao(n_pessoas), n_dias
+
+
+def _preparar_arestas(n_pessoas, n_dias):
+    return _populacao(n_pessoas)['pontuacao_inicial']
+
+
+def _preparar_grafo(n_pessoas, n_dias):
+    populacao = _populacao(n_pessoas)
+    return populacao, populacao['pontuacao_inicial'], _arestas(populacao['pontuacao_inicial'])
+
+
+def _preparar_comunidades(n_pessoas, n_dias):
+    populacao = _populacao(n_pessoas)
+    return _grafo(populacao, populacao['pontuacao_inicial'])
+
+
+def _preparar_analises(n_pessoas, n_dias):
+    populacao = _populacao(n_pessoas)
+    populacao['pontuacao_final'] = _final(populacao, n_dias)
+    return populacao
+
+
+def _preparar_avaliacoes(n_pessoas, n_dias):
+    from socialdive.avaliacoes import MotorAvaliacoes
+
+    populacao = _populacao(n_pessoas)
+    grafo = _grafo(populacao, populacao['pontuacao_inicial'])
+    motor = MotorAvaliacoes(grafo.adjacencia, n_pessoas * 5, rng=np.random.RandomState(SEMENTE))
+    return motor, populacao['pontuacao_inicial'], n_dias
+
+
+# nome: (preparar, executar, unidade, depende do horizonte)
+ESTAGIOS = {
+    'populacao': (lambda n_pessoas, n_dias: n_pessoas, _executar_populacao, 'pessoas/s', False),
+    'laco_diario': (_preparar_laco, _executar_laco, 'pessoas·dia/s', True),
+    'arestas': (_preparar_arestas, _executar_arestas, 'arestas/s', False),
+    'grafo': (_preparar_grafo, _executar_grafo, 'arestas/s', False),
+    'comunidades': (_preparar_comunidades, _executar_comunidades, 'arestas/s', False),
+    'analises': (_preparar_analises, _executar_analises, 'pessoas/s', True),
+    'avaliacoes': (_preparar_avaliacoes, _executar_avaliacoes, 'eventos/s', True),
+}
+
+
+def medir_caso(estagio, n_pessoas, n_dias, repeticoes):
+    """Executa um caso no processo atual e retorna suas medidas."""
+    import tracemalloc
+
+    preparar, executar, unidade, _ = ESTAGIOS[estagio]
+    # Aquecimento num caso mínimo: importações tardias não entram no tempo nem na memória
+    executar(preparar(100, 2))
+    contexto = preparar(n_pessoas, n_dias)
+    tempos = []
+    while len(tempos) < repeticoes and sum(tempos) < TEMPO_MAXIMO_S:
+        inicio = time.perf_counter()
+        quantidade, verificacao = executar(contexto)
+        tempos.append(time.perf_counter() - inicio)
+
+    # Memória numa execução à parte: o tracemalloc (que também vê as alocações do NumPy) deixa tudo mais lento
+    tracemalloc.start()
+    executar(contexto)
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    melhor = min(tempos)
+    return {'estagio': estagio, 'n_pessoas': n_pessoas, 'dias': n_dias, 'unidade': unidade,
+            'segundos': round(melhor, 6), 'repeticoes': len(tempos), 'vazao': quantidade / melhor,
+            'pico_mb': round(pico / (1 << 20), 2), 'verificacao': verificacao}
+
+
+def _em_processo_novo(estagio, n_pessoas, n_dias, repeticoes):
+    comando = [sys.executable, os.path.abspath(__file__), '--caso', estagio, str(n_pessoas), str(n_dias),
+               '--repeticoes', str(repeticoes)]
+    saida = subprocess.run(comando, cwd=RAIZ, capture_output=True, text=True, check=True).stdout
+    return json.loads(saida.strip().splitlines()[-1])
+
+
+def chave(resultado):
+    return f"{resultado['estagio']}/{resultado['n_pessoas']}/{resultado['dias']}"
+
+
+def verificacao_igual(valor, base):
+    if isinstance(valor, int) and isinstance(base, int):
+        return valor == base
+    return bool(np.isclose(valor, base, rtol=TOLERANCIA_VERIFICACAO, atol=TOLERANCIA_VERIFICACAO))
+
+
+def comparar(resultado, base, tolerancia):
+    """Problemas do resultado em relação à base (lista vazia se não há regressão)."""
+    problemas = []
+    if resultado['vazao'] < base['vazao'] * (1 - tolerancia):
+        problemas.append(f"vazão {resultado['vazao'] / base['vazao'] - 1:+.0%}")
+    # Folga de 1 MB: picos pequenos oscilam com o alocador
+    if resultado['pico_mb'] > base['pico_mb'] * (1 + tolerancia) + 1:
+        problemas.append(f"memória {resultado['pico_mb']:.0f} MB (base {base['pico_mb']:.0f} MB)")
+    if not verificacao_igual(resultado['verificacao'], base['verificacao']):
+        problemas.append(f"resultado mudou ({base['verificacao']} → {resultado['verificacao']})")
+    return problemas
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[1000, 100000, 1000000])
+    parser.add_argument('--dias', type=int, nargs='+', default=[30, 365],
+                        help="horizontes dos estágios que dependem do número de dias")
+    parser.add_argument('--estagios', nargs='+', default=list(ESTAGIOS), choices=list(ESTAGIOS))
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--base', default=BASE_PADRAO, help="arquivo JSON da base de comparação")
+    parser.add_argument('--tolerancia', type=float, default=0.25,
+                        help="fração de piora tolerada em vazão e memória")
+    parser.add_argument('--salvar-base', action='store_true', help="grava os resultados como nova base")
+    parser.add_argument('--caso', nargs=3, default=None, metavar=('ESTAGIO', 'N_PESSOAS', 'DIAS'),
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.caso:
+        estagio, n_pessoas, n_dias = args.caso
+        print(json.dumps(medir_caso(estagio, int(n_pessoas), int(n_dias), args.repeticoes)))
+        return
+
+    base = {}
+    if os.path.exists(args.base):
+        with open(args.base, encoding='utf-8') as arquivo:
+            base = json.load(arquivo)
+    casos_base = base.get('casos', {})
+
+    resultados = []
+    regressoes = 0
+    print(f"{'estágio':<12} {'n_pessoas':>10} {'dias':>5} {'tempo (s)':>10} {'vazão':>14} {'unidade':<14} "
+          f"{'pico (MB)':>9} {'vs. base':>9}  situação")
+    for estagio in args.estagios:
+        horizontes = args.dias if ESTAGIOS[estagio][3] else [0]
+        for n_pessoas in args.tamanhos:
+            for n_dias in horizontes:
+                resultado = _em_processo_novo(estagio, n_pessoas, n_dias, args.repeticoes)
+                resultados.append(resultado)
+                referencia = casos_base.get(chave(resultado))
+                if referencia is None:
+                    relacao, situacao = '-', 'sem base'
+                else:
+                    relacao = f"{resultado['vazao'] / referencia['vazao']:.2f}x"
+                    problemas = comparar(resultado, referencia, args.tolerancia)
+                    situacao = 'REGRESSÃO: ' + '; '.join(problemas) if problemas else 'ok'
+                    regressoes += bool(problemas)
+                print(f"{estagio:<12} {n_pessoas:>10} {n_dias or '-':>5} {resultado['segundos']:>10.3f} "
+                      f"{resultado['vazao']:>14,.0f} {resultado['unidade']:<14} {resultado['pico_mb']:>9.1f} "
+                      f"{relacao:>9}  {situacao}", flush=True)
+
+    if args.salvar_base:
+        casos_base.update({chave(resultado): resultado for resultado in resultados})
+        base = {'maquina': {'plataforma': platform.platform(), 'python': platform.python_version(),
+                            'numpy': np.__version__, 'cpus': os.cpu_count()},
+                'casos': dict(sorted(casos_base.items()))}
+        with open(args.base, 'w', encoding='utf-8') as arquivo:
+            json.dump(base, arquivo, ensure_ascii=False, indent=1)
+        print(f"\nBase gravada em {args.base} ({len(resultados)} casos).")
+    elif regressoes:
+        print(f"\nFALHA: {regressoes} caso(s) com regressão em relação a {args.base}.")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""ANÁLISES 4 e 5: DataFrame completo (pandas) contra momentos em uma passada.
+
+Para cada tamanho de população, mede tempo e pico de alocações
+(tracemalloc) de (a) `para_dataframe(...).corr()` e
+`groupby(...).agg(['mean', 'std', 'min', 'max'])`, como antes, e (b)
+`momentos_mobilidade` seguido de `mobilidade_por_classe` e
+`correlacoes_mobilidade`, que leem a população em blocos. As duas
+abordagens são conferidas entre si.
+
+Uso: python benchmarks/bench_estatisticas.py --tamanhos 100000 1000000 5000000
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from socialdive.analise import (CARACTERISTICAS, correlacoes_mobilidade, mobilidade_por_classe, momentos_mobilidade,
+                                registrar_resultado)
+from socialdive.populacao import criar_populacao
+
+
+def com_pandas(populacao):
+    dados = populacao.para_dataframe(CARACTERISTICAS + ['mobilidade', 'classe_socioeconomica'])
+    correlacoes = dados[CARACTERISTICAS + ['mobilidade']].corr()['mobilidade'].sort_values().drop('mobilidade')
+    tabela = dados.groupby('classe_socioeconomica', observed=True)['mobilidade'].agg(['mean', 'std', 'min', 'max'])
+    return tabela, correlacoes
+
+
+def em_uma_passada(populacao):
+    momentos = momentos_mobilidade(populacao)
+    return mobilidade_por_classe(populacao, momentos), correlacoes_mobilidade(populacao, momentos)
+
+
+def medir(funcao, populacao):
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = funcao(populacao)
+    duracao = time.perf_counter() - inicio
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return resultado, duracao, pico
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[100000, 1000000, 5000000])
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'n_pessoas':>10} {'abordagem':>14} {'s':>8} {'pico MB':>9}")
+    for n_pessoas in args.tamanhos:
+        rng = np.random.RandomState(args.semente)
+        populacao = criar_populacao(n_pessoas, rng)
+        registrar_resultado(populacao, np.clip(populacao['pontuacao_inicial'] + rng.normal(0, 0.5, n_pessoas), 1, 5))
+        resultados = {}
+        for nome, funcao in (('pandas', com_pandas), ('uma passada', em_uma_passada)):
+            resultados[nome], duracao, pico = medir(funcao, populacao)
+            print(f"{n_pessoas:>10} {nome:>14} {duracao:>8.3f} {pico / (1 << 20):>9.1f}")
+        (tabela_a, corr_a), (tabela_b, corr_b) = resultados['pandas'], resultados['uma passada']
+        assert np.allclose(tabela_a.to_numpy(), tabela_b.to_numpy(), rtol=1e-9, atol=1e-12)
+        assert np.allclose(corr_a.to_numpy(), corr_b[corr_a.index].to_numpy(), rtol=1e-9, atol=1e-12)
+
+
+if __name__ == '__main__':
+    main()
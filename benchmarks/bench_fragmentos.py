@@ -0,0 +1,56 @@
+"""Simulação fragmentada em memória compartilhada vs. `evoluir` num único processo.
+
+Mede pessoas·dia por segundo do laço diário, incluindo os agregados por
+classe e estrato (registradores no caso de `evoluir`, parciais por
+fragmento no caso fragmentado). A população é gerada antes e copiada para
+a memória compartilhada, para comparar só a simulação.
+
+Uso: python benchmarks/bench_fragmentos.py --pessoas 10000000 --dias 30 --fragmentos 1 2 4 8
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from socialdive.fragmentos import SimulacaoFragmentada
+from socialdive.historico import RegistroAgregados, RegistroEstratos
+from socialdive.populacao import criar_populacao
+from socialdive.simulacao import PARAMETROS_PADRAO, evoluir
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--pessoas', type=int, default=10_000_000)
+    parser.add_argument('--dias', type=int, default=30)
+    parser.add_argument('--fragmentos', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.RandomState(args.semente)
+    populacao = criar_populacao(args.pessoas, rng)
+    classes = populacao['classe_socioeconomica']
+
+    registradores = [RegistroAgregados(classes, 3, args.dias, quantis=()),
+                     RegistroEstratos(args.dias, grupos=classes, n_grupos=3)]
+    inicio = time.perf_counter()
+    evoluir(populacao, PARAMETROS_PADRAO, args.dias, rng=rng, registradores=registradores)
+    t_serial = time.perf_counter() - inicio
+
+    print(f"{os.cpu_count()} CPUs, {args.pessoas:,} pessoas, {args.dias} dias")
+    print(f"{'modo':>14} {'tempo (s)':>10} {'pessoas·dia/s':>15} {'aceleração':>11}")
+    print(f"{'evoluir':>14} {t_serial:>10.2f} {args.pessoas * args.dias / t_serial:>15,.0f} {1:>10.1f}x")
+    for n_fragmentos in args.fragmentos:
+        with SimulacaoFragmentada(populacao, n_fragmentos, args.semente) as simulacao:
+            inicio = time.perf_counter()
+            simulacao.executar(PARAMETROS_PADRAO, args.dias)
+            duracao = time.perf_counter() - inicio
+        print(f"{f'{n_fragmentos} fragmentos':>14} {duracao:>10.2f} {args.pessoas * args.dias / duracao:>15,.0f} "
+              f"{t_serial / duracao:>10.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Mede o tempo de importação dos módulos do pacote em processos novos.
+
+Também verifica que bibliotecas pesadas (matplotlib, seaborn, sklearn,
+networkx, pandas) não são carregadas ao importar o núcleo da simulação.
+
+Uso: python benchmarks/bench_importacao.py [--repeticoes 5] [--limite-ms 300]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+MODULOS = ['socialdive', 'socialdive.simulacao', 'socialdive.historico', 'socialdive.cli']
+PESADAS = ['matplotlib', 'seaborn', 'sklearn', 'networkx', 'pandas', 'scipy']
+
+_SONDA = """
+import json, sys, time
+inicio = time.perf_counter()
+import {modulo}
+duracao = time.perf_counter() - inicio
+print(json.dumps({{'ms': duracao * 1000, 'pesadas': [m for m in {pesadas!r} if m in sys.modules]}}))
+"""
+
+
+def medir(modulo, repeticoes):
+    tempos = []
+    pesadas = []
+    for _ in range(repeticoes):
+        saida = subprocess.run([sys.executable, '-c', _SONDA.format(modulo=modulo, pesadas=PESADAS)],
+                               cwd=RAIZ, capture_output=True, text=True, check=True).stdout
+        resultado = json.loads(saida)
+        tempos.append(resultado['ms'])
+        pesadas = resultado['pesadas']
+    return statistics.median(tempos), pesadas
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--limite-ms', type=float, default=300,
+                        help="tempo máximo aceitável para importar socialdive.simulacao")
+    args = parser.parse_args()
+
+    falhou = False
+    print(f"{'módulo':<24} {'mediana (ms)':>13}  bibliotecas pesadas carregadas")
+    for modulo in MODULOS:
+        ms, pesadas = medir(modulo, args.repeticoes)
+        print(f"{modulo:<24} {ms:>13.1f}  {', '.join(pesadas) or '-'}")
+        if modulo == 'socialdive.simulacao' and (ms > args.limite_ms or pesadas):
+            falhou = True
+
+    if falhou:
+        print(f"\nFALHA: socialdive.simulacao deve importar em menos de {args.limite_ms:.0f} ms "
+              "sem carregar bibliotecas pesadas.")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""Vazão da marcação de conceitos: autômato único contra uma busca por forma.
+
+Gera `--documentos` textos sintéticos com formas do vocabulário dos artigos
+espalhadas e mede documentos por segundo de (a) uma expressão regular por
+forma, aplicada em sequência — o custo cresce com o vocabulário — e (b)
+`indexar` com `MarcadorConceitos`, no próprio processo e com `--processos`.
+As frequências por rótulo das duas abordagens são conferidas. Antes disso,
+`--misturas` textos feitos só de formas encostadas umas nas outras (onde
+uma forma começa dentro de outra) são marcados pelos dois motores e pela
+referência, documento a documento.
+
+Uso: python benchmarks/bench_indice.py --documentos 200000 --processos 4
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from socialdive.indice import MarcadorConceitos, _ahocorasick_disponivel, indexar, normalizar
+from socialdive.literatura import ARTIGOS
+
+PALAVRAS = 'as redes sociais the of and to in social media people online post feed score rating uso'.split()
+
+
+def gerar_textos(n, formas, semente=0):
+    rng = np.random.RandomState(semente)
+    for _ in range(n):
+        palavras = list(rng.choice(PALAVRAS, 40))
+        for _ in range(rng.poisson(0.5)):
+            palavras.insert(rng.randint(len(palavras)), formas[rng.randint(len(formas))])
+        yield ' '.join(palavras)
+
+
+def gerar_misturas(n, formas, semente=0):
+    rng = np.random.RandomState(semente)
+    for _ in range(n):
+        yield ' '.join(formas[i] for i in rng.randint(len(formas), size=rng.randint(2, 6)))
+
+
+def _padroes(marcador):
+    return [(re.compile(rf'(?<!\w){re.escape(normalizar(forma))}(?!\w)'), codigo)
+            for codigo, rotulo in enumerate(marcador.rotulos) for forma in marcador.vocabulario[rotulo]]
+
+
+def por_forma(textos, marcador):
+    """Referência: uma busca por forma em cada documento."""
+    padroes = _padroes(marcador)
+    frequencias = np.zeros(len(marcador.rotulos), dtype=np.int64)
+    for texto in textos:
+        texto = normalizar(texto)
+        frequencias[list({codigo for padrao, codigo in padroes if padrao.search(texto)})] += 1
+    return frequencias
+
+
+def conferir_motores(textos, vocabulario):
+    """Confere, texto a texto, os motores disponíveis contra a busca por forma."""
+    marcadores = [MarcadorConceitos(vocabulario, motor='regex')]
+    if _ahocorasick_disponivel():
+        marcadores.append(MarcadorConceitos(vocabulario, motor='ahocorasick'))
+    padroes = _padroes(marcadores[0])
+    for texto in textos:
+        esperado = sorted({codigo for padrao, codigo in padroes if padrao.search(normalizar(texto))})
+        for marcador in marcadores:
+            assert marcador.marcar(texto) == esperado, f"motor {marcador.motor} diverge em {texto!r}"
+    return [marcador.motor for marcador in marcadores]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--documentos', type=int, default=200000)
+    parser.add_argument('--processos', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--misturas', type=int, default=20000)
+    args = parser.parse_args()
+
+    marcador = MarcadorConceitos(motor='regex')
+    formas = [forma for formas in marcador.vocabulario.values() for forma in formas]
+    formas += [citacao for artigo in ARTIGOS for citacao in artigo['citacoes']]
+    print(f"{len(marcador.rotulos)} rótulos, {len(formas)} formas, {args.documentos} documentos")
+    motores = conferir_motores(gerar_misturas(args.misturas, formas), marcador.vocabulario)
+    print(f"{args.misturas} misturas de formas sobrepostas: {', '.join(motores)} de acordo com a referência")
+    print(f"{'abordagem':>28} {'s':>8} {'documentos/s':>14}")
+
+    inicio = time.perf_counter()
+    referencia = por_forma(gerar_textos(args.documentos, formas), marcador)
+    duracao = time.perf_counter() - inicio
+    print(f"{'uma regex por forma':>28} {duracao:>8.2f} {args.documentos / duracao:>14,.0f}")
+
+    for processos in sorted({0, args.processos}):
+        inicio = time.perf_counter()
+        indice = indexar(gerar_textos(args.documentos, formas), marcador, processos)
+        duracao = time.perf_counter() - inicio
+        assert (np.diag(indice.coocorrencia) == referencia).all(), "frequências divergem da referência"
+        nome = f"indexar ({processos or 1} processo{'s' if processos > 1 else ''})"
+        print(f"{nome:>28} {duracao:>8.2f} {args.documentos / duracao:>14,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""Vazão e memória da ingestão do Reddit contra uma gravação sintética (sem rede).
+
+Gera uma gravação JSONL no formato de `gravar_paginas` — `--subreddits`
+subreddits, `--submissoes` submissões cada, `--comentarios` comentários por
+submissão, com termos do vocabulário dos artigos espalhados nos textos — e
+a reproduz com `ClienteGravado`, simulando `--latencia` segundos de ida e
+volta por requisição. Para cada número de threads, mede itens por segundo
+e o pico de alocações (tracemalloc) do pipeline completo; o pico deve ficar
+estável ao dobrar o volume.
+
+Uso: python benchmarks/bench_ingestao.py --subreddits 4 --submissoes 500 --comentarios 20 --threads 1 8 32
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from socialdive.ingestao import POR_PAGINA, ClienteGravado, ContagemIncremental, LimiteTaxa, coletar, itens
+from socialdive.literatura import contar_conceitos, contar_impactos
+
+PALAVRAS = 'the of and to in social media people online network post feed likes score rating'.split()
+
+
+def gravar_fixture(caminho, n_subreddits, n_submissoes, n_comentarios, semente=0):
+    rng = np.random.RandomState(semente)
+    positivos, negativos = contar_impactos()
+    termos = sorted(contar_conceitos()) + sorted(positivos) + sorted(negativos)
+
+    def texto():
+        palavras = list(rng.choice(PALAVRAS, 30))
+        if rng.rand() < 0.3:
+            palavras.insert(rng.randint(len(palavras)), termos[rng.randint(len(termos))])
+        return ' '.join(palavras)
+
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        def escrever(requisicao, lista, depois=None):
+            arquivo.write(json.dumps({'requisicao': requisicao, 'itens': lista, 'depois': depois},
+                                     ensure_ascii=False) + '\n')
+
+        for s in range(n_subreddits):
+            subreddit = f'sub{s}'
+            depois = None
+            for inicio in range(0, n_submissoes, POR_PAGINA):
+                pagina = [{'tipo': 'submissao', 'id': f'{s}_{i}', 'nome': f't3_{s}_{i}', 'subreddit': subreddit,
+                           'criado': float(i), 'n_comentarios': n_comentarios, 'texto': texto()}
+                          for i in range(inicio, min(inicio + POR_PAGINA, n_submissoes))]
+                proximo = pagina[-1]['nome'] if inicio + POR_PAGINA < n_submissoes else None
+                escrever(['submissoes', subreddit, depois], pagina, proximo)
+                depois = proximo
+                for submissao in pagina:
+                    escrever(['comentarios', subreddit, submissao['id']],
+                             [{'tipo': 'comentario', 'id': f"{submissao['id']}_{c}", 'subreddit': subreddit,
+                               'criado': float(c), 'texto': texto()} for c in range(n_comentarios)])
+
+
+def medir(caminho, threads, latencia):
+    with ClienteGravado(caminho, latencia) as cliente:
+        tracemalloc.start()
+        inicio = time.perf_counter()
+        contagem = ContagemIncremental().consumir(itens(coletar(cliente, cliente.subreddits, limite=1 << 30,
+                                                                max_workers=threads, limite_taxa=LimiteTaxa(None))))
+        duracao = time.perf_counter() - inicio
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return contagem, duracao, pico
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--subreddits', type=int, default=4)
+    parser.add_argument('--submissoes', type=int, default=500, help="submissões por subreddit")
+    parser.add_argument('--comentarios', type=int, default=20, help="comentários por submissão")
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 8, 32])
+    parser.add_argument('--latencia', type=float, default=0.005, help="segundos simulados por requisição")
+    args = parser.parse_args()
+
+    print(f"{'submissões':>10} {'threads':>8} {'itens':>10} {'s':>8} {'itens/s':>10} {'pico MB':>8}")
+    with tempfile.TemporaryDirectory() as diretorio:
+        for escala in (1, 2):
+            caminho = os.path.join(diretorio, f'fixture{escala}.jsonl')
+            gravar_fixture(caminho, args.subreddits, args.submissoes * escala, args.comentarios)
+            for threads in args.threads:
+                contagem, duracao, pico = medir(caminho, threads, args.latencia)
+                print(f"{args.submissoes * escala:>10} {threads:>8} {contagem.n_itens:>10} {duracao:>8.2f} "
+                      f"{contagem.n_itens / duracao:>10,.0f} {pico / (1 << 20):>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
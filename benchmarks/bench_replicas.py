@@ -0,0 +1,64 @@
+"""Réplicas Monte Carlo em lote vs. uma simulação por réplica.
+
+A referência executa, para cada réplica, população + `evoluir` com o mesmo
+fluxo aleatório (o que `executar_varredura` faz em cada tarefa), sem o custo
+de subir o script inteiro; o lote é `simular_replicas`. Os dois produzem as
+mesmas pontuações finais: as métricas de cada tamanho de lote são conferidas
+contra as da referência.
+
+Uso: python benchmarks/bench_replicas.py --replicas 100 --pessoas 1000 --dias 365 --lotes 10 100
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from socialdive.estratos import LIMIARES_ESTRATO
+from socialdive.populacao import criar_populacao
+from socialdive.replicas import _metricas_lote, simular_replicas
+from socialdive.simulacao import PARAMETROS_PADRAO, evoluir
+
+
+def separadas(n_replicas, n_pessoas, n_dias, semente):
+    partes = []
+    for sequencia in np.random.SeedSequence(semente).spawn(n_replicas):
+        rng = np.random.RandomState(np.random.MT19937(sequencia))
+        populacao = criar_populacao(n_pessoas, rng)
+        final = evoluir(populacao, PARAMETROS_PADRAO, n_dias, rng=rng)
+        partes.append(_metricas_lote(populacao['classe_socioeconomica'][None], populacao['pontuacao_inicial'][None],
+                                     final[None], LIMIARES_ESTRATO))
+    return {nome: np.concatenate([parte[nome] for parte in partes]) for nome in partes[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--replicas', type=int, default=100)
+    parser.add_argument('--pessoas', type=int, default=1000)
+    parser.add_argument('--dias', type=int, default=365)
+    parser.add_argument('--lotes', type=int, nargs='+', default=[10, 100], help="tamanhos de lote a medir")
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    referencia = separadas(args.replicas, args.pessoas, args.dias, args.semente)
+    t_separadas = time.perf_counter() - inicio
+    print(f"{'modo':>14} {'tempo (s)':>10} {'ms/réplica':>11} {'aceleração':>11}")
+    print(f"{'separadas':>14} {t_separadas:>10.2f} {t_separadas / args.replicas * 1000:>11.1f} {1:>10.1f}x")
+    for tamanho_lote in args.lotes:
+        inicio = time.perf_counter()
+        metricas = simular_replicas(args.replicas, n_pessoas=args.pessoas, n_dias=args.dias, semente=args.semente,
+                                    tamanho_lote=tamanho_lote)
+        t_lote = time.perf_counter() - inicio
+        for nome, valores in referencia.items():
+            assert np.allclose(metricas[nome], valores, rtol=1e-12, atol=1e-12, equal_nan=True), \
+                f"{nome} diverge das réplicas separadas (lote {tamanho_lote})"
+        print(f"{f'lote {tamanho_lote}':>14} {t_lote:>10.2f} {t_lote / args.replicas * 1000:>11.1f} "
+              f"{t_separadas / t_lote:>10.1f}x")
+
+
+if __name__ == '__main__':
+    main()
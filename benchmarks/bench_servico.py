@@ -0,0 +1,90 @@
+"""Teste de carga do serviço de consultas: latência p50/p99 sob requisições concorrentes.
+
+Simula um cenário de `--pessoas` pessoas no próprio processo, sobe o
+serviço (servidor WSGI com threads do werkzeug) numa porta livre e dispara
+`--requisicoes` consultas misturadas — estratos, trajetória, pessoa com
+vizinhos e comunidades — a partir de `--concorrencia` clientes simultâneos.
+Reporta, por rota, o número de requisições, p50 e p99 em milissegundos, e a
+vazão total.
+
+Uso: python benchmarks/bench_servico.py --pessoas 100000 --requisicoes 5000 --concorrencia 16
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from socialdive.servico import Resultados, Servico, criar_app, simular_cenario, validar_cenario
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--pessoas', type=int, default=100000)
+    parser.add_argument('--dias', type=int, default=365)
+    parser.add_argument('--requisicoes', type=int, default=5000)
+    parser.add_argument('--concorrencia', type=int, default=16)
+    parser.add_argument('--semente', type=int, default=0)
+    args = parser.parse_args()
+
+    from werkzeug.serving import make_server
+
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)  # sem uma linha de log por requisição
+
+    inicio = time.perf_counter()
+    resultados = Resultados(**simular_cenario(validar_cenario({'pessoas': args.pessoas, 'dias': args.dias})))
+    print(f"Cenário de {args.pessoas} pessoas × {args.dias} dias carregado em {time.perf_counter() - inicio:.1f}s")
+
+    servico = Servico(max_workers=1)
+    servico.carregar(resultados)
+    servidor = make_server('127.0.0.1', 0, criar_app(servico), threaded=True)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{servidor.server_port}/cenarios/base'
+
+    rng = np.random.RandomState(args.semente)
+    ids = resultados.populacao['id']
+    rotas = {
+        'estratos': lambda: f"/estratos?dia={rng.randint(args.dias)}",
+        'trajetoria': lambda: f"/trajetoria?classe={rng.choice(['Baixa', 'Média', 'Alta'])}",
+        'pessoa': lambda: f"/pessoas/{ids[rng.randint(len(ids))]}?vizinhos=20",
+        'comunidades': lambda: "/comunidades?n=10",
+    }
+    nomes = list(rotas)
+    pedidos = [(nome, rotas[nome]()) for nome in rng.choice(nomes, args.requisicoes)]
+
+    def consultar(pedido):
+        nome, caminho = pedido
+        url = base + urllib.parse.quote(caminho, safe='/?=&')
+        comeco = time.perf_counter()
+        with urllib.request.urlopen(url) as resposta:
+            json.load(resposta)
+        return nome, time.perf_counter() - comeco
+
+    consultar(pedidos[0])  # aquecimento
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(args.concorrencia) as executor:
+        latencias = list(executor.map(consultar, pedidos))
+    duracao = time.perf_counter() - inicio
+    servidor.shutdown()
+    servico.fechar()
+
+    print(f"{'rota':>12} {'n':>7} {'p50 ms':>8} {'p99 ms':>8}")
+    for nome in nomes + ['total']:
+        tempos = np.array([t for n, t in latencias if nome in (n, 'total')]) * 1000
+        p50, p99 = np.percentile(tempos, [50, 99])
+        print(f"{nome:>12} {len(tempos):>7} {p50:>8.2f} {p99:>8.2f}")
+    print(f"{args.requisicoes} requisições com {args.concorrencia} clientes em {duracao:.2f}s "
+          f"({args.requisicoes / duracao:,.0f} req/s)")
+
+
+if __name__ == '__main__':
+    main()
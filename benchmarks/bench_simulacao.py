@@ -0,0 +1,48 @@
+"""Compara o laço diário original (pandas) com o motor de deriva pré-calculada.
+
+Uso: python benchmarks/bench_simulacao.py --tamanhos 1000 10000 100000 --dias 365 --nucleo numpy
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from socialdive.nucleos import obter_nucleo
+from socialdive.populacao import criar_populacao
+from socialdive.simulacao import PARAMETROS_PADRAO, simular, simular_referencia
+
+
+def cronometrar(motor, populacao, n_dias, semente, **opcoes):
+    rng = np.random.RandomState(semente)
+    inicio = time.perf_counter()
+    pontuacoes_tempo = motor(populacao, PARAMETROS_PADRAO, n_dias, rng=rng, **opcoes)
+    return time.perf_counter() - inicio, pontuacoes_tempo
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--dias', type=int, default=365)
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--nucleo', default='numpy', help="numpy, numba ou auto")
+    args = parser.parse_args()
+
+    nucleo = obter_nucleo(args.nucleo, 0).nome
+    # Aquecimento: compila o núcleo JIT fora da medição
+    simular(criar_populacao(10, np.random.RandomState(0)), PARAMETROS_PADRAO, 2, nucleo=nucleo)
+
+    print(f"{'n_pessoas':>10} {'pandas (s)':>12} {nucleo + ' (s)':>12} {'ganho':>8} {'idêntico':>9}")
+    for n_pessoas in args.tamanhos:
+        populacao = criar_populacao(n_pessoas, np.random.RandomState(args.semente))
+        t_ref, ref = cronometrar(simular_referencia, populacao.para_dataframe(), args.dias, args.semente)
+        t_novo, novo = cronometrar(simular, populacao, args.dias, args.semente, nucleo=nucleo)
+        identico = np.array_equal(ref, novo)
+        print(f"{n_pessoas:>10} {t_ref:>12.3f} {t_novo:>12.3f} {t_ref / t_novo:>7.1f}x {str(identico):>9}")
+
+
+if __name__ == '__main__':
+    main()
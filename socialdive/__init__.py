@@ -0,0 +1 @@
+"""SocialDive Analytics: simulação de uma sociedade baseada em pontuação social."""
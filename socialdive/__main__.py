@@ -0,0 +1,3 @@
+from socialdive.cli import main
+
+main()
@@ -0,0 +1,79 @@
+"""Análises da população simulada: estratificação, mobilidade e fatores (ANÁLISES 3 a 5).
+
+Trabalham sobre a `Populacao` colunar: estratos e classes são códigos int8,
+e tabelas saem de reduções `bincount` (ver `socialdive.estratos`). Mobilidade
+e correlações (ANÁLISES 4 e 5) saem de momentos acumulados em uma passada
+(`socialdive.estatisticas`). O pandas entra só para montar as tabelas impressas.
+"""
+import numpy as np
+
+from socialdive.estatisticas import TAMANHO_BLOCO, Momentos
+from socialdive.estratos import ESTRATOS, LIMIARES_ESTRATO, classificar, contingencia, percentual_por_linha
+from socialdive.populacao import CATEGORIAS
+
+# Características comparadas com a mobilidade social na ANÁLISE 5
+CARACTERISTICAS = ['idade', 'conformidade_social', 'autenticidade', 'acesso_tecnologia', 'pontuacao_inicial']
+
+
+def registrar_resultado(populacao, pontuacao_final, limiares=LIMIARES_ESTRATO):
+    """Acrescenta à população as colunas derivadas da pontuação final."""
+    populacao['pontuacao_final'] = pontuacao_final
+    populacao['variacao_pontuacao'] = populacao['pontuacao_final'] - populacao['pontuacao_inicial']
+    # Classificar em estratos sociais baseados na pontuação final (códigos em `ESTRATOS`)
+    populacao['estrato_social'] = classificar(populacao['pontuacao_final'], limiares)
+    # Definir mobilidade como a variação na pontuação
+    populacao['mobilidade'] = populacao['variacao_pontuacao']
+    return populacao
+
+
+def contagem_estratos(populacao):
+    """Número de pessoas em cada estrato, na ordem de `ESTRATOS`."""
+    return np.bincount(populacao['estrato_social'], minlength=len(ESTRATOS))
+
+
+def tabela_classe_estrato(populacao):
+    """Percentual de cada estrato social final dentro de cada classe socioeconômica."""
+    import pandas as pd
+
+    classes = CATEGORIAS['classe_socioeconomica']
+    tabela = contingencia(populacao['classe_socioeconomica'], populacao['estrato_social'], len(classes))
+    # Como no crosstab: só classes e estratos que aparecem na população
+    linhas = tabela.sum(axis=1) > 0
+    colunas = tabela.sum(axis=0) > 0
+    percentuais = percentual_por_linha(tabela[linhas][:, colunas])
+    return pd.DataFrame(percentuais,
+                        index=pd.Index(np.asarray(classes)[linhas], name='classe_socioeconomica'),
+                        columns=pd.Index(np.asarray(ESTRATOS)[colunas], name='estrato_social'))
+
+
+def momentos_mobilidade(populacao, tamanho_bloco=TAMANHO_BLOCO):
+    """`Momentos` de CARACTERISTICAS e da mobilidade por classe × estrato, lendo a população em blocos.
+
+    Os mesmos que `historico.RegistroMomentos` acumula no último dia da simulação.
+    """
+    nomes = CARACTERISTICAS + ['mobilidade']
+    grupos = populacao['classe_socioeconomica'].astype(np.intp) * len(ESTRATOS) + populacao['estrato_social']
+    return Momentos.de_colunas(populacao, nomes, grupos, len(CATEGORIAS['classe_socioeconomica']) * len(ESTRATOS),
+                               tamanho_bloco)
+
+
+def mobilidade_por_classe(populacao, momentos=None):
+    """Média, desvio, mínimo e máximo da mobilidade por classe (a partir de `momentos_mobilidade`)."""
+    import pandas as pd
+
+    momentos = momentos_mobilidade(populacao) if momentos is None else momentos
+    classes = CATEGORIAS['classe_socioeconomica']
+    resumo = momentos.agrupar(np.arange(momentos.n_grupos) // len(ESTRATOS), len(classes)).resumo('mobilidade')
+    presentes = resumo.pop('count') > 0
+    return pd.DataFrame({estatistica: valores[presentes] for estatistica, valores in resumo.items()},
+                        index=pd.Index(np.asarray(classes)[presentes], name='classe_socioeconomica'))
+
+
+def correlacoes_mobilidade(populacao, momentos=None):
+    """Correlação de cada característica com a mobilidade, em ordem crescente (sem a própria mobilidade)."""
+    import pandas as pd
+
+    momentos = momentos_mobilidade(populacao) if momentos is None else momentos
+    correlacao = momentos.total().correlacao()[0]
+    correlacoes = pd.Series(correlacao[:, -1], index=momentos.nomes, name='mobilidade').sort_values()
+    return correlacoes.drop('mobilidade')
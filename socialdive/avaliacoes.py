@@ -0,0 +1,101 @@
+"""Avaliações entre vizinhos da rede social, aplicadas a cada dia da simulação.
+
+É o mecanismo central de 'Nosedive': cada pessoa avalia (1 a 5 estrelas)
+outras com quem está conectada, e a pontuação de quem é avaliado se move em
+direção à média das notas recebidas, ponderada pela pontuação de quem avaliou.
+
+A cada dia são sorteados `n_interacoes` eventos de avaliação sobre as posições
+da matriz de adjacência CSR (linha = avaliado, coluna = avaliador; a matriz é
+simétrica). As posições sorteadas, com suas multiplicidades, formam a CSR de
+eventos do dia — uma submatriz da adjacência, montada em O(n + eventos) sem
+percorrer as posições não sorteadas — e os totais recebidos saem de dois
+produtos matriz-vetor esparsos com o vetor de pontuações (o peso de cada
+avaliador):
+
+    peso_j  = Σ_i eventos_ji · s_i
+    notas_j = Σ_i eventos_ji · nota(s_i, s_j) · s_i
+
+A nota segue a mesma homofilia de `prob_conexao`: 1 + 4 · prob_conexao(s_i, s_j).
+"""
+import numpy as np
+import scipy.sparse as sp
+
+from socialdive import instrumentacao
+from socialdive.rede import prob_conexao
+
+
+class MotorAvaliacoes:
+    """Aplica `n_interacoes` avaliações por dia sobre a rede `adjacencia`.
+
+    `peso` é a fração do caminho até a média ponderada das notas recebidas
+    que a pontuação percorre no dia (0 desliga o efeito). `rng` segue a API
+    de `np.random.RandomState`; use um gerador próprio para não alterar a
+    sequência do ruído diário de `evoluir`.
+    """
+
+    def __init__(self, adjacencia, n_interacoes, peso=0.05, homofilia=0.7, rng=None):
+        if not 0 <= peso <= 1:
+            raise ValueError(f"peso deve estar entre 0 e 1, recebido {peso}.")
+        self.n_interacoes = n_interacoes
+        self.peso = peso
+        self.homofilia = homofilia
+        self.rng = np.random if rng is None else rng
+        self.eventos_aplicados = 0
+        self.atualizar_rede(adjacencia)
+
+    def atualizar_rede(self, adjacencia):
+        """Passa a sortear as avaliações sobre outra rede (ex.: depois de uma religação)."""
+        adjacencia = sp.csr_matrix(adjacencia)
+        self._forma = adjacencia.shape
+        indptr, indices = adjacencia.indptr, adjacencia.indices
+        self._nnz = adjacencia.nnz
+        # Avaliador (coluna) e avaliado (linha) de cada posição da CSR
+        self._avaliadores = indices
+        self._avaliados = np.repeat(np.arange(self._forma[0], dtype=indices.dtype), np.diff(indptr))
+
+    def _sortear(self):
+        """Posições sorteadas da CSR, em ordem crescente (logo, por linha), e quantas vezes cada uma."""
+        posicoes = self.rng.randint(0, self._nnz, self.n_interacoes)
+        if 4 * self.n_interacoes < self._nnz:
+            # Poucos eventos para a rede: ordenar os eventos sai mais barato que varrer todas as posições
+            return np.unique(posicoes, return_counts=True)
+        contagem = np.bincount(posicoes, minlength=self._nnz)
+        tocadas = np.flatnonzero(contagem)
+        return tocadas, contagem[tocadas]
+
+    def aplicar(self, atual):
+        """Sorteia e aplica as avaliações do dia, atualizando `atual` no lugar."""
+        if self._nnz == 0 or self.n_interacoes == 0:
+            return atual
+        tocadas, contagem = self._sortear()
+        self.eventos_aplicados += self.n_interacoes
+        instrumentacao.contar('avaliacoes_eventos', self.n_interacoes)
+
+        # CSR dos eventos do dia: mesmas colunas da adjacência, só nas posições sorteadas
+        avaliadores = self._avaliadores[tocadas]
+        avaliados = self._avaliados[tocadas]
+        indptr = np.zeros(self._forma[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(avaliados, minlength=self._forma[0]), out=indptr[1:])
+        nota = prob_conexao(atual[avaliadores], atual[avaliados], self.homofilia)
+        eventos = sp.csr_matrix((contagem.astype(np.float64), avaliadores, indptr), shape=self._forma)
+        notas = sp.csr_matrix((contagem * (1 + 4 * nota), avaliadores, indptr), shape=self._forma)
+
+        # Avaliadores com pontuação mais alta pesam mais
+        peso_total = eventos @ atual
+        soma_notas = notas @ atual
+        recebidos = np.flatnonzero(peso_total)
+        media = soma_notas[recebidos] / peso_total[recebidos]
+        atual[recebidos] += self.peso * (media - atual[recebidos])
+        return atual
+
+    # Estado para checkpoints (ver `socialdive.checkpoint`)
+    def estado(self):
+        from socialdive.checkpoint import estado_rng
+
+        return dict(estado_rng(self.rng), eventos_aplicados=np.int64(self.eventos_aplicados))
+
+    def restaurar(self, estado):
+        from socialdive.checkpoint import restaurar_rng
+
+        restaurar_rng(self.rng, estado)
+        self.eventos_aplicados = int(estado['eventos_aplicados'])
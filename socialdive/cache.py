@@ -0,0 +1,146 @@
+"""Cache de resultados de estágios, endereçado pelo conteúdo das entradas.
+
+A chave de um estágio é o hash das suas entradas (parâmetros, semente,
+chaves dos estágios anteriores) e do código-fonte dos módulos de que ele
+depende. Mudar qualquer um deles gera outra chave, então só os estágios
+invalidados — e os que dependem deles — são recalculados.
+
+Cada resultado é um diretório com um `.npy` por array e um `meta.json` com
+os valores simples. Entradas são gravadas num diretório temporário e
+renomeadas ao final, e as menos usadas recentemente são removidas quando o
+total passa de `limite_bytes`.
+"""
+import functools
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+_META = 'meta.json'
+
+
+@functools.lru_cache(maxsize=None)
+def versao_codigo(*modulos):
+    """Hash do código-fonte dos módulos (ex.: 'socialdive.simulacao')."""
+    h = hashlib.sha256()
+    for modulo in modulos:
+        with open(importlib.util.find_spec(modulo).origin, 'rb') as arquivo:
+            h.update(modulo.encode() + b'\0' + arquivo.read())
+    return h.hexdigest()
+
+
+def _serializar(valor):
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    if isinstance(valor, np.generic):
+        return valor.item()
+    raise TypeError(f"Entrada não serializável para a chave do cache: {type(valor).__name__}")
+
+
+def chave(estagio, entradas, modulos=()):
+    """Chave hexadecimal do estágio para estas entradas e versão do código."""
+    conteudo = json.dumps({'estagio': estagio, 'entradas': entradas, 'codigo': versao_codigo(*modulos)},
+                          sort_keys=True, default=_serializar)
+    return f"{estagio}-{hashlib.sha256(conteudo.encode()).hexdigest()[:32]}"
+
+
+def _tamanho(caminho):
+    return sum(entrada.stat().st_size for entrada in os.scandir(caminho) if entrada.is_file())
+
+
+class CacheEstagios:
+    """Resultados de estágios em disco, com despejo LRU por tamanho total.
+
+    Um resultado é um dict de nomes para arrays NumPy (gravados em `.npy`) ou
+    valores serializáveis em JSON.
+    """
+
+    def __init__(self, diretorio, limite_bytes=1 << 30):
+        self.diretorio = diretorio
+        self.limite_bytes = limite_bytes
+        os.makedirs(diretorio, exist_ok=True)
+
+    def _caminho(self, chave_estagio):
+        return os.path.join(self.diretorio, chave_estagio)
+
+    def __contains__(self, chave_estagio):
+        return os.path.isfile(os.path.join(self._caminho(chave_estagio), _META))
+
+    def obter(self, chave_estagio):
+        """Resultado guardado para a chave, ou None; marca a entrada como usada agora."""
+        caminho = self._caminho(chave_estagio)
+        try:
+            with open(os.path.join(caminho, _META), encoding='utf-8') as arquivo:
+                meta = json.load(arquivo)
+            resultado = {nome: np.load(os.path.join(caminho, nome + '.npy')) for nome in meta['arrays']}
+        except (FileNotFoundError, ValueError):
+            # Entrada ausente, ou removida/corrompida por outro processo: trata como falta
+            return None
+        resultado.update(meta['valores'])
+        os.utime(caminho)
+        return resultado
+
+    def guardar(self, chave_estagio, resultado):
+        destino = self._caminho(chave_estagio)
+        temporario = tempfile.mkdtemp(prefix='.tmp-', dir=self.diretorio)
+        try:
+            arrays = {nome: valor for nome, valor in resultado.items() if isinstance(valor, np.ndarray)}
+            valores = {nome: valor for nome, valor in resultado.items() if nome not in arrays}
+            for nome, valor in arrays.items():
+                np.save(os.path.join(temporario, nome + '.npy'), valor)
+            # meta.json por último: uma entrada sem ele está incompleta
+            with open(os.path.join(temporario, _META), 'w', encoding='utf-8') as arquivo:
+                json.dump({'arrays': list(arrays), 'valores': valores}, arquivo, default=_serializar)
+            if os.path.exists(destino):
+                shutil.rmtree(destino)
+            os.replace(temporario, destino)
+        except BaseException:
+            shutil.rmtree(temporario, ignore_errors=True)
+            raise
+        self._despejar(manter=chave_estagio)
+
+    def entradas(self):
+        """Lista de (chave, bytes, último uso), da menos para a mais recentemente usada."""
+        lista = [(entrada.name, _tamanho(entrada.path), entrada.stat().st_mtime)
+                 for entrada in os.scandir(self.diretorio)
+                 if entrada.is_dir() and not entrada.name.startswith('.tmp-')]
+        return sorted(lista, key=lambda item: item[2])
+
+    @property
+    def tamanho_bytes(self):
+        return sum(tamanho for _, tamanho, _ in self.entradas())
+
+    def _despejar(self, manter=None):
+        entradas = self.entradas()
+        total = sum(tamanho for _, tamanho, _ in entradas)
+        for nome, tamanho, _ in entradas:
+            if total <= self.limite_bytes:
+                break
+            if nome != manter:
+                shutil.rmtree(self._caminho(nome), ignore_errors=True)
+                total -= tamanho
+
+    def executar(self, estagio, entradas, calcular, modulos=()):
+        """Resultado do estágio a partir do cache, ou de `calcular()` (que é então guardado).
+
+        Retorna (resultado, chave, reaproveitado); a chave entra nas entradas
+        dos estágios seguintes.
+        """
+        chave_estagio = chave(estagio, entradas, modulos)
+        resultado = self.obter(chave_estagio)
+        if resultado is not None:
+            return resultado, chave_estagio, True
+        resultado = calcular()
+        self.guardar(chave_estagio, resultado)
+        return resultado, chave_estagio, False
+
+
+class SemCache:
+    """Mesma interface de `CacheEstagios`, sempre recalculando (cache desativado)."""
+
+    def executar(self, estagio, entradas, calcular, modulos=()):
+        return calcular(), chave(estagio, entradas, modulos), False
@@ -0,0 +1,89 @@
+"""Checkpoints periódicos do laço diário, para retomar simulações longas.
+
+Um checkpoint guarda tudo o que o laço de `evoluir` carrega de um dia para
+o outro: a pontuação corrente, o índice do dia, o estado do gerador
+aleatório e os agregados de cada registrador. Retomar a partir dele produz
+exatamente o mesmo resultado de uma execução sem interrupção.
+
+O arquivo `.npz` é gravado ao lado do destino e renomeado por cima dele
+(`os.replace`), então uma queda durante a gravação deixa o checkpoint
+anterior intacto.
+"""
+import os
+import time
+
+import numpy as np
+
+
+def estado_rng(rng):
+    """Estado de um gerador com a API de `np.random.RandomState` (ou do gerador global) em arrays."""
+    _, chaves, posicao, tem_gauss, gauss = rng.get_state()
+    return {'rng_chaves': chaves, 'rng_posicao': int(posicao), 'rng_tem_gauss': int(tem_gauss),
+            'rng_gauss': float(gauss)}
+
+
+def restaurar_rng(rng, estado):
+    rng.set_state(('MT19937', np.asarray(estado['rng_chaves'], dtype=np.uint32), int(estado['rng_posicao']),
+                   int(estado['rng_tem_gauss']), float(estado['rng_gauss'])))
+
+
+class Checkpoint:
+    """Grava o estado da simulação em `caminho` a cada `intervalo_dias` dias.
+
+    `intervalo_segundos`, se dado, também força uma gravação quando esse
+    tempo passou desde a última. `assinatura` identifica a configuração
+    (ex.: a chave do estágio no cache); `carregar` recusa um checkpoint de
+    outra configuração.
+    """
+
+    def __init__(self, caminho, intervalo_dias=30, intervalo_segundos=None, assinatura=''):
+        self.caminho = caminho
+        self.intervalo_dias = intervalo_dias
+        self.intervalo_segundos = intervalo_segundos
+        self.assinatura = assinatura
+        self._ultima_gravacao = time.monotonic()
+
+    def deve_salvar(self, dia, n_dias):
+        if dia == n_dias - 1 or (self.intervalo_dias and dia % self.intervalo_dias == 0):
+            return True
+        return (self.intervalo_segundos is not None
+                and time.monotonic() - self._ultima_gravacao >= self.intervalo_segundos)
+
+    def salvar(self, dia, atual, rng, registradores=()):
+        dados = {'dia': dia, 'assinatura': self.assinatura, 'atual': atual}
+        dados.update(estado_rng(rng))
+        for i, registrador in enumerate(registradores):
+            for nome, valores in registrador.estado().items():
+                dados[f'registrador{i}.{nome}'] = valores
+
+        temporario = f'{self.caminho}.tmp'
+        with open(temporario, 'wb') as arquivo:
+            np.savez(arquivo, **dados)
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+        os.replace(temporario, self.caminho)
+        self._ultima_gravacao = time.monotonic()
+
+    def carregar(self):
+        """Estado do último checkpoint, ou None se não houver arquivo.
+
+        Retorna um dict com 'dia', 'atual', o estado do gerador e
+        'registradores' (lista de dicts de arrays, na ordem em que foram salvos).
+        """
+        if not os.path.exists(self.caminho):
+            return None
+        with np.load(self.caminho) as arquivo:
+            dados = {nome: arquivo[nome] for nome in arquivo.files}
+        assinatura = str(dados.pop('assinatura'))
+        if assinatura != self.assinatura:
+            raise ValueError(f"Checkpoint {self.caminho!r} é de outra configuração "
+                             f"(assinatura {assinatura!r}, esperada {self.assinatura!r}).")
+
+        registradores = {}
+        for nome in list(dados):
+            if nome.startswith('registrador'):
+                indice, atributo = nome[len('registrador'):].split('.', 1)
+                registradores.setdefault(int(indice), {})[atributo] = dados.pop(nome)
+        dados['dia'] = int(dados['dia'])
+        dados['registradores'] = [registradores.get(i, {}) for i in range(max(registradores, default=-1) + 1)]
+        return dados
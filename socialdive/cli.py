@@ -0,0 +1,694 @@
+"""Ponto de entrada de linha de comando: executa a análise completa estágio por estágio.
+
+Uso: python -m socialdive [--pessoas N] [--dias N] [--semente N] [--limiares L L L L] [--saida DIR]
+                          [--graficos NOME ...] [--sem-graficos] [--processos-graficos N]
+                          [--cache DIR [--cache-limite-mb MB]]
+                          [--checkpoint ARQUIVO [--checkpoint-intervalo DIAS] [--retomar]] [--trajetoria ARQUIVO]
+                          [--quantis Q ...]
+                          [--fragmentos N] [--instrumentar ARQUIVO [--memoria M] [--perfil P]]
+                          [--exportar DIR [--formato-exportacao parquet|arrow]]
+                          [--reddit SUB ... | --reddit-replay ARQUIVO] [--reddit-limite N] [--reddit-gravar ARQUIVO]
+                          [--corpus ARQUIVO [--processos-corpus N]] [--motor-texto M]
+       python -m socialdive --replicas R [--lote-replicas N]
+"""
+import argparse
+import os
+import time
+from collections import Counter
+
+import numpy as np
+
+from socialdive import instrumentacao, relatorio
+from socialdive.instrumentacao import estagio
+from socialdive.simulacao import PARAMETROS_PADRAO, evoluir
+
+# Parâmetros da simulação
+N_PESSOAS = 1000
+N_INTERACOES = 5000
+N_DIAS = 365
+
+
+def _argumentos(argv):
+    parser = argparse.ArgumentParser(prog='socialdive', description=__doc__.splitlines()[0])
+    parser.add_argument('--pessoas', type=int, default=N_PESSOAS, help="tamanho da população")
+    parser.add_argument('--dias', type=int, default=N_DIAS, help="horizonte da simulação em dias")
+    parser.add_argument('--semente', type=int, default=42, help="semente do gerador aleatório")
+    parser.add_argument('--nucleo', default='numpy', help="núcleo da atualização diária: numpy, numba ou auto")
+    parser.add_argument('--avaliacoes', action='store_true',
+                        help="ativa as avaliações diárias entre vizinhos da rede social (mecânica de Nosedive)")
+    parser.add_argument('--interacoes', type=int, default=N_INTERACOES, metavar='N',
+                        help="eventos de avaliação por dia, com --avaliacoes")
+    parser.add_argument('--peso-avaliacoes', type=float, default=0.05, metavar='P',
+                        help="quanto a média das notas recebidas puxa a pontuação a cada dia (0 a 1)")
+    parser.add_argument('--coevolucao', type=int, default=0, metavar='K',
+                        help="religa a rede a cada K dias durante a simulação, pela homofilia (0 desliga)")
+    parser.add_argument('--limiar-religacao', type=float, default=0.25, metavar='L',
+                        help="variação de pontuação a partir da qual as conexões de uma pessoa são reavaliadas")
+    parser.add_argument('--fragmentos', type=int, default=0, metavar='N',
+                        help="divide a população em N fragmentos simulados em processos com memória compartilhada")
+    parser.add_argument('--replicas', type=int, default=0, metavar='R',
+                        help="simula R réplicas em lote e reporta intervalos de confiança em vez de uma única execução")
+    parser.add_argument('--lote-replicas', type=int, default=None, metavar='N',
+                        help="réplicas simuladas juntas por lote (padrão: conforme a memória)")
+    parser.add_argument('--comunidades', default='auto',
+                        help="detecção de comunidades: auto, leiden, louvain ou propagacao")
+    parser.add_argument('--limiares', type=float, nargs=4, default=None, metavar='L',
+                        help="limites inferiores dos estratos, do Marginalizado à Elite Digital (padrão: 2 3 4 4.5)")
+    parser.add_argument('--saida', default='.', help="diretório onde os gráficos são gravados")
+    parser.add_argument('--cache', default=None, metavar='DIR',
+                        help="diretório do cache de estágios (simulação, arestas, comunidades); desativado por padrão")
+    parser.add_argument('--cache-limite-mb', type=int, default=1024, metavar='MB',
+                        help="tamanho máximo do cache; as entradas menos usadas são removidas")
+    parser.add_argument('--checkpoint', default=None, metavar='ARQUIVO',
+                        help="grava o estado da simulação periodicamente neste arquivo .npz")
+    parser.add_argument('--checkpoint-intervalo', type=int, default=30, metavar='DIAS',
+                        help="dias simulados entre checkpoints")
+    parser.add_argument('--retomar', '--resume', action='store_true',
+                        help="continua a simulação a partir do checkpoint, se existir")
+    parser.add_argument('--quantis', type=float, nargs='+', default=None, metavar='Q',
+                        help="registra estes quantis diários da pontuação por classe (ex.: 0.1 0.5 0.9)")
+    parser.add_argument('--trajetoria', default=None, metavar='ARQUIVO',
+                        help="grava a pontuação diária de cada pessoa em ARQUIVO (.npy float32, dias × pessoas)")
+    parser.add_argument('--exportar', default=None, metavar='DIR',
+                        help="grava população, agregados diários e arestas em DIR (Parquet ou Arrow)")
+    parser.add_argument('--formato-exportacao', choices=['parquet', 'arrow'], default='parquet',
+                        help="formato dos arquivos de --exportar")
+    parser.add_argument('--reddit', nargs='+', default=None, metavar='SUB',
+                        help="conta conceitos e impactos também nos posts e comentários destes subreddits (requer praw)")
+    parser.add_argument('--reddit-replay', default=None, metavar='ARQUIVO',
+                        help="usa as páginas gravadas em ARQUIVO (JSONL) em vez da API do Reddit")
+    parser.add_argument('--reddit-limite', type=int, default=1000, metavar='N',
+                        help="submissões coletadas por subreddit")
+    parser.add_argument('--reddit-gravar', default=None, metavar='ARQUIVO',
+                        help="grava as páginas brutas coletadas em ARQUIVO (JSONL), para replay")
+    parser.add_argument('--reddit-threads', type=int, default=8, metavar='N',
+                        help="requisições simultâneas à API do Reddit")
+    parser.add_argument('--corpus', default=None, metavar='ARQUIVO',
+                        help="marca conceitos e impactos num corpus (texto, um documento por linha, ou JSONL)")
+    parser.add_argument('--processos-corpus', type=int, default=None, metavar='N',
+                        help="processos para marcar o corpus (padrão: um por CPU)")
+    parser.add_argument('--motor-texto', choices=['auto', 'regex', 'ahocorasick'], default='auto',
+                        help="autômato da marcação das citações e do corpus: regex (trie) ou Aho-Corasick "
+                             "(requer pyahocorasick)")
+    parser.add_argument('--instrumentar', default=None, metavar='ARQUIVO',
+                        help="grava tempo, memória e contadores de cada estágio num relatório JSON")
+    parser.add_argument('--memoria', choices=['rss', 'tracemalloc'], default='rss',
+                        help="com --instrumentar: RSS do processo (barato) ou pico de alocações por estágio")
+    parser.add_argument('--perfil', choices=['cprofile', 'pyinstrument'], default=None,
+                        help="com --instrumentar: também perfila a execução (pyinstrument, se instalado)")
+    parser.add_argument('--graficos', nargs='+', default=None, metavar='NOME',
+                        help="gráficos a gerar (padrão: todos): " + ', '.join(relatorio.GRAFICOS))
+    parser.add_argument('--sem-graficos', action='store_true', help="não gerar nenhum gráfico")
+    parser.add_argument('--processos-graficos', type=int, default=None, metavar='N',
+                        help="processos para desenhar os gráficos (0 desenha no processo principal)")
+    args = parser.parse_args(argv)
+    if args.sem_graficos:
+        args.graficos = []
+    if args.retomar and not args.checkpoint:
+        parser.error("--retomar exige --checkpoint")
+    if args.quantis and not all(0 <= q <= 1 for q in args.quantis):
+        parser.error("--quantis devem estar entre 0 e 1")
+    if args.fragmentos and (args.avaliacoes or args.coevolucao or args.checkpoint or args.trajetoria
+                            or args.quantis):
+        parser.error("--fragmentos não se combina com --avaliacoes, --coevolucao, --checkpoint, --trajetoria "
+                     "nem --quantis")
+    if args.replicas:
+        # O modo conjunto só roda `simular_replicas` (núcleo NumPy, sem rede, cache, textos nem gráficos)
+        ignoradas = {'--avaliacoes': args.avaliacoes, '--coevolucao': args.coevolucao,
+                     '--fragmentos': args.fragmentos, '--checkpoint': args.checkpoint,
+                     '--trajetoria': args.trajetoria, '--quantis': args.quantis, '--exportar': args.exportar,
+                     '--nucleo': args.nucleo != 'numpy', '--comunidades': args.comunidades != 'auto',
+                     '--cache': args.cache, '--reddit': args.reddit, '--reddit-replay': args.reddit_replay,
+                     '--corpus': args.corpus, '--graficos': args.graficos}
+        conflitos = [opcao for opcao, usada in ignoradas.items() if usada]
+        if conflitos:
+            parser.error(f"--replicas não se combina com {', '.join(conflitos)}")
+    desconhecidos = set(args.graficos or ()) - set(relatorio.GRAFICOS)
+    if desconhecidos:
+        parser.error(f"gráficos desconhecidos: {', '.join(sorted(desconhecidos))}")
+    return args
+
+
+def _configurar_locale():
+    # Tentar configurar o locale
+    import locale
+    try:
+        locale.setlocale(locale.LC_ALL, 'pt_BR.UTF-8')
+    except locale.Error:
+        try:
+            locale.setlocale(locale.LC_ALL, 'Portuguese_Brazil.1252')
+        except locale.Error:
+            print("Aviso: Não foi possível configurar o locale para pt_BR. Usando locale padrão.")
+
+
+def estagio_literatura(args, graficos):
+    from socialdive.indice import MarcadorConceitos, indexar_citacoes
+    from socialdive.literatura import ARTIGOS, contar_conceitos, contar_impactos
+
+    print("\n📚 ANÁLISE DE ARTIGOS SOBRE IMPACTO SOCIAL DAS REDES SOCIAIS")
+    print("=" * 70)
+
+    # Exibir informações sobre os artigos
+    print("\nArtigos analisados:")
+    for i, artigo in enumerate(ARTIGOS, 1):
+        print(f"{i}. {artigo['titulo']} ({artigo['fonte']})")
+
+    conceito_counts = contar_conceitos()
+
+    print("\n\nANÁLISE 1: CONCEITOS-CHAVE NO IMPACTO SOCIAL DAS REDES SOCIAIS")
+    print("=" * 70)
+    print("Principais conceitos identificados na literatura:")
+
+    for conceito, count in conceito_counts.most_common(10):
+        print(f" - {conceito}: mencionado em {count} artigos")
+
+    # Os mesmos rótulos procurados no texto das citações (com acentos, caixa e sinônimos normalizados)
+    citacoes = indexar_citacoes(ARTIGOS, MarcadorConceitos(motor=args.motor_texto)).frequencias()
+
+    def imprimir_citacoes(rotulos, n):
+        encontrados = Counter({rotulo: count for rotulo, count in citacoes.items() if rotulo in rotulos})
+        for rotulo, count in encontrados.most_common(n):
+            print(f" - {rotulo}: nas citações de {count} artigos")
+        if not encontrados:
+            print(" - (nenhum)")
+
+    print("\nConceitos encontrados no texto das citações:")
+    imprimir_citacoes(conceito_counts, 10)
+
+    impactos_positivos_counts, impactos_negativos_counts = contar_impactos()
+
+    print("\n\nANÁLISE 2: IMPACTOS POSITIVOS E NEGATIVOS DAS REDES SOCIAIS")
+    print("=" * 70)
+
+    print("\nImpactos Positivos mais citados:")
+    for impacto, count in impactos_positivos_counts.most_common(5):
+        print(f" - {impacto}: mencionado {count} vezes")
+
+    print("\nImpactos Negativos mais citados:")
+    for impacto, count in impactos_negativos_counts.most_common(5):
+        print(f" - {impacto}: mencionado {count} vezes")
+
+    print("\nImpactos encontrados no texto das citações:")
+    imprimir_citacoes(impactos_positivos_counts | impactos_negativos_counts, 10)
+
+    graficos.enviar('impactos', impactos_positivos=impactos_positivos_counts.most_common(5),
+                    impactos_negativos=impactos_negativos_counts.most_common(5))
+    if graficos.quer('impactos'):
+        print("\nGráfico de impactos positivos vs. negativos gerado com sucesso!")
+
+
+def estagio_reddit(args):
+    from socialdive.ingestao import (ClienteGravado, ClienteReddit, ContagemIncremental, LimiteTaxa, coletar,
+                                     gravar_paginas, itens)
+
+    print("\n\nANÁLISES 1 e 2 NO REDDIT: CONCEITOS E IMPACTOS EM POSTS E COMENTÁRIOS")
+    print("=" * 70)
+
+    cliente = ClienteGravado(args.reddit_replay) if args.reddit_replay else ClienteReddit()
+    subreddits = args.reddit or cliente.subreddits
+    try:
+        # A gravação é lida sem limite de taxa
+        limite_taxa = LimiteTaxa(None) if args.reddit_replay else LimiteTaxa()
+        paginas = coletar(cliente, subreddits, args.reddit_limite, max_workers=args.reddit_threads,
+                          limite_taxa=limite_taxa)
+        if args.reddit_gravar:
+            paginas = gravar_paginas(paginas, args.reddit_gravar)
+        inicio = time.perf_counter()
+        contagem = ContagemIncremental().consumir(itens(paginas))
+        duracao = time.perf_counter() - inicio
+    finally:
+        if args.reddit_replay:
+            cliente.fechar()
+
+    print(f"{contagem.n_itens} submissões e comentários de r/{', r/'.join(subreddits)} "
+          f"em {duracao:.1f}s ({contagem.n_itens / max(duracao, 1e-9):,.0f} itens/s).")
+    print("\nConceitos-chave mais mencionados:")
+    for conceito, count in contagem.conceitos.most_common(10):
+        print(f" - {conceito}: mencionado em {count} itens")
+    for titulo, contador in (("Impactos Positivos", contagem.impactos_positivos),
+                             ("Impactos Negativos", contagem.impactos_negativos)):
+        print(f"\n{titulo} mais mencionados:")
+        for impacto, count in contador.most_common(5):
+            print(f" - {impacto}: mencionado {count} vezes")
+    if args.reddit_gravar:
+        print(f"\nPáginas brutas gravadas em {args.reddit_gravar}")
+
+
+def estagio_corpus(args):
+    from socialdive.indice import MarcadorConceitos, indexar, ler_textos
+
+    print("\n\nCONCEITOS E IMPACTOS NO CORPUS: ÍNDICE INVERTIDO E COOCORRÊNCIAS")
+    print("=" * 70)
+
+    marcador = MarcadorConceitos(motor=args.motor_texto)
+    inicio = time.perf_counter()
+    indice = indexar(ler_textos(args.corpus), marcador, args.processos_corpus)
+    duracao = time.perf_counter() - inicio
+    print(f"{indice.n_documentos} documentos de {args.corpus} marcados em {duracao:.1f}s "
+          f"({indice.n_documentos / max(duracao, 1e-9):,.0f} documentos/s, motor {marcador.motor}).")
+
+    print("\nConceitos e impactos mais mencionados:")
+    for rotulo, count in indice.frequencias().most_common(10):
+        print(f" - {rotulo}: mencionado em {count} documentos")
+    print("\nPares mencionados juntos com mais frequência:")
+    for (a, b), count in indice.pares_frequentes(5):
+        print(f" - {a} + {b}: {count} documentos")
+
+
+# Módulos cujo código entra na chave do cache de cada estágio
+_MODULOS_SIMULACAO = ('socialdive.cli', 'socialdive.populacao', 'socialdive.simulacao', 'socialdive.nucleos',
+                      'socialdive.historico', 'socialdive.estratos', 'socialdive.estatisticas', 'socialdive.analise')
+_MODULOS_ARESTAS = ('socialdive.rede',)
+_MODULOS_AVALIACOES = ('socialdive.avaliacoes', 'socialdive.grafo', 'socialdive.rede')
+_MODULOS_COEVOLUCAO = ('socialdive.coevolucao', 'socialdive.comunidades', 'socialdive.rede')
+_MODULOS_FRAGMENTOS = ('socialdive.fragmentos',)
+_MODULOS_COMUNIDADES = ('socialdive.comunidades', 'socialdive.grafo')
+
+
+def _rede_dinamica(args, populacao, limiares):
+    """Motor de avaliações e/ou rede co-evolutiva sobre uma rede formada pelas pontuações iniciais.
+
+    Rede, eventos e religações usam geradores próprios, derivados da semente,
+    para não alterar o ruído diário.
+    """
+    from socialdive.avaliacoes import MotorAvaliacoes
+    from socialdive.coevolucao import RedeCoevolutiva
+    from socialdive.grafo import GrafoEsparso
+    from socialdive.rede import gerar_arestas, n_conexoes_padrao
+
+    rng_rede, rng_eventos, rng_religacao = (np.random.RandomState(np.random.MT19937(sequencia))
+                                            for sequencia in np.random.SeedSequence(args.semente).spawn(3))
+    n_pessoas = len(populacao)
+    origem, destino = gerar_arestas(populacao['pontuacao_inicial'], n_conexoes_padrao(n_pessoas), rng=rng_rede)
+    avaliacoes = rede = None
+    if args.avaliacoes:
+        grafo = GrafoEsparso.de_arestas(origem, destino, n_pessoas)
+        print(f"Avaliações entre vizinhos: {args.interacoes} por dia numa rede de {grafo.n_arestas} conexões.")
+        avaliacoes = MotorAvaliacoes(grafo.adjacencia, args.interacoes, peso=args.peso_avaliacoes, rng=rng_eventos)
+    if args.coevolucao:
+        print(f"Rede co-evolutiva: religada a cada {args.coevolucao} dias "
+              f"(limiar de movimento {args.limiar_religacao}).")
+        rede = RedeCoevolutiva(origem, destino, n_pessoas, intervalo=args.coevolucao, limiar=args.limiar_religacao,
+                               limiares_estrato=limiares, rng=rng_religacao, avaliacoes=avaliacoes)
+    return avaliacoes, rede
+
+
+def estagio_simulacao(args, cache):
+    from socialdive.analise import CARACTERISTICAS
+    from socialdive.cache import SemCache, chave
+    from socialdive.checkpoint import Checkpoint, estado_rng, restaurar_rng
+    from socialdive.estatisticas import Momentos
+    from socialdive.estratos import LIMIARES_ESTRATO
+    from socialdive.historico import RegistroAgregados, RegistroEstratos, RegistroMomentos, RegistroTrajetoria
+    from socialdive.populacao import CATEGORIAS, Populacao, criar_populacao
+
+    # SIMULAÇÃO DE CENÁRIO SOCIALDIVE
+    print("\n\n🔮 SIMULAÇÃO DE CENÁRIO FUTURO: SOCIEDADE BASEADA EM PONTUAÇÃO SOCIAL")
+    print("=" * 70)
+    print("Inspirado no episódio 'Nosedive' de Black Mirror e nos artigos analisados")
+
+    classes = CATEGORIAS['classe_socioeconomica']
+    limiares = LIMIARES_ESTRATO if args.limiares is None else args.limiares
+    parametros = dict(PARAMETROS_PADRAO)
+    # O núcleo não entra na chave: numpy e numba produzem o mesmo resultado bit a bit
+    entradas = {'semente': args.semente, 'pessoas': args.pessoas, 'dias': args.dias,
+                'parametros': parametros, 'limiares': list(limiares)}
+    modulos = _MODULOS_SIMULACAO
+    if args.avaliacoes:
+        entradas['avaliacoes'] = {'interacoes': args.interacoes, 'peso': args.peso_avaliacoes}
+        modulos += _MODULOS_AVALIACOES
+    if args.coevolucao:
+        entradas['coevolucao'] = {'intervalo': args.coevolucao, 'limiar': args.limiar_religacao}
+        modulos += _MODULOS_COEVOLUCAO
+    if args.quantis:
+        entradas['quantis'] = args.quantis
+    if args.fragmentos:
+        # Cada fragmento tem seu fluxo aleatório: o resultado depende do número de fragmentos
+        entradas['fragmentos'] = args.fragmentos
+        modulos += _MODULOS_FRAGMENTOS
+    chave_simulacao = chave('simulacao', entradas, modulos)
+
+    def calcular_fragmentado():
+        from socialdive.fragmentos import evoluir_fragmentado
+
+        np.random.seed(args.semente)
+        fragmentado = evoluir_fragmentado(args.pessoas, parametros, args.dias, args.fragmentos, args.semente,
+                                          limiares, nucleo=args.nucleo)
+        resultado = {'populacao.' + nome: valores for nome, valores in fragmentado['populacao'].colunas.items()}
+        resultado.update(pontuacao_final=fragmentado['pontuacao_final'],
+                         medias_classes=fragmentado['medias_classes'],
+                         contingencia_estratos=fragmentado['contingencia_estratos'],
+                         **estado_rng(np.random))
+        return resultado
+
+    def calcular():
+        # Criar população inicial com características diversas
+        np.random.seed(args.semente)  # Para reprodutibilidade
+        with estagio('populacao'):
+            populacao = criar_populacao(args.pessoas)
+
+        # Agregados diários por classe socioeconômica e por estrato, registrados durante a simulação
+        # (o histórico completo n_pessoas × n_dias não é guardado em memória)
+        registro_classes = RegistroAgregados(populacao['classe_socioeconomica'], len(classes), args.dias,
+                                             quantis=args.quantis or (), nomes=classes)
+        registro_estratos = RegistroEstratos(args.dias, limiares, grupos=populacao['classe_socioeconomica'],
+                                             n_grupos=len(classes))
+        # Momentos das características e da mobilidade no último dia (ANÁLISES 4 e 5), sem copiar a população
+        registro_momentos = RegistroMomentos(populacao, CARACTERISTICAS, args.dias, limiares)
+
+        # Avaliações entre vizinhos e/ou rede que co-evolui com as pontuações
+        avaliacoes = rede = None
+        if args.avaliacoes or args.coevolucao:
+            avaliacoes, rede = _rede_dinamica(args, populacao, limiares)
+        registradores = ([registro_classes, registro_estratos, registro_momentos]
+                         + ([rede] if rede is not None else []))
+
+        # Simular evolução diária (fatores estáticos são pré-calculados uma única vez),
+        # com checkpoints periódicos se pedido
+        checkpoint = None
+        retomando = False
+        if args.checkpoint:
+            # A trajetória não muda o resultado, mas muda os registradores guardados no checkpoint
+            assinatura = chave_simulacao + ('+trajetoria' if args.trajetoria else '')
+            checkpoint = Checkpoint(args.checkpoint, args.checkpoint_intervalo, assinatura=assinatura)
+            retomando = args.retomar and os.path.exists(args.checkpoint)
+            if retomando:
+                print(f"(retomando do checkpoint {args.checkpoint})")
+        if args.trajetoria:
+            # Ao retomar, os dias já simulados estão no arquivo: ele é reaberto em vez de recriado
+            modo = 'r+' if retomando and os.path.exists(args.trajetoria) else 'w+'
+            registradores.append(RegistroTrajetoria(args.trajetoria, len(populacao), args.dias, modo=modo))
+        with estagio('laco_diario'):
+            pontuacao_final = evoluir(populacao, parametros, args.dias, nucleo=args.nucleo,
+                                      registradores=registradores,
+                                      checkpoint=checkpoint, retomar=args.retomar, avaliacoes=avaliacoes)
+        resultado = {'populacao.' + nome: valores for nome, valores in populacao.colunas.items()}
+        resultado.update(pontuacao_final=pontuacao_final,
+                         medias_classes=registro_classes.media,
+                         contingencia_estratos=registro_estratos.contingencia,
+                         **estado_rng(np.random))
+        resultado.update({'momentos.' + nome: valores
+                          for nome, valores in registro_momentos.momentos().estado().items()})
+        if args.quantis:
+            resultado['quantis_classes'] = registro_classes.valores_quantis
+        if rede is not None:
+            resultado['rede.chaves'] = rede.chaves
+            resultado.update({'rede.' + nome: valores for nome, valores in rede.serie().items()})
+        return resultado
+
+    print(f"\nSimulando evolução da pontuação social ao longo de {args.dias} dias...")
+    # A trajetória é gravada durante a simulação: com --trajetoria o resultado não vem do cache
+    executor = SemCache() if args.trajetoria else cache
+    resultado, _, reaproveitado = executor.executar('simulacao', entradas,
+                                                    calcular_fragmentado if args.fragmentos else calcular, modulos)
+    if reaproveitado:
+        print(f"(resultado reaproveitado do cache: {chave_simulacao})")
+    # Os estágios seguintes continuam o gerador global do ponto em que a simulação o deixou
+    restaurar_rng(np.random, resultado)
+    if args.quantis:
+        print("\nQuantis da pontuação no último dia, por classe socioeconômica:")
+        print(f"{'classe':>10} " + ' '.join(f"{f'q{q:g}':>7}" for q in args.quantis))
+        for classe, valores in zip(classes, resultado['quantis_classes'][-1]):
+            print(f"{classe:>10} " + ' '.join(f"{valor:>7.2f}" for valor in valores))
+
+    populacao = Populacao({nome.split('.', 1)[1]: valores for nome, valores in resultado.items()
+                           if nome.startswith('populacao.')})
+    medias_classes = {nome: resultado['medias_classes'][:, i] for i, nome in enumerate(classes)}
+    rede = {nome.split('.', 1)[1]: valores for nome, valores in resultado.items() if nome.startswith('rede.')}
+    # O caminho fragmentado não registra momentos: a análise de mobilidade os calcula da população
+    momentos = {nome.split('.', 1)[1]: valores for nome, valores in resultado.items() if nome.startswith('momentos.')}
+    agregados = {'medias_classes': resultado['medias_classes'],
+                 'contingencia_estratos': resultado['contingencia_estratos'],
+                 'momentos': Momentos.de_estado(CARACTERISTICAS + ['mobilidade'], momentos) if momentos else None}
+    return populacao, resultado['pontuacao_final'], medias_classes, limiares, chave_simulacao, rede, agregados
+
+
+def estagio_estratificacao(args, populacao, medias_classes, limiares, graficos):
+    from socialdive.analise import contagem_estratos, tabela_classe_estrato
+    from socialdive.estratos import ESTRATOS
+
+    # Análise dos resultados da simulação
+    print("\n\nANÁLISE 3: ESTRATIFICAÇÃO SOCIAL NO CENÁRIO SOCIALDIVE")
+    print("=" * 70)
+
+    # Distribuição dos estratos sociais
+    estrato_counts = contagem_estratos(populacao)
+    print("\nDistribuição da população por estrato social:")
+    for codigo in np.argsort(-estrato_counts, kind='stable'):
+        count = estrato_counts[codigo]
+        if count:
+            print(f" - {ESTRATOS[codigo]}: {count} pessoas ({count/len(populacao)*100:.1f}%)")
+
+    if graficos.quer('distribuicao'):
+        graficos.enviar('distribuicao', **relatorio.dados_distribuicao(populacao['pontuacao_final'], limiares))
+
+    # Analisar relação entre classe socioeconômica inicial e estrato social final
+    cross_tab = tabela_classe_estrato(populacao)
+
+    print("\nRelação entre classe socioeconômica inicial e estrato social final (%):")
+    print(cross_tab.round(1))
+
+    graficos.enviar('classe_estrato', cross_tab=cross_tab)
+
+    # Analisar evolução da pontuação média por classe socioeconômica
+    graficos.enviar('evolucao', pontuacoes_por_classe=medias_classes)
+
+    if graficos.quer('distribuicao') or graficos.quer('classe_estrato') or graficos.quer('evolucao'):
+        print("\nGráficos de estratificação social gerados com sucesso!")
+
+
+def estagio_mobilidade(args, populacao, graficos, momentos=None):
+    from socialdive.analise import correlacoes_mobilidade, mobilidade_por_classe, momentos_mobilidade
+    from socialdive.populacao import CATEGORIAS
+
+    # Sem momentos da simulação (caminho fragmentado), uma passada sobre a população serve às duas análises
+    momentos = momentos_mobilidade(populacao) if momentos is None else momentos
+
+    # Análise de mobilidade social
+    print("\n\nANÁLISE 4: MOBILIDADE SOCIAL NO CENÁRIO SOCIALDIVE")
+    print("=" * 70)
+
+    # Estatísticas de mobilidade por classe
+    print("\nMobilidade social por classe socioeconômica:")
+    print(mobilidade_por_classe(populacao, momentos).round(2))
+
+    if graficos.quer('mobilidade'):
+        graficos.enviar('mobilidade', **relatorio.dados_mobilidade(populacao['classe_socioeconomica'],
+                                                                   populacao['mobilidade'],
+                                                                   CATEGORIAS['classe_socioeconomica']))
+
+    # Análise de fatores que influenciam a mobilidade
+    print("\n\nANÁLISE 5: FATORES QUE INFLUENCIAM A MOBILIDADE SOCIAL")
+    print("=" * 70)
+
+    # Calcular correlações entre características e mobilidade
+    correlacoes = correlacoes_mobilidade(populacao, momentos)
+
+    print("\nCorrelação entre características e mobilidade social:")
+    for caracteristica, corr in correlacoes.items():
+        print(f" - {caracteristica}: {corr:.3f}")
+
+    graficos.enviar('fatores', correlacoes=correlacoes)
+
+
+def estagio_rede(args, populacao, cache, chave_simulacao, rede=None):
+    from socialdive.comunidades import detectar_comunidades, estatisticas_comunidades, resolver_metodo
+    from socialdive.grafo import GrafoEsparso
+    from socialdive.rede import gerar_arestas, n_conexoes_padrao
+
+    # Simulação de rede social
+    print("\n\nANÁLISE 6: SIMULAÇÃO DE REDE SOCIAL E FORMAÇÃO DE BOLHAS")
+    print("=" * 70)
+    print("Simulando formação de conexões e bolhas sociais baseadas em pontuação...")
+
+    # Adicionar arestas (conexões)
+    # Pessoas tendem a se conectar com outras de pontuação similar (homofilia)
+    n_pessoas = len(populacao)
+    n_conexoes = n_conexoes_padrao(n_pessoas)
+    # (sorteadas com o gerador global a partir do estado em que a simulação o deixou)
+    def calcular_arestas():
+        if rede:
+            # Rede co-evolutiva: a rede final é a que resultou das religações durante a simulação
+            origem, destino = np.divmod(rede['chaves'], n_pessoas)
+        else:
+            origem, destino = gerar_arestas(populacao['pontuacao_final'], n_conexoes)
+        return {'origem': origem, 'destino': destino}
+
+    with estagio('arestas'):
+        arestas, chave_arestas, _ = cache.executar('arestas', {'simulacao': chave_simulacao, 'n_conexoes': n_conexoes},
+                                                   calcular_arestas, _MODULOS_ARESTAS)
+    origem, destino = arestas['origem'], arestas['destino']
+
+    # Criar grafo de rede social (CSR esparsa, atributos dos nós em colunas alinhadas)
+    with estagio('grafo'):
+        grafo = GrafoEsparso.de_arestas(origem, destino, n_pessoas,
+                                        id=populacao['id'],
+                                        pontuacao=populacao['pontuacao_final'],
+                                        estrato=populacao['estrato_social'],
+                                        classe=populacao['classe_socioeconomica'])
+
+    print(f"\nRede social simulada com {grafo.n_nos} pessoas e {grafo.n_arestas} conexões.")
+    print(f"Grau médio: {grafo.graus().mean():.1f} conexões por pessoa.")
+    print(f"Assortatividade por pontuação: {grafo.assortatividade('pontuacao'):.3f}")
+    print(f"Assortatividade por estrato social: {grafo.assortatividade_categorica('estrato'):.3f}")
+
+    # Detectar comunidades na rede (Leiden quando disponível, senão propagação de rótulos)
+    metodo = resolver_metodo(args.comunidades)
+
+    def calcular_comunidades():
+        rotulos, metodo_usado = detectar_comunidades(grafo, metodo)
+        return {'rotulos': rotulos, 'metodo': metodo_usado}
+
+    with estagio('comunidades'):
+        comunidades, _, _ = cache.executar('comunidades', {'arestas': chave_arestas, 'metodo': metodo},
+                                           calcular_comunidades, _MODULOS_COMUNIDADES)
+    rotulos_comunidade, metodo_comunidades = comunidades['rotulos'], comunidades['metodo']
+    grafo['community'] = rotulos_comunidade
+
+    # Analisar homogeneidade das comunidades (tamanho, média e desvio numa única passada)
+    community_scores = estatisticas_comunidades(rotulos_comunidade, grafo['pontuacao'])
+    n_communities = len(community_scores['size'])
+    print(f"Detectadas {n_communities} comunidades distintas na rede social (método: {metodo_comunidades}).")
+
+    print("\nAnálise das 5 maiores comunidades:")
+    for i, (size, mean_score, std_score) in enumerate(zip(community_scores['size'][:5],
+                                                          community_scores['mean_score'][:5],
+                                                          community_scores['std_score'][:5]), 1):
+        print(f"Comunidade {i}: {size} membros, pontuação média: {mean_score:.2f} ± {std_score:.2f}")
+
+    if rede:
+        # Formação de bolhas ao longo do tempo, registrada incrementalmente durante a simulação
+        print("\nEvolução da rede co-evolutiva:")
+        print(f"{'dia':>5} {'religadas':>10} {'assort. pontuação':>18} {'assort. estrato':>16} {'comunidades':>12}")
+        passo = max(1, len(rede['dia']) // 10)
+        for i in sorted(set(range(0, len(rede['dia']), passo)) | {len(rede['dia']) - 1}):
+            print(f"{rede['dia'][i]:>5} {rede['religadas'][i]:>10} {rede['assortatividade'][i]:>18.3f} "
+                  f"{rede['assortatividade_estrato'][i]:>16.3f} {rede['n_comunidades'][i]:>12}")
+    return grafo
+
+
+def estagio_replicas(args):
+    import pandas as pd
+
+    from socialdive.estratos import ESTRATOS, LIMIARES_ESTRATO
+    from socialdive.populacao import CATEGORIAS
+    from socialdive.replicas import intervalos_bootstrap, simular_replicas
+
+    print(f"\n\n🎲 ANÁLISE EM CONJUNTO: {args.replicas} RÉPLICAS DA SIMULAÇÃO")
+    print("=" * 70)
+    print("Cada réplica tem população e ruído próprios; entre colchetes, o IC de 95% (bootstrap).")
+
+    limiares = LIMIARES_ESTRATO if args.limiares is None else args.limiares
+    metricas = simular_replicas(args.replicas, dict(PARAMETROS_PADRAO), args.pessoas, args.dias, args.semente,
+                                limiares, args.lote_replicas)
+    resumo = intervalos_bootstrap(metricas, semente=args.semente)
+
+    def formatar(nome, indice=(), casas=1):
+        r = resumo[nome]
+        return f"{r['media'][indice]:.{casas}f} [{r['inferior'][indice]:.{casas}f}, {r['superior'][indice]:.{casas}f}]"
+
+    classes = CATEGORIAS['classe_socioeconomica']
+    print("\nDistribuição da população por estrato social (%):")
+    for i, estrato in enumerate(ESTRATOS):
+        print(f" - {estrato}: {formatar('proporcao_estrato', i)}")
+
+    print("\nRelação entre classe socioeconômica inicial e estrato social final (%):")
+    tabela = pd.DataFrame([[formatar('classe_estrato', (i, j)) for j in range(len(ESTRATOS))]
+                           for i in range(len(classes))],
+                          index=pd.Index(classes, name='classe_socioeconomica'),
+                          columns=pd.Index(ESTRATOS, name='estrato_social'))
+    print(tabela.to_string())
+
+    print("\nMobilidade social média por classe socioeconômica:")
+    for i, classe in enumerate(classes):
+        print(f" - {classe}: {formatar('mobilidade_classe', i, 2)}")
+    print(f"\nDiferença de mobilidade ({classes[-1]} − {classes[0]}): {formatar('lacuna_mobilidade', casas=2)}")
+    print(f"Efeito Mateus (correlação pontuação inicial × mobilidade): {formatar('efeito_mateus', casas=3)}")
+
+
+def estagio_exportacao(args, populacao, agregados, grafo):
+    from socialdive.exportacao import exportar_agregados, exportar_arestas, exportar_populacao
+
+    # Resultados em formato colunar, para análises posteriores sem repetir a simulação
+    os.makedirs(args.exportar, exist_ok=True)
+    extensao = '.' + args.formato_exportacao
+
+    def caminho(nome):
+        return os.path.join(args.exportar, nome + extensao)
+
+    n_pessoas = exportar_populacao(populacao, caminho('populacao'), extras={'comunidade': grafo['community']})
+    exportar_agregados(agregados['medias_classes'], agregados['contingencia_estratos'],
+                       caminho('medias_classes'), caminho('estratos_diarios'))
+    n_arestas = exportar_arestas(grafo.adjacencia, caminho('arestas'), ids=populacao['id'])
+    print(f"\nResultados exportados em {args.exportar}: {n_pessoas} pessoas, {n_arestas} conexões "
+          f"e agregados diários ({args.formato_exportacao}).")
+
+
+def main(argv=None):
+    from socialdive.cache import CacheEstagios, SemCache
+
+    args = _argumentos(argv)
+    _configurar_locale()
+    cache = CacheEstagios(args.cache, args.cache_limite_mb << 20) if args.cache else SemCache()
+
+    print('🔍 PROJETO SOCIALDVIE DIGITAL - ANÁLISE DE IMPACTO SOCIAL DAS REDES SOCIAIS')
+    print("Inspirado no episódio 'SocialDive' de Black Mirror")
+    print("=" * 70)
+
+    if not args.instrumentar:
+        _executar(args, cache)
+        return
+
+    # Tempo, memória e contadores por estágio, gravados num relatório JSON
+    instr = instrumentacao.Instrumentacao(args.memoria, args.perfil)
+    with instrumentacao.ativar(instr):
+        _executar(args, cache)
+    instr.salvar(args.instrumentar)
+    print(f"Relatório de execução gravado em {args.instrumentar}")
+
+
+def _executar(args, cache):
+    from socialdive.analise import registrar_resultado
+
+    if args.replicas:
+        # Modo conjunto: só as métricas da simulação, com incerteza entre réplicas
+        with estagio('replicas'):
+            estagio_replicas(args)
+        return
+
+    # Gráficos são desenhados em outros processos enquanto os estágios seguintes rodam
+    with relatorio.Renderizador(args.saida, args.graficos, args.processos_graficos) as graficos:
+        with estagio('literatura'):
+            estagio_literatura(args, graficos)
+        if args.reddit or args.reddit_replay:
+            with estagio('reddit'):
+                estagio_reddit(args)
+        if args.corpus:
+            with estagio('corpus'):
+                estagio_corpus(args)
+        with estagio('simulacao'):
+            (populacao, pontuacao_final, medias_classes, limiares, chave_simulacao, rede,
+             agregados) = estagio_simulacao(args, cache)
+
+        with estagio('estratificacao'):
+            # Colunas derivadas (estrato como código int8)
+            registrar_resultado(populacao, pontuacao_final, limiares)
+            estagio_estratificacao(args, populacao, medias_classes, limiares, graficos)
+        with estagio('mobilidade'):
+            estagio_mobilidade(args, populacao, graficos, agregados['momentos'])
+        with estagio('rede'):
+            grafo = estagio_rede(args, populacao, cache, chave_simulacao, rede)
+        if args.exportar:
+            with estagio('exportacao'):
+                estagio_exportacao(args, populacao, agregados, grafo)
+        relatorio.imprimir_conclusoes()
+        # Espera dos gráficos pendentes; o tempo de desenho de cada um, medido no processo que o desenhou, vai à parte
+        with estagio('graficos'):
+            graficos.concluir()
+        instrumentacao.anotar('graficos', graficos.tempos)
+
+    print("\n✅ Análise concluída!" + ("" if args.sem_graficos else " Todos os gráficos foram gerados."))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,217 @@
+"""Rede social que co-evolui com as pontuações durante a simulação.
+
+`RedeCoevolutiva` é um registrador (ver `socialdive.historico`): a cada
+`intervalo` dias religa a rede conforme a homofilia de `prob_conexao` sobre
+as pontuações do dia e registra métricas de bolhas. Tudo é incremental:
+
+- só as arestas que tocam pessoas cuja pontuação se moveu mais que `limiar`
+  desde a última religação são reavaliadas; as que caem são substituídas por
+  conexões novas da pessoa que se moveu, sorteadas com a mesma homofilia;
+- a matriz de mistura por estrato é ajustada só pelas arestas removidas,
+  criadas ou que tocam quem mudou de estrato;
+- as comunidades são retomadas da partição anterior pela propagação de
+  rótulos, com a fronteira inicial restrita às pontas das arestas alteradas.
+
+As arestas ficam num único array ordenado de chaves int64 `min * n + max`,
+como em `gerar_arestas`.
+"""
+import numpy as np
+import scipy.sparse as sp
+
+from socialdive import instrumentacao
+from socialdive.comunidades import propagar_rotulos
+from socialdive.estratos import ESTRATOS, LIMIARES_ESTRATO, classificar
+from socialdive.historico import Registrador
+from socialdive.rede import prob_conexao
+
+
+def _assortatividade_mistura(mistura):
+    # Mesmo cálculo de `GrafoEsparso.assortatividade_categorica`, restrito às categorias presentes
+    presentes = (mistura.sum(axis=0) + mistura.sum(axis=1)) > 0
+    mistura = mistura[presentes][:, presentes] / mistura.sum()
+    esperado = (mistura.sum(axis=1) * mistura.sum(axis=0)).sum()
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return float((np.trace(mistura) - esperado) / (1 - esperado))
+
+
+class RedeCoevolutiva(Registrador):
+    """Religa a rede a cada `intervalo` dias e acompanha a formação de bolhas.
+
+    `origem`/`destino` são as arestas iniciais (ex.: de `gerar_arestas`).
+    `avaliacoes`, se dado (um `MotorAvaliacoes`), passa a usar a rede
+    religada, fechando o ciclo rede → avaliações → pontuação → rede.
+    Cada avaliação registra em `metricas` o dia, o número de arestas
+    religadas, a assortatividade por pontuação e por estrato e o número de
+    comunidades.
+    """
+
+    def __init__(self, origem, destino, n_pessoas, intervalo=7, limiar=0.25, homofilia=0.7,
+                 limiares_estrato=LIMIARES_ESTRATO, rng=None, avaliacoes=None, max_tentativas=20):
+        self.n_pessoas = n_pessoas
+        self.intervalo = intervalo
+        self.limiar = limiar
+        self.homofilia = homofilia
+        self.limiares_estrato = limiares_estrato
+        self.rng = np.random if rng is None else rng
+        self.avaliacoes = avaliacoes
+        self.max_tentativas = max_tentativas
+
+        origem = np.asarray(origem, dtype=np.int64)
+        destino = np.asarray(destino, dtype=np.int64)
+        self.chaves = np.unique(np.minimum(origem, destino) * n_pessoas + np.maximum(origem, destino))
+        self.referencia = None  # pontuação de cada pessoa na última religação que a envolveu
+        self.estratos = None
+        self.mistura = np.zeros((len(ESTRATOS), len(ESTRATOS)), dtype=np.int64)
+        self.rotulos = None
+        self.metricas = {'dia': [], 'religadas': [], 'assortatividade': [], 'assortatividade_estrato': [],
+                         'n_comunidades': []}
+
+    @property
+    def n_arestas(self):
+        return len(self.chaves)
+
+    def arestas(self):
+        """Pares (origem, destino) atuais, com origem < destino."""
+        return np.divmod(self.chaves, self.n_pessoas)
+
+    def adjacencia(self):
+        origem, destino = self.arestas()
+        linhas = np.concatenate([origem, destino])
+        colunas = np.concatenate([destino, origem])
+        return sp.csr_matrix((np.ones(len(linhas), dtype=np.float32), (linhas, colunas)),
+                             shape=(self.n_pessoas, self.n_pessoas))
+
+    def _misturar(self, origem, destino, estratos, sinal):
+        # Cada aresta conta nos dois sentidos, como em `assortatividade_categorica`
+        k = len(ESTRATOS)
+        contagem = np.bincount(estratos[origem] * k + estratos[destino], minlength=k * k).reshape(k, k)
+        self.mistura += sinal * (contagem + contagem.T)
+
+    def _novas_conexoes(self, ancoras, pontuacoes):
+        """Uma conexão nova para cada âncora, aceita com `prob_conexao`; retorna as chaves novas."""
+        n = self.n_pessoas
+        novas = np.empty(0, dtype=np.int64)
+        pendentes = ancoras
+        for _ in range(self.max_tentativas):
+            if len(pendentes) == 0:
+                break
+            candidatos = self.rng.randint(0, n, len(pendentes))
+            aceita = ((candidatos != pendentes)
+                      & (self.rng.random_sample(len(pendentes))
+                         < prob_conexao(pontuacoes[pendentes], pontuacoes[candidatos], self.homofilia)))
+            chaves = np.minimum(pendentes, candidatos) * n + np.maximum(pendentes, candidatos)
+            chaves = np.where(aceita, chaves, -1)
+            # Descarta repetidas (no lote, entre as novas e na rede), mantendo a primeira
+            _, primeiras = np.unique(chaves, return_index=True)
+            valida = np.zeros(len(chaves), dtype=bool)
+            valida[primeiras] = True
+            valida &= chaves >= 0
+            posicao = np.searchsorted(self.chaves, chaves).clip(max=max(len(self.chaves) - 1, 0))
+            if len(self.chaves):
+                valida &= self.chaves[posicao] != chaves
+            valida &= ~np.isin(chaves, novas)
+            novas = np.concatenate([novas, chaves[valida]])
+            pendentes = pendentes[~valida]
+        return np.sort(novas)
+
+    def religar(self, pontuacoes):
+        """Reavalia as arestas de quem se moveu; retorna (religadas, nós cujas arestas mudaram)."""
+        moveram = np.abs(pontuacoes - self.referencia) > self.limiar
+        if not moveram.any():
+            return 0, np.empty(0, dtype=np.int64)
+        origem, destino = self.arestas()
+        tocadas = np.flatnonzero(moveram[origem] | moveram[destino])
+        manter = (self.rng.random_sample(len(tocadas))
+                  < prob_conexao(pontuacoes[origem[tocadas]], pontuacoes[destino[tocadas]], self.homofilia))
+        removidas = tocadas[~manter]
+        o_rem, d_rem = origem[removidas], destino[removidas]
+        # Quem se moveu procura a conexão substituta
+        ancoras = np.where(moveram[o_rem], o_rem, d_rem)
+
+        self._misturar(o_rem, d_rem, self.estratos, -1)
+        self.chaves = np.delete(self.chaves, removidas)
+        novas = self._novas_conexoes(ancoras, pontuacoes)
+        self.chaves = np.sort(np.concatenate([self.chaves, novas]), kind='stable')
+        o_nov, d_nov = np.divmod(novas, self.n_pessoas)
+        self._misturar(o_nov, d_nov, self.estratos, +1)
+
+        self.referencia[moveram] = pontuacoes[moveram]
+        instrumentacao.contar('arestas_reavaliadas', len(tocadas))
+        instrumentacao.contar('arestas_religadas', len(removidas))
+        alterados = np.unique(np.concatenate([o_rem, d_rem, o_nov, d_nov]))
+        return len(removidas), alterados
+
+    def _atualizar_estratos(self, pontuacoes):
+        novos = classificar(pontuacoes, self.limiares_estrato)
+        mudaram = novos != self.estratos
+        if mudaram.any():
+            origem, destino = self.arestas()
+            afetadas = mudaram[origem] | mudaram[destino]
+            self._misturar(origem[afetadas], destino[afetadas], self.estratos, -1)
+            self._misturar(origem[afetadas], destino[afetadas], novos, +1)
+            self.estratos = novos
+
+    def _assortatividade(self, pontuacoes):
+        # Pearson entre as pontas das arestas nos dois sentidos, por somas sobre os nós: O(n + arestas)
+        origem, destino = self.arestas()
+        graus = np.bincount(origem, minlength=self.n_pessoas) + np.bincount(destino, minlength=self.n_pessoas)
+        m = graus.sum()
+        if m == 0:
+            return float('nan')
+        media = (graus * pontuacoes).sum() / m
+        desvio = pontuacoes - media
+        variancia = (graus * desvio * desvio).sum() / m
+        covariancia = 2 * (desvio[origem] * desvio[destino]).sum() / m
+        return float(covariancia / variancia)
+
+    def registrar(self, dia, pontuacoes):
+        if self.referencia is None:
+            # Dia 0: estado inicial completo, a partir do qual tudo é incremental
+            self.referencia = pontuacoes.copy()
+            self.estratos = classificar(pontuacoes, self.limiares_estrato)
+            self._misturar(*self.arestas(), self.estratos, +1)
+            religadas, ativos = 0, None
+        elif dia % self.intervalo == 0:
+            religadas, alterados = self.religar(pontuacoes)
+            ativos = np.zeros(self.n_pessoas, dtype=bool)
+            ativos[alterados] = True
+            self._atualizar_estratos(pontuacoes)
+        else:
+            return
+
+        if ativos is None or ativos.any():
+            adjacencia = self.adjacencia()
+            if self.avaliacoes is not None and religadas:
+                self.avaliacoes.atualizar_rede(adjacencia)
+            self.rotulos = propagar_rotulos(adjacencia, rotulos=self.rotulos, ativos=ativos, rng=self.rng)
+        self.metricas['dia'].append(dia)
+        self.metricas['religadas'].append(religadas)
+        self.metricas['assortatividade'].append(self._assortatividade(pontuacoes))
+        self.metricas['assortatividade_estrato'].append(_assortatividade_mistura(self.mistura))
+        self.metricas['n_comunidades'].append(int(self.rotulos.max()) + 1 if len(self.rotulos) else 0)
+
+    def serie(self):
+        """Métricas registradas, como arrays alinhados por avaliação."""
+        return {nome: np.asarray(valores) for nome, valores in self.metricas.items()}
+
+    # Estado para checkpoints: a rede muda de tamanho, então os arrays são substituídos, não copiados
+    def estado(self):
+        from socialdive.checkpoint import estado_rng
+
+        estado = dict(estado_rng(self.rng), chaves=self.chaves, referencia=self.referencia,
+                      estratos=self.estratos, mistura=self.mistura, rotulos=self.rotulos)
+        estado.update({'metrica_' + nome: valores for nome, valores in self.serie().items()})
+        return estado
+
+    def restaurar(self, estado):
+        from socialdive.checkpoint import restaurar_rng
+
+        restaurar_rng(self.rng, estado)
+        self.chaves = np.array(estado['chaves'])
+        self.referencia = np.array(estado['referencia'])
+        self.estratos = np.array(estado['estratos'])
+        self.mistura = np.array(estado['mistura'])
+        self.rotulos = np.array(estado['rotulos'])
+        self.metricas = {nome: list(estado['metrica_' + nome]) for nome in self.metricas}
+        if self.avaliacoes is not None:
+            self.avaliacoes.atualizar_rede(self.adjacencia())
@@ -0,0 +1,142 @@
+"""Detecção de comunidades (bolhas sociais) sobre a adjacência CSR de `GrafoEsparso`."""
+import numpy as np
+
+from socialdive import instrumentacao
+
+
+def _posicoes(indptr, nos):
+    """Posições na CSR (em `indices`) das linhas `nos`, concatenadas, e a linha de cada uma."""
+    inicios = indptr[nos]
+    tamanhos = indptr[nos + 1] - inicios
+    total = int(tamanhos.sum())
+    deslocamento = np.repeat(inicios - np.cumsum(tamanhos) + tamanhos, tamanhos)
+    return deslocamento + np.arange(total), np.repeat(nos, tamanhos)
+
+
+def propagar_rotulos(adjacencia, rotulos=None, ativos=None, max_iter=30, fracao=0.5, rng=None):
+    """Propagação de rótulos vetorizada sobre uma matriz de adjacência CSR.
+
+    A cada iteração cada nó da fronteira adota o rótulo mais frequente entre
+    seus vizinhos (mantendo o atual em caso de empate, demais empates
+    sorteados). Só uma `fracao` aleatória dos nós que querem mudar muda por
+    iteração, o que evita oscilações da versão síncrona. A fronteira começa em
+    `ativos` (todos os nós por padrão) e depois se restringe aos vizinhos de
+    quem mudou, então as iterações finais custam pouco. `rotulos` permite
+    recomeçar de uma partição anterior. O tempo é limitado por `max_iter`.
+    """
+    rng = np.random if rng is None else rng
+    n_nos = adjacencia.shape[0]
+    indptr, indices = adjacencia.indptr.astype(np.int64), adjacencia.indices
+    rotulos = np.arange(n_nos, dtype=np.int64) if rotulos is None else np.array(rotulos, dtype=np.int64)
+    fronteira = np.ones(n_nos, dtype=bool) if ativos is None else np.array(ativos, dtype=bool)
+
+    for _ in range(max_iter):
+        if not fronteira.any():
+            break
+
+        # Contar rótulos dos vizinhos para cada nó da fronteira
+        posicoes, linhas = _posicoes(indptr, np.flatnonzero(fronteira))
+        instrumentacao.contar('lpa_iteracoes')
+        instrumentacao.contar('lpa_vizinhos_visitados', len(posicoes))
+        chaves, contagens = np.unique(linhas * n_nos + rotulos[indices[posicoes]], return_counts=True)
+        nos, candidatos = np.divmod(chaves, n_nos)
+
+        # Rótulo mais frequente por nó; o atual vence empates, os demais são sorteados
+        desempate = rng.random_sample(len(chaves)) + (candidatos == rotulos[nos])
+        ordem = np.lexsort((desempate, contagens, nos))
+        nos, candidatos = nos[ordem], candidatos[ordem]
+        ultimo = np.append(nos[1:] != nos[:-1], True)
+        nos, candidatos = nos[ultimo], candidatos[ultimo]
+
+        querem_mudar = candidatos != rotulos[nos]
+        nos, candidatos = nos[querem_mudar], candidatos[querem_mudar]
+        mudam = rng.random_sample(len(nos)) < fracao
+        rotulos[nos[mudam]] = candidatos[mudam]
+
+        # Próxima fronteira: vizinhos de quem mudou e quem ainda quer mudar
+        fronteira = np.zeros(n_nos, dtype=bool)
+        fronteira[indices[_posicoes(indptr, nos[mudam])[0]]] = True
+        fronteira[nos[~mudam]] = True
+
+    return np.unique(rotulos, return_inverse=True)[1]
+
+
+def _leiden(grafo, semente):
+    import igraph as ig
+    import leidenalg
+
+    origem, destino = grafo.arestas()
+    g = ig.Graph(n=grafo.n_nos, edges=np.column_stack([origem, destino]))
+    particao = leidenalg.find_partition(g, leidenalg.ModularityVertexPartition, seed=semente)
+    return np.asarray(particao.membership)
+
+
+def _louvain(grafo, semente):
+    from community import best_partition
+
+    G = grafo.para_networkx()
+    partition = best_partition(G, random_state=semente)
+    return np.fromiter((partition[no] for no in G.nodes()), dtype=np.int64, count=grafo.n_nos)
+
+
+def _modulo_disponivel(*nomes):
+    import importlib.util
+
+    return all(importlib.util.find_spec(nome) is not None for nome in nomes)
+
+
+METODOS = ('auto', 'leiden', 'louvain', 'propagacao')
+
+
+def resolver_metodo(metodo):
+    """Nome do método que `detectar_comunidades` vai usar ('auto' vira leiden ou propagacao)."""
+    if metodo not in METODOS:
+        raise ValueError(f"Método desconhecido: {metodo!r}. Opções: {', '.join(METODOS)}")
+    if metodo == 'auto':
+        return 'leiden' if _modulo_disponivel('igraph', 'leidenalg') else 'propagacao'
+    return metodo
+
+
+def detectar_comunidades(grafo, metodo='auto', semente=42, max_iter=30):
+    """Particiona o grafo em comunidades; retorna (rotulos, metodo_usado).
+
+    'leiden' usa igraph + leidenalg, 'louvain' usa python-louvain (sobre
+    networkx, só para grafos pequenos) e 'propagacao' usa a propagação de
+    rótulos em NumPy, sem dependências extras. 'auto' usa Leiden quando
+    disponível e recai na propagação de rótulos.
+    """
+    metodo = resolver_metodo(metodo)
+    if metodo == 'leiden':
+        rotulos = _leiden(grafo, semente)
+    elif metodo == 'louvain':
+        rotulos = _louvain(grafo, semente)
+    else:
+        rotulos = propagar_rotulos(grafo.adjacencia, max_iter=max_iter, rng=np.random.RandomState(semente))
+    return rotulos, metodo
+
+
+def estatisticas_comunidades(rotulos, pontuacoes):
+    """Tamanho, pontuação média e desvio padrão de cada comunidade numa única passada.
+
+    Retorna um dict de arrays indexados pelo rótulo da comunidade, ordenados
+    do maior para o menor tamanho.
+    """
+    pontuacoes = np.asarray(pontuacoes, dtype=np.float64)
+    # Centralizar na média global reduz o cancelamento em E[x²] - E[x]²
+    centro = pontuacoes.mean() if len(pontuacoes) else 0.0
+    desvios = pontuacoes - centro
+    tamanho = np.bincount(rotulos)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        media = np.bincount(rotulos, weights=desvios) / tamanho
+        variancia = np.bincount(rotulos, weights=desvios * desvios) / tamanho - media * media
+    desvio = np.sqrt(np.maximum(variancia, 0))
+    media += centro
+
+    ordem = np.argsort(-tamanho, kind='stable')
+    ordem = ordem[tamanho[ordem] > 0]
+    return {
+        'comunidade': ordem,
+        'size': tamanho[ordem],
+        'mean_score': media[ordem],
+        'std_score': desvio[ordem],
+    }
@@ -0,0 +1,147 @@
+"""Estatísticas em uma passada: momentos por grupo, combináveis entre blocos e fragmentos.
+
+`Momentos` acumula, para cada grupo (ex.: classe × estrato), a contagem, as
+médias, a matriz de co-momentos Σ(x − μ)(x − μ)ᵀ, os mínimos e os máximos
+de um vetor de k características. Cada bloco de linhas é resumido com
+desvios em torno da média do próprio grupo e somado ao acumulado pela
+fórmula de Chan et al. (Welford em lote), que não sofre o cancelamento de
+E[x²] − E[x]²; a mesma fórmula combina resultados parciais de outros
+blocos, fragmentos ou processos (`combinar`) e junta grupos (`agrupar`).
+A memória é O(grupos × k²), qualquer que seja o número de pessoas.
+
+`resumo` reproduz groupby(...).agg(['count', 'mean', 'std', 'min', 'max'])
+e `correlacao` a matriz de `DataFrame.corr()`.
+"""
+import numpy as np
+
+TAMANHO_BLOCO = 1 << 16
+
+
+def _combinar(n_a, media_a, comomentos_a, n_b, media_b, comomentos_b):
+    """Contagem, médias e co-momentos da união de dois conjuntos disjuntos (grupos no 1º eixo)."""
+    n = n_a + n_b
+    with np.errstate(invalid='ignore', divide='ignore'):
+        peso = np.where(n > 0, n_b / n, 0.0)
+    delta = media_b - media_a
+    media = media_a + delta * peso[:, None]
+    comomentos = comomentos_a + comomentos_b + np.einsum('gi,gj->gij', delta, delta) * (n_a * peso)[:, None, None]
+    return n, media, comomentos
+
+
+class Momentos:
+    """Momentos até a segunda ordem de `nomes` (k características) em `n_grupos` grupos.
+
+    Grupos vazios têm média zero internamente e NaN nos resultados.
+    """
+
+    _estado = ('contagem', 'media', 'comomentos', 'minimo', 'maximo')
+
+    def __init__(self, nomes, n_grupos=1):
+        self.nomes = list(nomes)
+        self.n_grupos = n_grupos
+        k = len(self.nomes)
+        self.contagem = np.zeros(n_grupos, dtype=np.int64)
+        self.media = np.zeros((n_grupos, k))
+        self.comomentos = np.zeros((n_grupos, k, k))
+        self.minimo = np.full((n_grupos, k), np.inf)
+        self.maximo = np.full((n_grupos, k), -np.inf)
+
+    @classmethod
+    def de_colunas(cls, colunas, nomes, grupos=None, n_grupos=1, tamanho_bloco=TAMANHO_BLOCO):
+        """Momentos de colunas alinhadas (ex.: uma `Populacao`), lidas em blocos de `tamanho_bloco` linhas."""
+        momentos = cls(nomes, n_grupos)
+        n = len(colunas[nomes[0]])
+        for inicio in range(0, n, tamanho_bloco):
+            fatia = slice(inicio, inicio + tamanho_bloco)
+            momentos.atualizar(np.stack([colunas[nome][fatia] for nome in nomes]).T,
+                               None if grupos is None else grupos[fatia])
+        return momentos
+
+    def estado(self):
+        return {nome: getattr(self, nome) for nome in self._estado}
+
+    @classmethod
+    def de_estado(cls, nomes, estado):
+        momentos = cls(nomes, len(estado['contagem']))
+        for nome in cls._estado:
+            getattr(momentos, nome)[...] = estado[nome]
+        return momentos
+
+    def atualizar(self, valores, grupos=None):
+        """Acrescenta um bloco: `valores` (linhas, k) e o código de grupo de cada linha (padrão: grupo 0).
+
+        As reduções por grupo são `bincount` sobre cada característica, sem
+        ordenar o bloco; um bloco em ordem de colunas (ex.: `np.stack(colunas).T`)
+        evita uma cópia.
+        """
+        colunas = np.ascontiguousarray(np.asarray(valores, dtype=np.float64).T)
+        k = len(colunas)
+        grupos = np.zeros(colunas.shape[1], dtype=np.intp) if grupos is None else np.asarray(grupos)
+        contagem = np.bincount(grupos, minlength=self.n_grupos)
+        somas = np.stack([np.bincount(grupos, coluna, self.n_grupos) for coluna in colunas], axis=1)
+        media = somas / np.maximum(contagem, 1)[:, None]
+        desvios = [coluna - media_coluna.take(grupos) for coluna, media_coluna in zip(colunas, media.T.copy())]
+        comomentos = np.empty_like(self.comomentos)
+        for i in range(k):
+            for j in range(i, k):
+                comomentos[:, i, j] = comomentos[:, j, i] = np.bincount(grupos, desvios[i] * desvios[j],
+                                                                        self.n_grupos)
+        # Extremos por (característica, grupo) num único índice achatado
+        posicoes = (np.arange(k)[:, None] * self.n_grupos + grupos).ravel()
+        minimo, maximo = self.minimo.T.copy(), self.maximo.T.copy()
+        np.minimum.at(minimo.reshape(-1), posicoes, colunas.reshape(-1))
+        np.maximum.at(maximo.reshape(-1), posicoes, colunas.reshape(-1))
+        self.minimo[...], self.maximo[...] = minimo.T, maximo.T
+        self.contagem, self.media, self.comomentos = _combinar(self.contagem, self.media, self.comomentos,
+                                                               contagem, media, comomentos)
+        return self
+
+    def combinar(self, outro):
+        """Soma a estes os momentos de outro conjunto de linhas (mesmas características e grupos)."""
+        if outro.nomes != self.nomes or outro.n_grupos != self.n_grupos:
+            raise ValueError("Momentos com características ou grupos diferentes não podem ser combinados.")
+        self.contagem, self.media, self.comomentos = _combinar(self.contagem, self.media, self.comomentos,
+                                                               outro.contagem, outro.media, outro.comomentos)
+        np.minimum(self.minimo, outro.minimo, out=self.minimo)
+        np.maximum(self.maximo, outro.maximo, out=self.maximo)
+        return self
+
+    def agrupar(self, mapa, n_grupos):
+        """Novos `Momentos` em que o grupo g entra no grupo `mapa[g]` (ex.: classe × estrato → classe)."""
+        novo = Momentos(self.nomes, n_grupos)
+        for grupo, destino in enumerate(mapa):
+            alvo = [destino]
+            n, media, comomentos = _combinar(novo.contagem[alvo], novo.media[alvo], novo.comomentos[alvo],
+                                             self.contagem[[grupo]], self.media[[grupo]], self.comomentos[[grupo]])
+            novo.contagem[destino], novo.media[destino], novo.comomentos[destino] = n[0], media[0], comomentos[0]
+            np.minimum(novo.minimo[destino], self.minimo[grupo], out=novo.minimo[destino])
+            np.maximum(novo.maximo[destino], self.maximo[grupo], out=novo.maximo[destino])
+        return novo
+
+    def total(self):
+        """Momentos de todas as linhas, num único grupo."""
+        return self.agrupar(np.zeros(self.n_grupos, dtype=np.intp), 1)
+
+    def covariancia(self, ddof=1):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.comomentos / (self.contagem - ddof)[:, None, None]
+
+    def correlacao(self):
+        """Matriz de correlação de Pearson (grupos, k, k)."""
+        variancias = np.diagonal(self.comomentos, axis1=1, axis2=2)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.comomentos / np.sqrt(variancias[:, :, None] * variancias[:, None, :])
+
+    def resumo(self, nome, ddof=1):
+        """Contagem, média, desvio padrão, mínimo e máximo de uma característica por grupo."""
+        i = self.nomes.index(nome)
+        vazios = self.contagem == 0
+        media, minimo, maximo = self.media[:, i].copy(), self.minimo[:, i].copy(), self.maximo[:, i].copy()
+        media[vazios] = minimo[vazios] = maximo[vazios] = np.nan
+        return {
+            'count': self.contagem.copy(),
+            'mean': media,
+            'std': np.sqrt(np.maximum(self.covariancia(ddof)[:, i, i], 0)),
+            'min': minimo,
+            'max': maximo,
+        }
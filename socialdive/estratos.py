@@ -0,0 +1,75 @@
+"""Estratificação social a partir de códigos inteiros.
+
+Os estratos são atribuídos com `np.digitize` contra limiares configuráveis,
+e tabelas de contingência e resumos por grupo são reduções `np.bincount`
+sobre códigos int8 — sem rótulos de texto no caminho quente.
+"""
+import numpy as np
+
+# Estratos sociais, do mais baixo ao mais alto, e os limites inferiores de cada um a partir do segundo
+ESTRATOS = ('Excluído Digital', 'Marginalizado', 'Cidadão Padrão', 'Privilegiado', 'Elite Digital')
+LIMIARES_ESTRATO = (2.0, 3.0, 4.0, 4.5)
+
+
+def validar_limiares(limiares):
+    limiares = np.asarray(limiares, dtype=np.float64)
+    if len(limiares) != len(ESTRATOS) - 1 or np.any(np.diff(limiares) <= 0):
+        raise ValueError(f"São necessários {len(ESTRATOS) - 1} limiares em ordem crescente, recebido {limiares.tolist()}.")
+    return limiares
+
+
+def classificar(pontuacoes, limiares=LIMIARES_ESTRATO):
+    """Código int8 do estrato de cada pontuação (índice em `ESTRATOS`).
+
+    Pontuação maior ou igual a um limiar sobe de estrato, como na
+    classificação original por `if/elif`.
+    """
+    return np.digitize(pontuacoes, validar_limiares(limiares)).astype(np.int8)
+
+
+def contingencia(grupos, estratos, n_grupos, n_estratos=len(ESTRATOS)):
+    """Tabela de contagens (n_grupos, n_estratos) numa única passada `bincount`."""
+    chaves = grupos.astype(np.int64) * n_estratos + estratos
+    return np.bincount(chaves, minlength=n_grupos * n_estratos).reshape(n_grupos, n_estratos)
+
+
+def percentual_por_linha(tabela):
+    """Normaliza cada linha (último eixo) da tabela para somar 100 (linhas vazias ficam em NaN).
+
+    Aceita tabelas empilhadas, como (réplicas, grupos, estratos).
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return tabela / tabela.sum(axis=-1, keepdims=True) * 100
+
+
+def resumo_por_grupo(grupos, valores, n_grupos):
+    """Contagem, média, desvio padrão amostral, mínimo e máximo de `valores` por grupo.
+
+    Mesmos resultados de `groupby(grupo).agg(['mean', 'std', 'min', 'max'])`,
+    calculados por reduções sobre os códigos de grupo.
+    """
+    valores = np.asarray(valores, dtype=np.float64)
+    contagem = np.bincount(grupos, minlength=n_grupos)
+    # Centralizar na média global reduz o cancelamento na variância
+    centro = valores.mean() if len(valores) else 0.0
+    desvios = valores - centro
+    soma = np.bincount(grupos, weights=desvios, minlength=n_grupos)
+    soma_quadrados = np.bincount(grupos, weights=desvios * desvios, minlength=n_grupos)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        media = soma / contagem
+        variancia = (soma_quadrados - soma * media) / (contagem - 1)
+    minimo = np.full(n_grupos, np.inf)
+    maximo = np.full(n_grupos, -np.inf)
+    np.minimum.at(minimo, grupos, valores)
+    np.maximum.at(maximo, grupos, valores)
+    vazios = contagem == 0
+    minimo[vazios] = maximo[vazios] = np.nan
+
+    return {
+        'count': contagem,
+        'mean': media + centro,
+        'std': np.sqrt(np.maximum(variancia, 0)),
+        'min': minimo,
+        'max': maximo,
+    }
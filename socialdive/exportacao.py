@@ -0,0 +1,191 @@
+"""Exportação colunar (Parquet ou Arrow IPC) da população, dos agregados diários e das arestas.
+
+Tudo é escrito em grupos de linhas: cada grupo é montado a partir de fatias
+dos arrays NumPy (sem cópia para colunas numéricas e códigos categóricos) e
+gravado antes do próximo, então exportar uma população de 10M de pessoas
+não exige uma segunda cópia completa em memória. As colunas categóricas
+viram colunas de dicionário (códigos int8 + tabela de rótulos), o formato
+nativo de `CATEGORIAS`; pandas as lê de volta como `Categorical`.
+
+O formato sai da extensão do arquivo: '.parquet' ou '.arrow'/'.feather'
+(Arrow IPC). pyarrow é importado só aqui, no momento da exportação.
+`ler_colunas` e `ler_agregados` fazem o caminho inverso, de volta a arrays
+NumPy com os códigos de `CATEGORIAS`.
+"""
+import numpy as np
+
+from socialdive.estratos import ESTRATOS
+from socialdive.populacao import CATEGORIAS
+
+LINHAS_POR_GRUPO = 1 << 20
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError("A exportação requer pyarrow (pip install pyarrow).") from None
+    return pa
+
+
+def _coluna(pa, valores, rotulos=None):
+    if rotulos is None:
+        return pa.array(valores)
+    return pa.DictionaryArray.from_arrays(pa.array(valores), pa.array(list(rotulos), type=pa.string()))
+
+
+class _Escritor:
+    """Grava lotes (dicts nome → array NumPy) num arquivo Parquet ou Arrow IPC."""
+
+    def __init__(self, caminho, categoricas=None, compressao='zstd'):
+        self.pa = _pyarrow()
+        self.caminho = str(caminho)
+        self.categoricas = categoricas or {}
+        self.compressao = compressao
+        self.linhas = 0
+        self._escritor = None
+
+    def _tabela(self, lote):
+        nomes = list(lote)
+        colunas = [_coluna(self.pa, valores, self.categoricas.get(nome)) for nome, valores in lote.items()]
+        return self.pa.Table.from_arrays(colunas, names=nomes)
+
+    def escrever(self, lote):
+        tabela = self._tabela(lote)
+        if self._escritor is None:
+            if self.caminho.endswith(('.arrow', '.feather')):
+                self._escritor = self.pa.ipc.new_file(self.caminho, tabela.schema)
+            else:
+                import pyarrow.parquet as pq
+
+                self._escritor = pq.ParquetWriter(self.caminho, tabela.schema, compression=self.compressao)
+        self._escritor.write_table(tabela)
+        self.linhas += tabela.num_rows
+
+    def fechar(self):
+        if self._escritor is not None:
+            self._escritor.close()
+            self._escritor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.fechar()
+
+
+def _fatias(n, linhas_por_grupo):
+    # Pelo menos um grupo, para que arquivos vazios ainda tenham o esquema
+    for inicio in range(0, max(n, 1), linhas_por_grupo):
+        yield slice(inicio, min(inicio + linhas_por_grupo, n))
+
+
+def exportar_populacao(populacao, caminho, colunas=None, linhas_por_grupo=LINHAS_POR_GRUPO, extras=None):
+    """Grava as colunas da `Populacao` (todas, por padrão), um grupo de linhas por vez.
+
+    Inclui as colunas derivadas de `registrar_resultado` se já estiverem na
+    população. `extras` acrescenta outras colunas alinhadas por pessoa (ex.:
+    o rótulo de comunidade). Retorna o número de linhas gravadas.
+    """
+    nomes = list(populacao.colunas) if colunas is None else list(colunas)
+    extras = extras or {}
+    with _Escritor(caminho, {nome: CATEGORIAS[nome] for nome in nomes if nome in CATEGORIAS}) as escritor:
+        for fatia in _fatias(len(populacao), linhas_por_grupo):
+            lote = {nome: populacao[nome][fatia] for nome in nomes}
+            lote.update({nome: valores[fatia] for nome, valores in extras.items()})
+            escritor.escrever(lote)
+    return escritor.linhas
+
+
+def exportar_agregados(medias_classes, contingencia_estratos, caminho_medias, caminho_estratos):
+    """Grava os agregados diários por classe em formato longo.
+
+    `medias_classes` (n_dias, classes) vira (dia, classe, media_pontuacao) e
+    `contingencia_estratos` (n_dias, classes, estratos) vira (dia, classe,
+    estrato, pessoas). São pequenos (dias × categorias), então vão num único
+    grupo de linhas cada.
+    """
+    classes = CATEGORIAS['classe_socioeconomica']
+    n_dias, n_classes = medias_classes.shape
+    dia, classe = np.divmod(np.arange(n_dias * n_classes), n_classes)
+    with _Escritor(caminho_medias, {'classe': classes}) as escritor:
+        escritor.escrever({'dia': dia.astype(np.int32), 'classe': classe.astype(np.int8),
+                           'media_pontuacao': medias_classes.ravel()})
+
+    n_estratos = contingencia_estratos.shape[2]
+    dia, resto = np.divmod(np.arange(contingencia_estratos.size), n_classes * n_estratos)
+    classe, estrato = np.divmod(resto, n_estratos)
+    with _Escritor(caminho_estratos, {'classe': classes, 'estrato': ESTRATOS}) as escritor:
+        escritor.escrever({'dia': dia.astype(np.int32), 'classe': classe.astype(np.int8),
+                           'estrato': estrato.astype(np.int8), 'pessoas': contingencia_estratos.ravel()})
+
+
+def exportar_arestas(adjacencia, caminho, ids=None, linhas_por_grupo=LINHAS_POR_GRUPO):
+    """Grava a lista de arestas (origem < destino) de uma adjacência CSR simétrica.
+
+    Percorre a CSR em blocos de nós com cerca de `linhas_por_grupo` posições,
+    sem materializar a lista de arestas inteira. Com `ids` (ex.: a coluna
+    'id' da população) as pontas são gravadas como ids em vez de índices.
+    Retorna o número de arestas gravadas.
+    """
+    indptr, indices = adjacencia.indptr, adjacencia.indices
+    n_nos = adjacencia.shape[0]
+    # Nós em que cada bloco começa: cortes a cada ~linhas_por_grupo posições da CSR
+    cortes = np.unique(np.concatenate([[0], np.searchsorted(indptr, np.arange(linhas_por_grupo, indptr[-1],
+                                                                                linhas_por_grupo)), [n_nos]]))
+    with _Escritor(caminho) as escritor:
+        for inicio, fim in zip(cortes[:-1], cortes[1:]):
+            colunas = indices[indptr[inicio]:indptr[fim]]
+            linhas = np.repeat(np.arange(inicio, fim, dtype=colunas.dtype), np.diff(indptr[inicio:fim + 1]))
+            superior = linhas < colunas
+            origem, destino = linhas[superior], colunas[superior]
+            if ids is not None:
+                origem, destino = ids[origem], ids[destino]
+            escritor.escrever({'origem': origem, 'destino': destino})
+        if escritor.linhas == 0:
+            vazio = np.empty(0, dtype=indices.dtype if ids is None else np.asarray(ids).dtype)
+            escritor.escrever({'origem': vazio, 'destino': vazio})
+    return escritor.linhas
+
+
+def ler_colunas(caminho, categoricas=None):
+    """Lê um arquivo gravado por este módulo como dict nome → array NumPy.
+
+    Colunas de dicionário voltam como códigos int8 na ordem de
+    `categoricas` (padrão: `CATEGORIAS` e as colunas 'classe' e 'estrato'
+    dos agregados), qualquer que seja a ordem do dicionário no arquivo.
+    """
+    pa = _pyarrow()
+    categoricas = categoricas or {**CATEGORIAS, 'classe': CATEGORIAS['classe_socioeconomica'], 'estrato': ESTRATOS}
+    caminho = str(caminho)
+    if caminho.endswith(('.arrow', '.feather')):
+        with pa.memory_map(caminho) as fonte:
+            tabela = pa.ipc.open_file(fonte).read_all()
+    else:
+        import pyarrow.parquet as pq
+
+        tabela = pq.read_table(caminho)
+    colunas = {}
+    for nome in tabela.column_names:
+        coluna = tabela.column(nome)
+        if pa.types.is_dictionary(coluna.type):
+            rotulos = list(categoricas[nome])
+            partes = [np.array([rotulos.index(rotulo) for rotulo in pedaco.dictionary.to_pylist()],
+                               dtype=np.int8)[pedaco.indices.to_numpy(zero_copy_only=False)]
+                      for pedaco in coluna.chunks]
+            colunas[nome] = np.concatenate(partes) if partes else np.empty(0, dtype=np.int8)
+        else:
+            colunas[nome] = coluna.to_numpy()
+    return colunas
+
+
+def ler_agregados(caminho_medias, caminho_estratos):
+    """Inverso de `exportar_agregados`: retorna (medias_classes, contingencia_estratos) em forma de array."""
+    n_classes, n_estratos = len(CATEGORIAS['classe_socioeconomica']), len(ESTRATOS)
+    medias = ler_colunas(caminho_medias)
+    medias_classes = np.full((medias['dia'].max() + 1, n_classes), np.nan)
+    medias_classes[medias['dia'], medias['classe']] = medias['media_pontuacao']
+    estratos = ler_colunas(caminho_estratos)
+    contingencia = np.zeros((estratos['dia'].max() + 1, n_classes, n_estratos), dtype=estratos['pessoas'].dtype)
+    contingencia[estratos['dia'], estratos['classe'], estratos['estrato']] = estratos['pessoas']
+    return medias_classes, contingencia
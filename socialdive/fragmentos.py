@@ -0,0 +1,192 @@
+"""Simulação de uma única população grande dividida em fragmentos entre processos.
+
+A atualização diária é independente entre pessoas; só o gerador aleatório
+é compartilhado. Aqui a população é dividida em `n_fragmentos` faixas
+contíguas e cada processo avança a sua com um fluxo próprio, filho de uma
+`np.random.SeedSequence`. O resultado depende da semente e do número de
+fragmentos, não do número de processos nem da ordem em que terminam.
+
+Colunas da população, pontuações e agregados vivem em blocos
+`multiprocessing.shared_memory`: os processos recebem só os nomes dos
+blocos e escrevem nas próprias faixas, sem serializar arrays. Cada
+fragmento publica, para cada dia, somas de pontuação por classe e a
+contingência classe × estrato da sua faixa; a redução final é uma soma
+sobre o eixo dos fragmentos.
+
+Sem acoplamento entre pessoas (avaliações, rede), os fragmentos não
+precisam de sincronização entre dias: cada processo percorre todos os dias
+da sua faixa de uma vez.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from socialdive import instrumentacao
+from socialdive.estratos import ESTRATOS, LIMIARES_ESTRATO, classificar, contingencia
+from socialdive.nucleos import obter_nucleo
+from socialdive.populacao import CATEGORIAS, Populacao, criar_populacao
+from socialdive.simulacao import termos_estaticos
+
+
+def _esquema_populacao():
+    """Nome e dtype de cada coluna de `criar_populacao`."""
+    vazia = criar_populacao(0, np.random.RandomState(0))
+    return {nome: valores.dtype for nome, valores in vazia.colunas.items()}
+
+
+def _abrir(descritor):
+    nome, forma, dtype = descritor
+    bloco = shared_memory.SharedMemory(name=nome)
+    return bloco, np.ndarray(forma, dtype=dtype, buffer=bloco.buf)
+
+
+def _avancar_fragmento(tarefa):
+    (fragmento, inicio, fim, sequencia, descritores, parametros, n_dias, limiares, gerar,
+     nome_nucleo) = tarefa
+    blocos = {}
+    try:
+        arrays = {}
+        for nome, descritor in descritores.items():
+            blocos[nome], arrays[nome] = _abrir(descritor)
+        rng = np.random.RandomState(np.random.MT19937(sequencia))
+        faixa = slice(inicio, fim)
+        n_pessoas = fim - inicio
+
+        if gerar:
+            # Cada fragmento gera a própria faixa da população com o seu fluxo
+            for nome, valores in criar_populacao(n_pessoas, rng).colunas.items():
+                arrays['populacao.' + nome][faixa] = valores
+            arrays['populacao.id'][faixa] += inicio
+        populacao = Populacao({nome.split('.', 1)[1]: valores[faixa] for nome, valores in arrays.items()
+                               if nome.startswith('populacao.')})
+
+        termos = termos_estaticos(populacao, parametros)
+        nucleo = obter_nucleo(nome_nucleo, n_pessoas)
+        classes = populacao['classe_socioeconomica']
+        n_classes = len(CATEGORIAS['classe_socioeconomica'])
+        somas = arrays['somas_classes'][fragmento]
+        tabela = arrays['contingencia'][fragmento]
+
+        def agregar(dia, pontuacoes):
+            somas[dia] = np.bincount(classes, weights=pontuacoes, minlength=n_classes)
+            tabela[dia] = contingencia(classes, classificar(pontuacoes, limiares), n_classes)
+
+        # O buffer compartilhado e um local se alternam entre os dias, como em `evoluir`
+        final = arrays['pontuacao'][faixa]
+        atual = final
+        atual[:] = populacao['pontuacao_inicial']
+        nova = np.empty_like(atual)
+        agregar(0, atual)
+        for dia in range(1, n_dias):
+            ruido = rng.normal(0, parametros['volatilidade'], n_pessoas)
+            nucleo.passo(atual, ruido, termos, parametros, out=nova)
+            atual, nova = nova, atual
+            agregar(dia, atual)
+        if atual is not final:
+            final[:] = atual
+    finally:
+        # As visões precisam ser soltas antes de fechar os blocos
+        arrays = populacao = final = atual = nova = somas = tabela = None
+        for bloco in blocos.values():
+            bloco.close()
+    return fragmento
+
+
+class SimulacaoFragmentada:
+    """Blocos compartilhados e o pool de processos de uma simulação fragmentada.
+
+    Use como gerenciador de contexto: os arrays devolvidos por `executar`
+    são visões da memória compartilhada e valem até a saída do bloco `with`
+    (copie o que precisar guardar). `populacao` é uma `Populacao` a ser
+    copiada para a memória compartilhada ou um inteiro, caso em que cada
+    fragmento gera a sua faixa — o que também paraleliza a criação.
+    """
+
+    def __init__(self, populacao, n_fragmentos=None, semente=42, limiares=LIMIARES_ESTRATO,
+                 max_workers=None, nucleo='numpy'):
+        self.n_fragmentos = n_fragmentos or os.cpu_count() or 1
+        self.semente = semente
+        self.limiares = limiares
+        self.max_workers = max_workers
+        self.nucleo = nucleo
+        self._gerar = not isinstance(populacao, Populacao)
+        self.n_pessoas = populacao if self._gerar else len(populacao)
+        self._origem = None if self._gerar else populacao
+        self._blocos = {}
+        self._descritores = {}
+        self.arrays = {}
+
+    def _alocar(self, nome, forma, dtype):
+        dtype = np.dtype(dtype)
+        bloco = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(forma)) * dtype.itemsize))
+        self._blocos[nome] = bloco
+        self._descritores[nome] = (bloco.name, forma, dtype.str)
+        self.arrays[nome] = np.ndarray(forma, dtype=dtype, buffer=bloco.buf)
+        return self.arrays[nome]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.fechar()
+
+    def fechar(self):
+        self.arrays.clear()
+        for bloco in self._blocos.values():
+            bloco.close()
+            bloco.unlink()
+        self._blocos.clear()
+        self._descritores.clear()
+
+    def executar(self, parametros, n_dias):
+        """Avança todos os fragmentos por `n_dias` e reduz os agregados parciais.
+
+        Retorna um dict com 'populacao' (`Populacao`), 'pontuacao_final',
+        'medias_classes' (n_dias, classes) e 'contingencia_estratos'
+        (n_dias, classes, estratos), como os registradores de `evoluir`.
+        """
+        n_pessoas, n_fragmentos = self.n_pessoas, self.n_fragmentos
+        n_classes = len(CATEGORIAS['classe_socioeconomica'])
+        for nome, dtype in _esquema_populacao().items():
+            coluna = self._alocar('populacao.' + nome, (n_pessoas,), dtype)
+            if not self._gerar:
+                coluna[:] = self._origem[nome]
+        self._alocar('pontuacao', (n_pessoas,), np.float64)
+        self._alocar('somas_classes', (n_fragmentos, n_dias, n_classes), np.float64)
+        self._alocar('contingencia', (n_fragmentos, n_dias, n_classes, len(ESTRATOS)), np.int64)
+
+        limites = np.linspace(0, n_pessoas, n_fragmentos + 1).astype(np.int64)
+        sequencias = np.random.SeedSequence(self.semente).spawn(n_fragmentos)
+        tarefas = [(fragmento, int(limites[fragmento]), int(limites[fragmento + 1]), sequencias[fragmento],
+                    self._descritores, parametros, n_dias, self.limiares, self._gerar, self.nucleo)
+                   for fragmento in range(n_fragmentos)]
+        n_processos = min(self.max_workers or os.cpu_count() or 1, n_fragmentos)
+        with ProcessPoolExecutor(max_workers=n_processos) as executor:
+            list(executor.map(_avancar_fragmento, tarefas))
+        # Contadores vivem no processo principal; os dias de cada fragmento são conhecidos de antemão
+        instrumentacao.contar('dias_simulados', max(n_dias - 1, 0) * n_fragmentos)
+        instrumentacao.contar('pessoas_dia', max(n_dias - 1, 0) * n_pessoas)
+
+        # Redução: soma dos parciais de cada fragmento
+        tabela = self.arrays['contingencia'].sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            medias = self.arrays['somas_classes'].sum(axis=0) / tabela.sum(axis=2)
+        populacao = Populacao({nome.split('.', 1)[1]: valores for nome, valores in self.arrays.items()
+                               if nome.startswith('populacao.')})
+        return {'populacao': populacao, 'pontuacao_final': self.arrays['pontuacao'],
+                'medias_classes': medias, 'contingencia_estratos': tabela}
+
+
+def evoluir_fragmentado(populacao, parametros, n_dias, n_fragmentos=None, semente=42, limiares=LIMIARES_ESTRATO,
+                        max_workers=None, nucleo='numpy'):
+    """Como `SimulacaoFragmentada.executar`, mas devolve cópias fora da memória compartilhada."""
+    with SimulacaoFragmentada(populacao, n_fragmentos, semente, limiares, max_workers, nucleo) as simulacao:
+        resultado = simulacao.executar(parametros, n_dias)
+        return {
+            'populacao': Populacao({nome: valores.copy() for nome, valores in resultado['populacao'].colunas.items()}),
+            'pontuacao_final': resultado['pontuacao_final'].copy(),
+            'medias_classes': resultado['medias_classes'],
+            'contingencia_estratos': resultado['contingencia_estratos'],
+        }
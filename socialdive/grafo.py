@@ -0,0 +1,120 @@
+import numpy as np
+import scipy.sparse as sp
+
+
+class GrafoEsparso:
+    """Rede social não direcionada guardada como matriz de adjacência CSR simétrica.
+
+    Os atributos dos nós ficam em colunas NumPy alinhadas ao índice do nó
+    (base 0), acessíveis por `grafo['pontuacao']`. A memória cresce com o
+    número de arestas, nunca com n_nos². A conversão para networkx só acontece
+    quando pedida explicitamente em `para_networkx`.
+    """
+
+    def __init__(self, adjacencia, **atributos):
+        self.adjacencia = sp.csr_matrix(adjacencia)
+        self.atributos = {}
+        for nome, valores in atributos.items():
+            self[nome] = valores
+
+    @classmethod
+    def de_arestas(cls, origem, destino, n_nos, **atributos):
+        """Cria o grafo a partir de uma lista de arestas COO (cada par uma única vez)."""
+        origem = np.asarray(origem)
+        destino = np.asarray(destino)
+        linhas = np.concatenate([origem, destino])
+        colunas = np.concatenate([destino, origem])
+        dados = np.ones(len(linhas), dtype=np.float32)
+        adjacencia = sp.csr_matrix((dados, (linhas, colunas)), shape=(n_nos, n_nos))
+        adjacencia.sum_duplicates()
+        return cls(adjacencia, **atributos)
+
+    def __getitem__(self, nome):
+        return self.atributos[nome]
+
+    def __setitem__(self, nome, valores):
+        valores = np.asarray(valores)
+        if len(valores) != self.n_nos:
+            raise ValueError(f"Atributo {nome!r} tem {len(valores)} valores para {self.n_nos} nós.")
+        self.atributos[nome] = valores
+
+    @property
+    def n_nos(self):
+        return self.adjacencia.shape[0]
+
+    @property
+    def n_arestas(self):
+        return self.adjacencia.nnz // 2
+
+    @property
+    def memoria_bytes(self):
+        adj = self.adjacencia
+        total = adj.data.nbytes + adj.indices.nbytes + adj.indptr.nbytes
+        return total + sum(valores.nbytes for valores in self.atributos.values())
+
+    def vizinhos(self, no):
+        adj = self.adjacencia
+        return adj.indices[adj.indptr[no]:adj.indptr[no + 1]]
+
+    def graus(self):
+        return np.diff(self.adjacencia.indptr)
+
+    def arestas(self):
+        """Pares (origem, destino) com origem < destino."""
+        adj = self.adjacencia
+        linhas = np.repeat(np.arange(self.n_nos), self.graus())
+        superior = linhas < adj.indices
+        return linhas[superior], adj.indices[superior]
+
+    def media_vizinhos(self, atributo):
+        """Média do atributo numérico entre os vizinhos de cada nó (NaN para nós isolados)."""
+        valores = np.asarray(self[atributo], dtype=np.float64)
+        graus = self.graus()
+        soma = self.adjacencia @ valores
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return soma / graus
+
+    def _extremidades(self, atributo):
+        # Cada aresta aparece nos dois sentidos, como nas métricas do networkx
+        adj = self.adjacencia
+        linhas = np.repeat(np.arange(self.n_nos), self.graus())
+        valores = self[atributo]
+        return valores[linhas], valores[adj.indices]
+
+    def assortatividade(self, atributo):
+        """Coeficiente de assortatividade numérica (correlação entre extremidades das arestas)."""
+        x, y = self._extremidades(atributo)
+        x = x.astype(np.float64)
+        y = y.astype(np.float64)
+        x -= x.mean()
+        y -= y.mean()
+        return float((x * y).sum() / np.sqrt((x * x).sum() * (y * y).sum()))
+
+    def assortatividade_categorica(self, atributo):
+        """Coeficiente de assortatividade para atributos categóricos (ex.: estrato)."""
+        origem, destino = self._extremidades(atributo)
+        categorias, codigos = np.unique(np.concatenate([origem, destino]), return_inverse=True)
+        k = len(categorias)
+        n = len(origem)
+        mistura = np.bincount(codigos[:n] * k + codigos[n:], minlength=k * k).reshape(k, k) / n
+        a = mistura.sum(axis=1)
+        b = mistura.sum(axis=0)
+        esperado = (a * b).sum()
+        return float((np.trace(mistura) - esperado) / (1 - esperado))
+
+    def para_networkx(self):
+        """Converte para `networkx.Graph`; os nós são rotulados pelo atributo 'id', se houver."""
+        import networkx as nx
+
+        rotulos = self.atributos.get('id', np.arange(self.n_nos))
+        G = nx.Graph()
+        nomes = list(self.atributos)
+        colunas = [self.atributos[nome].tolist() for nome in nomes]
+        registros = zip(*colunas) if colunas else [()] * self.n_nos
+        G.add_nodes_from(
+            (rotulo, dict(zip(nomes, valores)))
+            for rotulo, valores in zip(rotulos.tolist(), registros)
+        )
+        origem, destino = self.arestas()
+        G.add_edges_from(zip(rotulos[origem].tolist(), rotulos[destino].tolist()))
+        return G
@@ -0,0 +1,206 @@
+"""Registro do histórico de pontuações durante a simulação.
+
+`evoluir` chama `registrar(dia, pontuacoes)` de cada registrador uma vez por
+dia (incluindo o dia 0) e `finalizar()` ao terminar. Os registradores de
+agregados guardam apenas O(n_dias × grupos) valores, então a memória da
+simulação fica em O(n_pessoas) qualquer que seja o horizonte; a trajetória
+completa é opcional e vai para disco.
+
+`estado()` e `restaurar(estado)` expõem os arrays acumulados até o dia
+corrente, para que um checkpoint (ver `socialdive.checkpoint`) possa
+retomar a simulação no meio.
+
+`RegistroMomentos` acumula, nos dias pedidos, os momentos (médias,
+co-momentos, extremos) das características e da mobilidade por classe ×
+estrato — as ANÁLISES 4 e 5 sem guardar nem copiar a população.
+"""
+import numpy as np
+
+from socialdive.estratos import ESTRATOS, LIMIARES_ESTRATO, classificar, contingencia
+from socialdive.estatisticas import TAMANHO_BLOCO, Momentos
+from socialdive.populacao import CATEGORIAS
+
+
+class Registrador:
+    def registrar(self, dia, pontuacoes):
+        raise NotImplementedError
+
+    def finalizar(self):
+        pass
+
+    # Nomes dos atributos (arrays) acumulados que compõem o estado do registrador
+    _estado = ()
+
+    def estado(self):
+        return {nome: getattr(self, nome) for nome in self._estado}
+
+    def restaurar(self, estado):
+        for nome in self._estado:
+            getattr(self, nome)[...] = estado[nome]
+
+
+class RegistroDenso(Registrador):
+    """Matriz completa `pontuacoes_tempo` (n_pessoas, n_dias) em memória, como no script original."""
+
+    _estado = ('pontuacoes_tempo',)
+
+    def __init__(self, n_pessoas, n_dias):
+        self.pontuacoes_tempo = np.zeros((n_pessoas, n_dias))
+
+    def registrar(self, dia, pontuacoes):
+        self.pontuacoes_tempo[:, dia] = pontuacoes
+
+
+class RegistroTrajetoria(Registrador):
+    """Trajetória completa em float32 num `.npy` mapeado em memória.
+
+    O arquivo tem forma (n_dias, n_pessoas): cada dia é gravado como uma linha
+    contígua, e só as páginas tocadas ficam residentes.
+
+    O estado já está no arquivo: para retomar uma simulação, abra-o com
+    `modo='r+'` em vez de recriá-lo.
+    """
+
+    def __init__(self, caminho, n_pessoas, n_dias, dtype=np.float32, modo='w+'):
+        self.caminho = caminho
+        if modo == 'r+':
+            self.trajetoria = np.lib.format.open_memmap(caminho, mode='r+')
+            if self.trajetoria.shape != (n_dias, n_pessoas):
+                raise ValueError(f"Trajetória em {caminho!r} tem forma {self.trajetoria.shape}, "
+                                 f"esperado {(n_dias, n_pessoas)}.")
+        else:
+            self.trajetoria = np.lib.format.open_memmap(caminho, mode=modo, dtype=dtype,
+                                                        shape=(n_dias, n_pessoas))
+
+    def registrar(self, dia, pontuacoes):
+        self.trajetoria[dia] = pontuacoes
+
+    def finalizar(self):
+        self.trajetoria.flush()
+
+    def estado(self):
+        # Os dias já gravados precisam estar no disco antes do checkpoint
+        self.trajetoria.flush()
+        return {}
+
+
+class RegistroAgregados(Registrador):
+    """Contagem, média e, se pedidos, quantis diários por grupo fixo (ex.: classe socioeconômica).
+
+    `grupos` é um array de códigos inteiros 0..n_grupos-1 por pessoa. Os
+    `quantis` custam uma seleção por grupo a cada dia, bem mais que a média:
+    por padrão nenhum é calculado.
+    """
+
+    _estado = ('media', 'valores_quantis')
+
+    def __init__(self, grupos, n_grupos, n_dias, quantis=(), nomes=None):
+        self.grupos = np.asarray(grupos)
+        self.n_grupos = n_grupos
+        self.nomes = list(nomes) if nomes is not None else list(range(n_grupos))
+        self.quantis = tuple(quantis)
+        self.contagem = np.bincount(self.grupos, minlength=n_grupos)
+        self.media = np.full((n_dias, n_grupos), np.nan)
+        self.valores_quantis = np.full((n_dias, n_grupos, len(self.quantis)), np.nan)
+        if self.quantis:
+            ordem = np.argsort(self.grupos, kind='stable')
+            self._indices = np.split(ordem, np.cumsum(self.contagem)[:-1])
+
+    def registrar(self, dia, pontuacoes):
+        soma = np.bincount(self.grupos, weights=pontuacoes, minlength=self.n_grupos)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.media[dia] = soma / self.contagem
+        if self.quantis:
+            for grupo, indices in enumerate(self._indices):
+                if len(indices):
+                    self.valores_quantis[dia, grupo] = np.quantile(pontuacoes[indices], self.quantis)
+
+    def medias_por_grupo(self):
+        """Série diária da média de cada grupo, indexada pelo nome do grupo."""
+        return {nome: self.media[:, grupo] for grupo, nome in enumerate(self.nomes)}
+
+
+class RegistroEstratos(Registrador):
+    """Contagem e média diárias por estrato social, reclassificando a pontuação a cada dia.
+
+    Com `grupos` (códigos 0..n_grupos-1, ex.: classe socioeconômica) também
+    guarda a tabela de contingência grupo × estrato de cada dia, aproveitando
+    a mesma classificação: a deriva dos estratos ao longo do tempo custa um
+    `bincount` a mais por dia.
+    """
+
+    @property
+    def _estado(self):
+        return ('contagem', 'media') + (('contingencia',) if self.grupos is not None else ())
+
+    def __init__(self, n_dias, limiares=LIMIARES_ESTRATO, grupos=None, n_grupos=None):
+        self.limiares = limiares
+        n_estratos = len(ESTRATOS)
+        self.contagem = np.zeros((n_dias, n_estratos), dtype=np.int64)
+        self.media = np.full((n_dias, n_estratos), np.nan)
+        self.grupos = grupos
+        if grupos is not None:
+            self.n_grupos = n_grupos if n_grupos is not None else int(grupos.max()) + 1
+            self.contingencia = np.zeros((n_dias, self.n_grupos, n_estratos), dtype=np.int64)
+
+    def registrar(self, dia, pontuacoes):
+        estratos = classificar(pontuacoes, self.limiares)
+        n_estratos = len(ESTRATOS)
+        if self.grupos is not None:
+            self.contingencia[dia] = contingencia(self.grupos, estratos, self.n_grupos, n_estratos)
+            self.contagem[dia] = self.contingencia[dia].sum(axis=0)
+        else:
+            self.contagem[dia] = np.bincount(estratos, minlength=n_estratos)
+        soma = np.bincount(estratos, weights=pontuacoes, minlength=n_estratos)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.media[dia] = soma / self.contagem[dia]
+
+
+class RegistroMomentos(Registrador):
+    """Momentos das características e da mobilidade até o dia, por classe × estrato do dia.
+
+    Nos dias registrados (a cada `intervalo` dias e sempre no último; sem
+    `intervalo`, só no último) acumula num `Momentos` as `caracteristicas`
+    da população e a mobilidade até ali (pontuação do dia menos a inicial),
+    agrupadas pelo código classe × n_estratos + estrato, lendo a população
+    em blocos de `tamanho_bloco` pessoas. Guarda O(dias registrados × grupos
+    × k²) valores; `momentos(dia)` devolve os de um dia.
+    """
+
+    _estado = ('contagem', 'media', 'comomentos', 'minimo', 'maximo')
+
+    def __init__(self, populacao, caracteristicas, n_dias, limiares=LIMIARES_ESTRATO, intervalo=None,
+                 tamanho_bloco=TAMANHO_BLOCO):
+        self.populacao = populacao
+        self.caracteristicas = list(caracteristicas)
+        self.nomes = self.caracteristicas + ['mobilidade']
+        self.limiares = limiares
+        self.tamanho_bloco = tamanho_bloco
+        self.dias = sorted(set(range(0, n_dias, intervalo)) | {n_dias - 1}) if intervalo else [n_dias - 1]
+        self._posicao = {dia: i for i, dia in enumerate(self.dias)}
+        self.n_grupos = len(CATEGORIAS['classe_socioeconomica']) * len(ESTRATOS)
+        vazio = Momentos(self.nomes, self.n_grupos)
+        for nome in self._estado:
+            valores = getattr(vazio, nome)
+            setattr(self, nome, np.repeat(valores[None], len(self.dias), axis=0))
+
+    def registrar(self, dia, pontuacoes):
+        if dia not in self._posicao:
+            return
+        momentos = Momentos(self.nomes, self.n_grupos)
+        classes = self.populacao['classe_socioeconomica']
+        inicial = self.populacao['pontuacao_inicial']
+        for inicio in range(0, len(pontuacoes), self.tamanho_bloco):
+            fatia = slice(inicio, inicio + self.tamanho_bloco)
+            valores = np.stack([self.populacao[nome][fatia] for nome in self.caracteristicas]
+                               + [pontuacoes[fatia] - inicial[fatia]]).T
+            grupos = classes[fatia].astype(np.intp) * len(ESTRATOS) + classificar(pontuacoes[fatia], self.limiares)
+            momentos.atualizar(valores, grupos)
+        i = self._posicao[dia]
+        for nome in self._estado:
+            getattr(self, nome)[i] = getattr(momentos, nome)
+
+    def momentos(self, dia=None):
+        i = self._posicao[self.dias[-1] if dia is None else dia]
+        return Momentos.de_estado(self.nomes, {nome: getattr(self, nome)[i] for nome in self._estado})
+
@@ -0,0 +1,322 @@
+"""Marcação de conceitos em textos e índice invertido conceito → documentos.
+
+`MarcadorConceitos` compila o vocabulário (rótulo → formas, incluindo os
+sinônimos) num único autômato sobre o texto normalizado — sem acentos, em
+minúsculas, com espaços colapsados. Sem dependências extras, as formas
+viram uma trie e a trie uma única expressão regular: em cada posição do
+texto só o ramo do próximo caractere é tentado, em vez de uma alternativa
+por conceito. Com `pyahocorasick` instalado, o motor 'auto' usa um
+autômato Aho-Corasick. Nos dois casos cada documento é percorrido uma vez,
+qualquer que seja o tamanho do vocabulário.
+
+`indexar` marca os documentos em lotes num pool de processos e acumula um
+`IndiceInvertido`: os documentos de cada conceito (em CSR, ordenados) e a
+matriz de coocorrência entre conceitos, cuja diagonal é o número de
+documentos que mencionam cada um — a mesma contagem de `contar_conceitos`.
+"""
+import json
+import os
+import re
+import unicodedata
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+import scipy.sparse as sp
+
+from socialdive import instrumentacao
+from socialdive.literatura import ARTIGOS, SINONIMOS, contar_conceitos, contar_impactos
+
+MOTORES = ('auto', 'regex', 'ahocorasick')
+TAMANHO_LOTE = 2000
+
+_ACENTOS = re.compile(r'[\u0300-\u036f]')
+_ESPACOS = re.compile(r'\s+')
+
+
+def normalizar(texto):
+    """Texto sem acentos, em minúsculas e com espaços colapsados."""
+    return _ESPACOS.sub(' ', _ACENTOS.sub('', unicodedata.normalize('NFKD', texto)).casefold())
+
+
+def vocabulario_artigos(artigos=ARTIGOS, sinonimos=SINONIMOS):
+    """Rótulo → formas de cada conceito-chave e impacto dos artigos, com os sinônimos."""
+    positivos, negativos = contar_impactos(artigos)
+    rotulos = dict.fromkeys([*contar_conceitos(artigos), *positivos, *negativos])
+    return {rotulo: [rotulo, *sinonimos.get(rotulo, [])] for rotulo in rotulos}
+
+
+def _ahocorasick_disponivel():
+    import importlib.util
+
+    return importlib.util.find_spec('ahocorasick') is not None
+
+
+def _padrao_trie(formas):
+    """Expressão regular equivalente à alternativa das formas, fatorada pelos prefixos comuns."""
+    trie = {}
+    for forma in formas:
+        no = trie
+        for caractere in forma:
+            no = no.setdefault(caractere, {})
+        no[''] = {}
+
+    def padrao(no):
+        ramos = [re.escape(caractere) + padrao(filho) for caractere, filho in sorted(no.items()) if caractere]
+        if not ramos:
+            return ''
+        corpo = ramos[0] if len(ramos) == 1 else '(?:' + '|'.join(ramos) + ')'
+        # Quantificador guloso: a forma mais longa é tentada primeiro
+        return f'(?:{corpo})?' if '' in no else corpo
+
+    return padrao(trie)
+
+
+class MarcadorConceitos:
+    """Encontra, numa única passada por texto, os rótulos do vocabulário que ele menciona.
+
+    `vocabulario` mapeia rótulo → formas; as formas são comparadas já
+    normalizadas e só como palavras inteiras. Uma ocorrência marca também
+    os rótulos das formas contidas nela ('vigilância e controle social'
+    menciona 'vigilância e controle'), como faria uma busca por rótulo;
+    formas sobrepostas ('... controle social media addiction') são todas
+    encontradas, pelos dois motores.
+    """
+
+    def __init__(self, vocabulario=None, motor='auto'):
+        if motor not in MOTORES:
+            raise ValueError(f"Motor desconhecido: {motor!r}. Opções: {', '.join(MOTORES)}")
+        if motor == 'auto':
+            motor = 'ahocorasick' if _ahocorasick_disponivel() else 'regex'
+        self.vocabulario = vocabulario_artigos() if vocabulario is None else vocabulario
+        self.motor = motor
+        self.rotulos = list(self.vocabulario)
+
+        formas = {}
+        for codigo, rotulo in enumerate(self.rotulos):
+            for forma in self.vocabulario[rotulo]:
+                formas.setdefault(normalizar(forma), set()).add(codigo)
+        # Fecho por contenção: cada forma carrega os códigos das formas que aparecem dentro dela
+        self._codigos = {}
+        for forma in formas:
+            contidos = set()
+            for outra, codigos in formas.items():
+                if re.search(rf'(?<!\w){re.escape(outra)}(?!\w)', forma):
+                    contidos |= codigos
+            self._codigos[forma] = tuple(sorted(contidos))
+
+        if motor == 'ahocorasick':
+            import ahocorasick
+
+            self._automato = ahocorasick.Automaton()
+            for forma, codigos in self._codigos.items():
+                self._automato.add_word(forma, (len(forma), codigos))
+            self._automato.make_automaton()
+        else:
+            # Captura dentro de um lookahead: a busca recomeça no caractere seguinte, não no fim da
+            # ocorrência, então formas que começam dentro de outra também são encontradas
+            self._regex = re.compile(rf'(?<!\w)(?=({_padrao_trie(self._codigos)})(?!\w))')
+
+    def marcar(self, texto):
+        """Códigos (índices em `rotulos`) mencionados no texto, ordenados e sem repetição."""
+        texto = normalizar(texto)
+        encontrados = set()
+        if self.motor == 'regex':
+            for ocorrencia in self._regex.finditer(texto):
+                encontrados.update(self._codigos[ocorrencia.group(1)])
+        else:
+            for fim, (tamanho, codigos) in self._automato.iter(texto):
+                inicio = fim - tamanho + 1
+                # O autômato acha formas dentro de palavras; só valem as palavras inteiras
+                if (inicio == 0 or not _palavra(texto[inicio - 1])) and \
+                        (fim + 1 == len(texto) or not _palavra(texto[fim + 1])):
+                    encontrados.update(codigos)
+        return sorted(encontrados)
+
+    def rotulos_em(self, texto):
+        return [self.rotulos[codigo] for codigo in self.marcar(texto)]
+
+
+def _palavra(caractere):
+    return caractere.isalnum() or caractere == '_'
+
+
+class IndiceInvertido:
+    """Documentos que mencionam cada rótulo e coocorrência entre rótulos, acumulados lote a lote.
+
+    Os documentos são identificados por inteiros (a posição na sequência
+    passada a `indexar`). Índices parciais de outros lotes ou processos
+    são somados com `combinar`.
+    """
+
+    def __init__(self, rotulos):
+        self.rotulos = list(rotulos)
+        self._codigo = {rotulo: codigo for codigo, rotulo in enumerate(self.rotulos)}
+        self.coocorrencia = np.zeros((len(self.rotulos), len(self.rotulos)), dtype=np.int64)
+        self.n_documentos = 0
+        self._ids = []
+        self._codigos = []
+        self._indptr = None
+
+    def adicionar(self, ids, codigos, n_documentos):
+        """Acrescenta os pares (documento, código) de um lote com `n_documentos` documentos.
+
+        Cada par deve aparecer uma única vez (como em `MarcadorConceitos.marcar`).
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        codigos = np.asarray(codigos, dtype=np.int32)
+        if len(ids):
+            # Matriz documento × rótulo do lote; a coocorrência é o seu produto interno
+            _, linhas = np.unique(ids, return_inverse=True)
+            presenca = sp.csr_matrix((np.ones(len(ids), dtype=np.int64), (linhas, codigos)),
+                                     shape=(linhas.max() + 1, len(self.rotulos)))
+            self.coocorrencia += (presenca.T @ presenca).toarray()
+            self._ids.append(ids)
+            self._codigos.append(codigos)
+            self._indptr = None
+        self.n_documentos += n_documentos
+
+    def combinar(self, outro):
+        """Soma um índice com os mesmos rótulos e documentos distintos a este."""
+        if outro.rotulos != self.rotulos:
+            raise ValueError("Índices com vocabulários diferentes não podem ser combinados.")
+        self.coocorrencia += outro.coocorrencia
+        self.n_documentos += outro.n_documentos
+        self._ids.extend(outro._ids)
+        self._codigos.extend(outro._codigos)
+        self._indptr = None
+        return self
+
+    def _postagens(self):
+        # Consolida os lotes numa CSR rótulo → documentos ordenados (refeita só após novos lotes)
+        if self._indptr is None:
+            ids = np.concatenate(self._ids) if self._ids else np.empty(0, dtype=np.int64)
+            codigos = np.concatenate(self._codigos) if self._codigos else np.empty(0, dtype=np.int32)
+            ordem = np.lexsort((ids, codigos))
+            self._ids, self._codigos = [ids[ordem]], [codigos[ordem]]
+            self._indptr = np.zeros(len(self.rotulos) + 1, dtype=np.int64)
+            np.cumsum(np.bincount(codigos, minlength=len(self.rotulos)), out=self._indptr[1:])
+        return self._indptr, self._ids[0]
+
+    def documentos(self, *rotulos):
+        """Documentos que mencionam todos os rótulos dados, em ordem crescente."""
+        indptr, ids = self._postagens()
+        resultado = None
+        for rotulo in rotulos:
+            codigo = self._codigo[rotulo]
+            postagem = ids[indptr[codigo]:indptr[codigo + 1]]
+            resultado = postagem if resultado is None else np.intersect1d(resultado, postagem, assume_unique=True)
+        return np.empty(0, dtype=np.int64) if resultado is None else resultado
+
+    def frequencias(self):
+        """Counter rótulo → número de documentos que o mencionam."""
+        return Counter({rotulo: int(n) for rotulo, n in zip(self.rotulos, np.diag(self.coocorrencia)) if n})
+
+    def pares_frequentes(self, n=10):
+        """Os `n` pares de rótulos mencionados juntos em mais documentos: [((a, b), documentos)]."""
+        linhas, colunas = np.triu_indices(len(self.rotulos), k=1)
+        contagens = self.coocorrencia[linhas, colunas]
+        ordem = np.argsort(-contagens, kind='stable')[:n]
+        return [((self.rotulos[linhas[i]], self.rotulos[colunas[i]]), int(contagens[i]))
+                for i in ordem if contagens[i]]
+
+
+def ler_textos(caminho):
+    """Gera os textos de um corpus, um por documento.
+
+    Arquivos .jsonl trazem objetos com 'texto' ou páginas gravadas por
+    `ingestao.gravar_paginas`; os demais são texto puro, um documento por linha.
+    """
+    with open(caminho, encoding='utf-8') as arquivo:
+        if not caminho.endswith('.jsonl'):
+            for linha in arquivo:
+                yield linha.rstrip('\n')
+            return
+        for linha in arquivo:
+            registro = json.loads(linha)
+            if 'itens' in registro:
+                for item in registro['itens']:
+                    yield item['texto']
+            else:
+                yield registro['texto']
+
+
+_marcador_processo = None
+
+
+def _iniciar_processo(vocabulario, motor):
+    global _marcador_processo
+    _marcador_processo = MarcadorConceitos(vocabulario, motor)
+
+
+def _marcar_lote(lote, marcador=None):
+    marcador = marcador or _marcador_processo
+    ids, codigos = [], []
+    for id_documento, texto in lote:
+        encontrados = marcador.marcar(texto)
+        ids.extend([id_documento] * len(encontrados))
+        codigos.extend(encontrados)
+    return np.array(ids, dtype=np.int64), np.array(codigos, dtype=np.int32), len(lote)
+
+
+def _lotes(textos, tamanho_lote):
+    lote = []
+    for id_documento, texto in enumerate(textos):
+        lote.append((id_documento, texto))
+        if len(lote) == tamanho_lote:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
+
+
+def indexar_citacoes(artigos=ARTIGOS, marcador=None):
+    """`IndiceInvertido` em que o documento i é o artigo i, marcado pelo texto das suas citações.
+
+    Cada citação é marcada à parte (uma forma não atravessa duas citações);
+    o artigo menciona um rótulo se alguma das suas citações o menciona.
+    """
+    marcador = MarcadorConceitos() if marcador is None else marcador
+    indice = IndiceInvertido(marcador.rotulos)
+    ids, codigos = [], []
+    for id_artigo, artigo in enumerate(artigos):
+        encontrados = sorted({codigo for citacao in artigo['citacoes'] for codigo in marcador.marcar(citacao)})
+        ids.extend([id_artigo] * len(encontrados))
+        codigos.extend(encontrados)
+    indice.adicionar(ids, codigos, len(artigos))
+    return indice
+
+
+def indexar(textos, marcador=None, processos=None, tamanho_lote=TAMANHO_LOTE):
+    """Marca uma sequência (ou gerador) de textos e retorna o `IndiceInvertido`.
+
+    O documento i é o i-ésimo texto. Com `processos` > 1 (padrão: um por
+    CPU) os lotes são marcados num pool de processos, cada um com o seu
+    marcador compilado; no máximo dois lotes por processo ficam em voo,
+    então a memória não cresce com o tamanho do corpus.
+    """
+    marcador = MarcadorConceitos() if marcador is None else marcador
+    indice = IndiceInvertido(marcador.rotulos)
+    n_processos = (os.cpu_count() or 1) if processos is None else processos
+
+    def acumular(resultado):
+        indice.adicionar(*resultado)
+        instrumentacao.contar('documentos_indexados', resultado[2])
+
+    if n_processos <= 1:
+        for lote in _lotes(textos, tamanho_lote):
+            acumular(_marcar_lote(lote, marcador))
+        return indice
+
+    with ProcessPoolExecutor(n_processos, initializer=_iniciar_processo,
+                             initargs=(marcador.vocabulario, marcador.motor)) as executor:
+        em_voo = set()
+        for lote in _lotes(textos, tamanho_lote):
+            if len(em_voo) >= 2 * n_processos:
+                feitos, em_voo = wait(em_voo, return_when=FIRST_COMPLETED)
+                for futuro in feitos:
+                    acumular(futuro.result())
+            em_voo.add(executor.submit(_marcar_lote, lote))
+        for futuro in em_voo:
+            acumular(futuro.result())
+    return indice
@@ -0,0 +1,284 @@
+"""Ingestão de submissões e comentários do Reddit para as contagens das ANÁLISES 1 e 2.
+
+A coleta é um pipeline de geradores:
+
+    coletar(cliente, subreddits)  →  gravar_paginas(..., 'paginas.jsonl')  →  itens(...)  →  ContagemIncremental
+
+`coletar` busca as páginas (listagens de até 100 submissões e a árvore de
+comentários de cada submissão) num pool limitado de threads: a API é
+dominada pela latência de rede, então várias requisições em voo
+multiplicam a vazão. Todas passam por um balde de fichas (`LimiteTaxa`)
+compartilhado entre as threads, que mantém a média dentro do limite da
+API. Os comentários pendentes têm prioridade sobre novas listagens, então
+a fila de trabalho nunca passa de uma página de submissões por subreddit e
+a memória não cresce com o volume coletado: cada página é contada e
+descartada.
+
+As páginas brutas podem ser gravadas em JSONL ao passar pelo pipeline; o
+`ClienteGravado` responde às mesmas requisições a partir desse arquivo,
+sem rede — é o substituto offline da API para replay e benchmarks.
+`ClienteReddit` usa praw (importado só aqui), com credenciais de
+REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET e REDDIT_USER_AGENT no ambiente ou
+no `.env` (lido com python-dotenv, se instalado).
+"""
+import json
+import os
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from socialdive import instrumentacao
+from socialdive.indice import MarcadorConceitos, vocabulario_artigos
+from socialdive.literatura import ARTIGOS, contar_conceitos, contar_impactos
+
+POR_PAGINA = 100  # máximo de itens por listagem da API
+REQUISICOES_POR_MINUTO = 100  # limite da API para clientes OAuth
+
+
+def _praw():
+    try:
+        import praw
+    except ImportError:
+        raise ImportError("A coleta do Reddit requer praw (pip install praw).") from None
+    return praw
+
+
+def _carregar_env(arquivo_env):
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv(arquivo_env)
+
+
+class LimiteTaxa:
+    """Balde de fichas compartilhado entre threads: `por_minuto` requisições em média, rajadas de até `rajada`.
+
+    Com `por_minuto=None` não limita (replay de gravações).
+    """
+
+    def __init__(self, por_minuto=REQUISICOES_POR_MINUTO, rajada=10):
+        self.taxa = None if por_minuto is None else por_minuto / 60
+        self.capacidade = rajada
+        self._fichas = float(rajada)
+        self._ultimo = time.monotonic()
+        self._trava = threading.Lock()
+
+    def aguardar(self):
+        if self.taxa is None:
+            return
+        with self._trava:
+            agora = time.monotonic()
+            self._fichas = min(self.capacidade, self._fichas + (agora - self._ultimo) * self.taxa)
+            self._ultimo = agora
+            # A ficha é reservada já (o saldo pode ficar negativo): quem chega depois espera mais
+            self._fichas -= 1
+            espera = -self._fichas / self.taxa if self._fichas < 0 else 0
+        if espera:
+            time.sleep(espera)
+
+
+def _submissao(submissao, subreddit):
+    return {'tipo': 'submissao', 'id': submissao.id, 'nome': submissao.fullname, 'subreddit': subreddit,
+            'criado': submissao.created_utc, 'n_comentarios': submissao.num_comments,
+            'texto': f"{submissao.title}\n{submissao.selftext}"}
+
+
+def _comentario(comentario, subreddit):
+    return {'tipo': 'comentario', 'id': comentario.id, 'subreddit': subreddit,
+            'criado': comentario.created_utc, 'texto': comentario.body}
+
+
+class ClienteReddit:
+    """Requisições à API do Reddit por praw, uma instância por thread (praw não é seguro entre threads).
+
+    O praw também respeita os cabeçalhos de limite da API; `LimiteTaxa`
+    apenas evita que as threads os esgotem em rajada.
+    """
+
+    def __init__(self, client_id=None, client_secret=None, user_agent=None, arquivo_env='.env'):
+        _carregar_env(arquivo_env)
+        self._credenciais = {
+            'client_id': client_id or os.environ.get('REDDIT_CLIENT_ID'),
+            'client_secret': client_secret or os.environ.get('REDDIT_CLIENT_SECRET'),
+            'user_agent': user_agent or os.environ.get('REDDIT_USER_AGENT', 'socialdive'),
+        }
+        if not (self._credenciais['client_id'] and self._credenciais['client_secret']):
+            raise ValueError("Credenciais do Reddit ausentes: defina REDDIT_CLIENT_ID e REDDIT_CLIENT_SECRET "
+                             "no ambiente ou no .env.")
+        self._local = threading.local()
+
+    def _reddit(self):
+        reddit = getattr(self._local, 'reddit', None)
+        if reddit is None:
+            reddit = self._local.reddit = _praw().Reddit(check_for_async=False, **self._credenciais)
+        return reddit
+
+    def submissoes(self, subreddit, depois=None):
+        """Uma página das submissões mais novas; retorna (itens, cursor da próxima página ou None)."""
+        listagem = self._reddit().subreddit(subreddit).new(limit=POR_PAGINA,
+                                                           params={'after': depois} if depois else {})
+        itens = [_submissao(submissao, subreddit) for submissao in listagem]
+        return itens, itens[-1]['nome'] if len(itens) == POR_PAGINA else None
+
+    def comentarios(self, subreddit, id_submissao):
+        """Todos os comentários já carregados de uma submissão (sem expandir 'mais comentários')."""
+        submissao = self._reddit().submission(id=id_submissao)
+        submissao.comments.replace_more(limit=0)
+        return [_comentario(comentario, subreddit) for comentario in submissao.comments.list()]
+
+
+class ClienteGravado:
+    """Substituto offline da API: responde com as páginas gravadas por `gravar_paginas`.
+
+    Só a posição de cada página no arquivo fica em memória; o conteúdo é
+    lido a cada requisição. `latencia` (segundos) simula o tempo de ida e
+    volta da rede. Requisições que não estão na gravação recebem uma
+    página vazia, como uma listagem esgotada.
+    """
+
+    def __init__(self, caminho, latencia=0.0):
+        self.caminho = caminho
+        self.latencia = latencia
+        self._posicoes = {}
+        with open(caminho, 'rb') as arquivo:
+            posicao = 0
+            for linha in arquivo:
+                self._posicoes[tuple(json.loads(linha)['requisicao'])] = (posicao, len(linha))
+                posicao += len(linha)
+        self._arquivo = open(caminho, 'rb')
+        self._trava = threading.Lock()
+
+    @property
+    def subreddits(self):
+        """Subreddits cuja primeira página está na gravação, na ordem em que foram gravados."""
+        return [requisicao[1] for requisicao in self._posicoes
+                if requisicao[0] == 'submissoes' and requisicao[2] is None]
+
+    def _pagina(self, requisicao):
+        if self.latencia:
+            time.sleep(self.latencia)
+        if requisicao not in self._posicoes:
+            return {'itens': [], 'depois': None}
+        posicao, tamanho = self._posicoes[requisicao]
+        with self._trava:
+            self._arquivo.seek(posicao)
+            linha = self._arquivo.read(tamanho)
+        return json.loads(linha)
+
+    def submissoes(self, subreddit, depois=None):
+        pagina = self._pagina(('submissoes', subreddit, depois))
+        return pagina['itens'], pagina['depois']
+
+    def comentarios(self, subreddit, id_submissao):
+        return self._pagina(('comentarios', subreddit, id_submissao))['itens']
+
+    def fechar(self):
+        self._arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.fechar()
+
+
+def coletar(cliente, subreddits, limite=1000, comentarios=True, max_workers=8, limite_taxa=None):
+    """Gera as páginas de até `limite` submissões por subreddit e, se pedido, dos seus comentários.
+
+    Cada página é um dict {'requisicao', 'itens', 'depois'}, entregue na
+    ordem em que as requisições terminam (as contagens não dependem da
+    ordem). No máximo `max_workers` requisições ficam em voo, e o gerador
+    só busca mais quando as páginas entregues são consumidas.
+    """
+    limite_taxa = LimiteTaxa() if limite_taxa is None else limite_taxa
+
+    def buscar(requisicao):
+        limite_taxa.aguardar()
+        if requisicao[0] == 'submissoes':
+            itens, depois = cliente.submissoes(requisicao[1], requisicao[2])
+        else:
+            itens, depois = cliente.comentarios(requisicao[1], requisicao[2]), None
+        return {'requisicao': list(requisicao), 'itens': itens, 'depois': depois}
+
+    restantes = dict.fromkeys(subreddits, limite)
+    listagens = deque(('submissoes', subreddit, None) for subreddit in restantes)
+    pendentes = deque()
+    em_voo = set()
+    with ThreadPoolExecutor(max_workers) as executor:
+        while listagens or pendentes or em_voo:
+            # Comentários antes de novas listagens: a fila de pendentes não cresce além de uma página
+            while len(em_voo) < max_workers and (pendentes or listagens):
+                em_voo.add(executor.submit(buscar, (pendentes or listagens).popleft()))
+            feitas, em_voo = wait(em_voo, return_when=FIRST_COMPLETED)
+            for futura in feitas:
+                pagina = futura.result()
+                tipo, subreddit = pagina['requisicao'][:2]
+                if tipo == 'submissoes':
+                    pagina['itens'] = pagina['itens'][:restantes[subreddit]]
+                    restantes[subreddit] -= len(pagina['itens'])
+                    if pagina['depois'] and restantes[subreddit] > 0:
+                        listagens.append(('submissoes', subreddit, pagina['depois']))
+                    if comentarios:
+                        pendentes.extend(('comentarios', subreddit, item['id']) for item in pagina['itens']
+                                         if item.get('n_comentarios', 1))
+                instrumentacao.contar('reddit_requisicoes')
+                yield pagina
+
+
+def gravar_paginas(paginas, caminho):
+    """Repassa as páginas adiante e grava cada uma como uma linha de `caminho` (JSONL), para replay."""
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        for pagina in paginas:
+            arquivo.write(json.dumps(pagina, ensure_ascii=False) + '\n')
+            yield pagina
+
+
+def itens(paginas):
+    """Achata as páginas em itens (submissões e comentários)."""
+    for pagina in paginas:
+        instrumentacao.contar('reddit_itens', len(pagina['itens']))
+        yield from pagina['itens']
+
+
+class ContagemIncremental:
+    """Contagens de conceitos e impactos dos artigos, atualizadas item a item.
+
+    Como em `contar_conceitos`, um item conta uma vez para cada conceito ou
+    impacto que menciona, por qualquer das suas formas (`MarcadorConceitos`:
+    uma passada por texto). A memória é a dos contadores, limitada pelo
+    tamanho do vocabulário.
+    """
+
+    def __init__(self, artigos=ARTIGOS, marcador=None):
+        positivos, negativos = contar_impactos(artigos)
+        self.marcador = MarcadorConceitos(vocabulario_artigos(artigos)) if marcador is None else marcador
+        self.conceitos = Counter()
+        self.impactos_positivos = Counter()
+        self.impactos_negativos = Counter()
+        self.n_itens = 0
+        # Contadores em que cada código do marcador entra (um rótulo pode ser conceito e impacto)
+        self._destinos = [[contador for contador, vocabulario in ((self.conceitos, contar_conceitos(artigos)),
+                                                                   (self.impactos_positivos, positivos),
+                                                                   (self.impactos_negativos, negativos))
+                           if rotulo in vocabulario]
+                          for rotulo in self.marcador.rotulos]
+
+    def atualizar(self, texto):
+        for codigo in self.marcador.marcar(texto):
+            for contador in self._destinos[codigo]:
+                contador[self.marcador.rotulos[codigo]] += 1
+        self.n_itens += 1
+
+    def consumir(self, itens):
+        for item in itens:
+            self.atualizar(item['texto'])
+        return self
+
+    def combinar(self, outra):
+        """Soma as contagens de outra `ContagemIncremental` (ex.: de outra coleta) a esta."""
+        for nome in ('conceitos', 'impactos_positivos', 'impactos_negativos'):
+            getattr(self, nome).update(getattr(outra, nome))
+        self.n_itens += outra.n_itens
+        return self
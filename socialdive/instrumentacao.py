@@ -0,0 +1,229 @@
+"""Instrumentação da execução: tempo e memória por estágio, contadores e perfil.
+
+Os estágios são medidos com `estagio(nome)` (aninháveis: o nome registrado
+é o caminho, ex.: 'simulacao/laco_diario'); os laços quentes incrementam
+contadores com `contar(nome, n)`, uma chamada por dia ou por lote, nunca
+por pessoa. Tudo passa pela instrumentação ativa do módulo, que por padrão
+é uma versão nula cujos métodos não fazem nada — desligada, o custo é uma
+chamada de método vazia por iteração.
+
+    with ativar(Instrumentacao(memoria='tracemalloc')) as instr:
+        with estagio('simulacao'):
+            ...
+    instr.salvar('relatorio.json')
+
+Memória: 'rss' registra a memória residente do processo no fim de cada
+estágio e o pico do processo até ali (quase sem custo); 'tracemalloc'
+registra o pico de alocações Python/NumPy dentro de cada estágio, ao custo
+de deixar as alocações bem mais lentas. `perfil` liga cProfile (funções
+mais caras no relatório JSON) ou pyinstrument (HTML ao lado do relatório),
+se instalado.
+"""
+import contextlib
+import json
+import os
+import sys
+import time
+
+_MB = 1 << 20
+
+
+def _rss_bytes():
+    """Memória residente atual do processo, ou None se não houver como medir."""
+    try:
+        with open('/proc/self/statm') as arquivo:
+            return int(arquivo.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _pico_rss_bytes():
+    try:
+        import resource
+    except ImportError:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa em KiB, macOS em bytes
+    return pico if sys.platform == 'darwin' else pico * 1024
+
+
+def _em_mb(valor):
+    return None if valor is None else round(valor / _MB, 2)
+
+
+class _Nula:
+    """Instrumentação desligada: todos os métodos são no-op."""
+
+    ativa = False
+
+    def estagio(self, nome):
+        return contextlib.nullcontext()
+
+    def contar(self, nome, n=1):
+        pass
+
+    def anotar(self, nome, valor):
+        pass
+
+
+class Instrumentacao:
+    """Coleta tempos, memória e contadores de uma execução.
+
+    `memoria` é 'rss', 'tracemalloc' ou None; `perfil` é None, 'cprofile'
+    ou 'pyinstrument'.
+    """
+
+    ativa = True
+
+    def __init__(self, memoria='rss', perfil=None):
+        if memoria not in ('rss', 'tracemalloc', None):
+            raise ValueError(f"Medição de memória desconhecida: {memoria!r}. Opções: rss, tracemalloc.")
+        if perfil not in ('cprofile', 'pyinstrument', None):
+            raise ValueError(f"Perfilador desconhecido: {perfil!r}. Opções: cprofile, pyinstrument.")
+        self.memoria = memoria
+        self.perfil = perfil
+        self.estagios = []
+        self.contadores = {}
+        self.anotacoes = {}
+        self._pilha = []
+        self._perfilador = None
+        self._inicio = None
+        self.duracao = None
+
+    # Ciclo de vida (ver `ativar`)
+    def iniciar(self):
+        self._inicio = time.perf_counter()
+        if self.memoria == 'tracemalloc':
+            import tracemalloc
+
+            tracemalloc.start()
+        if self.perfil == 'cprofile':
+            import cProfile
+
+            self._perfilador = cProfile.Profile()
+            self._perfilador.enable()
+        elif self.perfil == 'pyinstrument':
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                print("Aviso: pyinstrument não está instalado. Execução sem perfil.")
+                self.perfil = None
+            else:
+                self._perfilador = Profiler()
+                self._perfilador.start()
+
+    def parar(self):
+        if self._perfilador is not None:
+            if self.perfil == 'cprofile':
+                self._perfilador.disable()
+            else:
+                self._perfilador.stop()
+        if self.memoria == 'tracemalloc':
+            import tracemalloc
+
+            tracemalloc.stop()
+        self.duracao = time.perf_counter() - self._inicio
+
+    @contextlib.contextmanager
+    def estagio(self, nome):
+        caminho = f"{self._pilha[-1]['estagio']}/{nome}" if self._pilha else nome
+        registro = {'estagio': caminho, 'pico_alocado': 0}
+        if self.memoria == 'tracemalloc':
+            import tracemalloc
+
+            # O pico do estágio pai até aqui fica guardado; cada estágio mede o seu a partir do zero
+            if self._pilha:
+                self._pilha[-1]['pico_alocado'] = max(self._pilha[-1]['pico_alocado'],
+                                                      tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        self._pilha.append(registro)
+        # Registrado na entrada: o relatório lista os estágios na ordem em que começaram
+        resultado = {'estagio': caminho}
+        self.estagios.append(resultado)
+        inicio, inicio_cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            resultado['duracao_s'] = round(time.perf_counter() - inicio, 6)
+            resultado['cpu_s'] = round(time.process_time() - inicio_cpu, 6)
+            self._pilha.pop()
+            if self.memoria == 'tracemalloc':
+                import tracemalloc
+
+                pico = max(registro['pico_alocado'], tracemalloc.get_traced_memory()[1])
+                resultado['pico_alocado_mb'] = _em_mb(pico)
+                if self._pilha:
+                    self._pilha[-1]['pico_alocado'] = max(self._pilha[-1]['pico_alocado'], pico)
+            elif self.memoria == 'rss':
+                resultado['rss_mb'] = _em_mb(_rss_bytes())
+                resultado['pico_rss_mb'] = _em_mb(_pico_rss_bytes())
+
+    def contar(self, nome, n=1):
+        self.contadores[nome] = self.contadores.get(nome, 0) + int(n)
+
+    def anotar(self, nome, valor):
+        """Guarda um valor qualquer serializável em JSON (ex.: tempos medidos em outro processo)."""
+        self.anotacoes[nome] = valor
+
+    def _funcoes_mais_caras(self, n=25):
+        import pstats
+
+        estatisticas = pstats.Stats(self._perfilador)
+        linhas = []
+        for (arquivo, linha, funcao), (_, chamadas, proprio, cumulativo, _) in estatisticas.stats.items():
+            linhas.append({'funcao': f'{os.path.basename(arquivo)}:{linha}({funcao})', 'chamadas': chamadas,
+                           'tempo_proprio_s': round(proprio, 6), 'tempo_cumulativo_s': round(cumulativo, 6)})
+        return sorted(linhas, key=lambda item: item['tempo_cumulativo_s'], reverse=True)[:n]
+
+    def relatorio(self):
+        """Relatório como dict serializável em JSON."""
+        relatorio = {
+            'duracao_s': None if self.duracao is None else round(self.duracao, 6),
+            'memoria': self.memoria,
+            'pico_rss_mb': _em_mb(_pico_rss_bytes()),
+            'estagios': self.estagios,
+            'contadores': dict(self.contadores),
+        }
+        relatorio.update(self.anotacoes)
+        if self.perfil == 'cprofile' and self._perfilador is not None:
+            relatorio['perfil'] = self._funcoes_mais_caras()
+        return relatorio
+
+    def salvar(self, caminho):
+        """Grava o relatório JSON em `caminho` (e o HTML do pyinstrument ao lado, se usado)."""
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            json.dump(self.relatorio(), arquivo, ensure_ascii=False, indent=2)
+        if self.perfil == 'pyinstrument' and self._perfilador is not None:
+            with open(os.path.splitext(caminho)[0] + '.html', 'w', encoding='utf-8') as arquivo:
+                arquivo.write(self._perfilador.output_html())
+
+
+_atual = _Nula()
+
+
+@contextlib.contextmanager
+def ativar(instrumentacao):
+    """Torna `instrumentacao` a ativa do módulo durante o bloco `with`."""
+    global _atual
+    anterior = _atual
+    _atual = instrumentacao
+    instrumentacao.iniciar()
+    try:
+        yield instrumentacao
+    finally:
+        instrumentacao.parar()
+        _atual = anterior
+
+
+def estagio(nome):
+    """Mede o bloco `with` como um estágio da instrumentação ativa."""
+    return _atual.estagio(nome)
+
+
+def contar(nome, n=1):
+    """Incrementa um contador da instrumentação ativa (no-op se desligada)."""
+    _atual.contar(nome, n)
+
+
+def anotar(nome, valor):
+    _atual.anotar(nome, valor)
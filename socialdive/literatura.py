@@ -0,0 +1,171 @@
+"""Análise qualitativa dos artigos sobre impacto social das redes sociais (ANÁLISES 1 e 2)."""
+from collections import Counter
+
+# Dados dos artigos fornecidos
+ARTIGOS = [
+    {
+        'titulo': 'O efeito da rede social em nosso cotidiano',
+        'fonte': 'Brasil Escola',
+        'url': 'https://meuartigo.brasilescola.uol.com.br/sociologia/o-efeito-rede-social-nosso-cotidiano.htm',
+        'conceitos_chave': [
+            'Relacionamentos horizontais',
+            'Diminuição de hierarquias',
+            'Redução de preconceitos',
+            'Controle de uso',
+            'Dependência digital'
+        ],
+        'citacoes': [
+            'As redes sociais permitem relacionamentos mais horizontais, diminuindo hierarquias.',
+            'O uso descontrolado pode levar a perdas significativas na qualidade de vida.',
+            'As redes sociais podem tanto aproximar quanto afastar pessoas.'
+        ],
+        'impactos_positivos': [
+            'Facilidade de comunicação',
+            'Democratização da informação',
+            'Diminuição de hierarquias sociais'
+        ],
+        'impactos_negativos': [
+            'Dependência digital',
+            'Isolamento social físico',
+            'Ansiedade e depressão'
+        ]
+    },
+    {
+        'titulo': 'Echo Chambers on Social Media: A comparative analysis',
+        'fonte': 'arXiv',
+        'url': 'https://arxiv.org/abs/2004.09603',
+        'conceitos_chave': [
+            'Câmaras de eco',
+            'Bolhas informacionais',
+            'Polarização',
+            'Viés de confirmação',
+            'Algoritmos de recomendação'
+        ],
+        'citacoes': [
+            'Usuários tendem a formar câmaras de eco que reforçam suas crenças pré-existentes.',
+            'A exposição limitada a perspectivas diversas reduz a compreensão de diferentes pontos de vista.',
+            'Algoritmos de recomendação frequentemente amplificam o efeito de bolha informacional.'
+        ],
+        'impactos_positivos': [
+            'Fortalecimento de comunidades de interesse',
+            'Maior engajamento com conteúdo relevante'
+        ],
+        'impactos_negativos': [
+            'Polarização social e política',
+            'Desinformação e fake news',
+            'Radicalização de opiniões',
+            'Fragmentação social'
+        ]
+    },
+    {
+        'titulo': 'Sociedade em rede',
+        'fonte': 'Wikipedia',
+        'url': 'https://pt.wikipedia.org/wiki/Sociedade_em_rede',
+        'conceitos_chave': [
+            'Ciberespaço',
+            'Comunicação mediada',
+            'Interações digitais',
+            'Reorganização social',
+            'Capital informacional'
+        ],
+        'citacoes': [
+            'A sociedade em rede reorganiza as estruturas sociais tradicionais através da mediação tecnológica.',
+            'O ciberespaço se torna um novo território para interações humanas significativas.',
+            'A comunicação mediada por tecnologia cria novas formas de capital social e cultural.'
+        ],
+        'impactos_positivos': [
+            'Novas formas de organização social',
+            'Democratização do conhecimento',
+            'Superação de barreiras geográficas'
+        ],
+        'impactos_negativos': [
+            'Exclusão digital',
+            'Vigilância e controle',
+            'Perda de privacidade'
+        ]
+    },
+    {
+        'titulo': 'Da Rede para a Sociedade',
+        'fonte': 'Eumed',
+        'url': 'https://www.eumed.net/rev/cccss/2017/01/redes.html',
+        'conceitos_chave': [
+            'Influência política',
+            'Transformação de relações',
+            'Mobilização social',
+            'Ativismo digital',
+            'Novas sociabilidades'
+        ],
+        'citacoes': [
+            'As redes sociais transformaram fundamentalmente como nos organizamos politicamente.',
+            'O ativismo digital criou novas formas de mobilização social não possíveis anteriormente.',
+            'As relações interpessoais são cada vez mais mediadas e transformadas por plataformas digitais.'
+        ],
+        'impactos_positivos': [
+            'Mobilização social facilitada',
+            'Novas formas de participação política',
+            'Ampliação de vozes marginalizadas'
+        ],
+        'impactos_negativos': [
+            'Superficialidade nas relações',
+            'Manipulação política',
+            'Vigilância e controle social'
+        ]
+    }
+]
+
+# Outras formas de cada conceito ou impacto (variações e equivalentes em inglês), para a marcação em textos
+SINONIMOS = {
+    'Relacionamentos horizontais': ['relações horizontais', 'relacionamento horizontal'],
+    'Diminuição de hierarquias': ['diminuindo hierarquias', 'redução de hierarquias'],
+    'Controle de uso': ['uso descontrolado', 'tempo de tela', 'screen time'],
+    'Dependência digital': ['vício em redes sociais', 'social media addiction', 'digital dependence'],
+    'Câmaras de eco': ['câmara de eco', 'echo chamber', 'echo chambers'],
+    'Bolhas informacionais': ['bolha informacional', 'bolha de filtro', 'bolhas de filtro', 'filter bubble',
+                              'filter bubbles'],
+    'Polarização': ['polarizado', 'polarizada', 'polarization', 'polarisation'],
+    'Viés de confirmação': ['confirmation bias'],
+    'Algoritmos de recomendação': ['algoritmo de recomendação', 'recommendation algorithm',
+                                   'recommendation algorithms', 'recommender system', 'recommender systems'],
+    'Ciberespaço': ['cyberspace'],
+    'Comunicação mediada': ['computer-mediated communication'],
+    'Interações digitais': ['interações online', 'online interactions', 'digital interactions'],
+    'Influência política': ['political influence'],
+    'Mobilização social': ['social mobilization', 'social mobilisation'],
+    'Ativismo digital': ['ciberativismo', 'ativismo online', 'digital activism', 'online activism',
+                         'hashtag activism'],
+    'Isolamento social físico': ['isolamento social', 'social isolation', 'solidão', 'loneliness'],
+    'Ansiedade e depressão': ['ansiedade', 'depressão', 'anxiety', 'depression'],
+    'Polarização social e política': ['polarização política', 'polarização social', 'political polarization'],
+    'Desinformação e fake news': ['desinformação', 'fake news', 'notícias falsas', 'misinformation',
+                                  'disinformation'],
+    'Radicalização de opiniões': ['radicalização', 'radicalization', 'radicalisation'],
+    'Fragmentação social': ['social fragmentation'],
+    'Exclusão digital': ['digital divide'],
+    'Vigilância e controle': ['vigilância', 'surveillance'],
+    'Perda de privacidade': ['violação de privacidade', 'loss of privacy', 'privacy loss'],
+    'Manipulação política': ['political manipulation'],
+    'Democratização da informação': ['acesso à informação', 'access to information'],
+    'Fortalecimento de comunidades de interesse': ['comunidades de interesse', 'comunidades online',
+                                                   'online communities'],
+    'Superação de barreiras geográficas': ['barreiras geográficas', 'geographic barriers'],
+    'Ampliação de vozes marginalizadas': ['vozes marginalizadas', 'marginalized voices'],
+    'Novas formas de participação política': ['participação política', 'political participation'],
+}
+
+
+def contar_conceitos(artigos=ARTIGOS):
+    """Frequência de cada conceito-chave entre os artigos."""
+    todos_conceitos = []
+    for artigo in artigos:
+        todos_conceitos.extend(artigo['conceitos_chave'])
+    return Counter(todos_conceitos)
+
+
+def contar_impactos(artigos=ARTIGOS):
+    """Frequência dos impactos positivos e negativos; retorna (positivos, negativos)."""
+    todos_impactos_positivos = []
+    todos_impactos_negativos = []
+    for artigo in artigos:
+        todos_impactos_positivos.extend(artigo['impactos_positivos'])
+        todos_impactos_negativos.extend(artigo['impactos_negativos'])
+    return Counter(todos_impactos_positivos), Counter(todos_impactos_negativos)
@@ -0,0 +1,109 @@
+"""Núcleos da atualização diária da pontuação.
+
+Cada núcleo implementa `passo(atual, ruido, termos, parametros, out)`, que
+escreve em `out` a pontuação do dia seguinte a partir da pontuação `atual`, do
+ruído do dia e dos termos estáticos de `termos_estaticos`. Todos os núcleos
+somam os fatores na ordem do script original, então produzem o mesmo
+resultado bit a bit.
+"""
+import numpy as np
+
+
+class NucleoNumPy:
+    """Atualização em NumPy puro, sem temporários: usa buffers pré-alocados."""
+
+    nome = 'numpy'
+
+    def __init__(self, n_pessoas):
+        self._desvio = np.empty(n_pessoas, dtype=np.float64)
+        self._fator = np.empty(n_pessoas, dtype=np.float64)
+
+    def passo(self, atual, ruido, termos, parametros, out):
+        desvio, fator = self._desvio, self._fator
+
+        np.add(atual, ruido, out=out)
+        for termo in termos:
+            np.add(out, termo, out=out)
+
+        # Efeito Mateus
+        np.subtract(atual, 3, out=desvio)
+        np.multiply(desvio, 0.01, out=fator)
+        np.multiply(fator, parametros['momentum'], out=fator)
+        np.add(out, fator, out=out)
+
+        # Polarização
+        np.abs(desvio, out=fator)
+        np.sign(desvio, out=desvio)
+        np.multiply(fator, desvio, out=fator)
+        np.multiply(fator, parametros['polarizacao'], out=fator)
+        np.add(out, fator, out=out)
+
+        np.clip(out, 1, 5, out=out)
+        return out
+
+
+_passo_numba = None
+
+
+def _compilar_passo_numba():
+    global _passo_numba
+    if _passo_numba is None:
+        import numba
+
+        @numba.njit(parallel=True, cache=True)
+        def passo(atual, ruido, termos, momentum, polarizacao, out):
+            for i in numba.prange(atual.shape[0]):
+                a = atual[i]
+                x = a + ruido[i]
+                for k in range(termos.shape[0]):
+                    x += termos[k, i]
+                desvio = a - 3.0
+                x += desvio * 0.01 * momentum
+                x += abs(desvio) * np.sign(desvio) * polarizacao
+                out[i] = min(max(x, 1.0), 5.0)
+
+        _passo_numba = passo
+    return _passo_numba
+
+
+class NucleoNumba:
+    """Atualização fundida por agente (momentum, polarização, ruído e clip) via Numba."""
+
+    nome = 'numba'
+
+    def __init__(self, n_pessoas):
+        self._passo = _compilar_passo_numba()
+
+    def passo(self, atual, ruido, termos, parametros, out):
+        self._passo(atual, ruido, termos, parametros['momentum'], parametros['polarizacao'], out)
+        return out
+
+
+NUCLEOS = {
+    'numpy': NucleoNumPy,
+    'numba': NucleoNumba,
+}
+
+
+def numba_disponivel():
+    try:
+        import numba  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def obter_nucleo(nome, n_pessoas):
+    """Instancia o núcleo `nome` ('numpy', 'numba' ou 'auto').
+
+    'auto' escolhe Numba quando instalado. Se 'numba' for pedido sem a
+    dependência, recai no núcleo NumPy.
+    """
+    if nome == 'auto':
+        nome = 'numba' if numba_disponivel() else 'numpy'
+    elif nome == 'numba' and not numba_disponivel():
+        print("Aviso: Numba não está instalado. Usando o núcleo NumPy.")
+        nome = 'numpy'
+    if nome not in NUCLEOS:
+        raise ValueError(f"Núcleo desconhecido: {nome!r}. Opções: {', '.join(['auto', *NUCLEOS])}")
+    return NUCLEOS[nome](n_pessoas)
@@ -0,0 +1,123 @@
+"""População simulada guardada em colunas NumPy tipadas.
+
+Atributos categóricos ficam como códigos int8 que indexam a tabela
+`CATEGORIAS`; características numéricas ficam em arrays float64 (as que
+entram na pontuação, para preservar o resultado bit a bit) ou em inteiros
+pequenos. A conversão para pandas só acontece em `para_dataframe`, no
+momento do relatório.
+"""
+import numpy as np
+
+from socialdive.estratos import ESTRATOS
+
+# Tabela de categorias compartilhada: o código de cada rótulo é sua posição na tupla
+CATEGORIAS = {
+    'classe_socioeconomica': ('Baixa', 'Média', 'Alta'),
+    'nivel_educacional': ('Fundamental', 'Médio', 'Superior', 'Pós-graduação'),
+    'estrato_social': ESTRATOS,
+}
+
+# Bônus na pontuação inicial (simulando desigualdade digital)
+class_bonus = {'Baixa': -0.5, 'Média': 0, 'Alta': 0.5}
+edu_bonus = {'Fundamental': -0.3, 'Médio': -0.1, 'Superior': 0.2, 'Pós-graduação': 0.4}
+
+
+def codigo(coluna, rotulo):
+    """Código int8 do `rotulo` na coluna categórica `coluna`."""
+    return CATEGORIAS[coluna].index(rotulo)
+
+
+class Populacao:
+    """Colunas alinhadas por pessoa; `populacao['coluna']` devolve o array (códigos, se categórica).
+
+    Fatiar com `populacao[inicio:fim]` devolve outra `Populacao` com visões
+    das mesmas colunas, sem cópia.
+    """
+
+    def __init__(self, colunas):
+        self.colunas = {}
+        for nome, valores in colunas.items():
+            self[nome] = valores
+
+    def __len__(self):
+        return len(next(iter(self.colunas.values()))) if self.colunas else 0
+
+    def __contains__(self, nome):
+        return nome in self.colunas
+
+    def __getitem__(self, chave):
+        if isinstance(chave, slice):
+            return Populacao({nome: valores[chave] for nome, valores in self.colunas.items()})
+        return self.colunas[chave]
+
+    def __setitem__(self, nome, valores):
+        valores = np.asarray(valores)
+        if self.colunas and len(valores) != len(self):
+            raise ValueError(f"Coluna {nome!r} tem {len(valores)} valores para {len(self)} pessoas.")
+        if nome in CATEGORIAS and valores.dtype != np.int8:
+            raise TypeError(f"Coluna categórica {nome!r} deve conter códigos int8.")
+        self.colunas[nome] = valores
+
+    @property
+    def memoria_bytes(self):
+        return sum(valores.nbytes for valores in self.colunas.values())
+
+    def rotulos(self, nome):
+        """Rótulos (str) de uma coluna categórica."""
+        return np.asarray(CATEGORIAS[nome], dtype=object)[self.colunas[nome]]
+
+    def para_dataframe(self, colunas=None):
+        """Converte para `pandas.DataFrame`; categóricas viram `pd.Categorical` sem cópia dos códigos."""
+        import pandas as pd
+
+        nomes = list(self.colunas) if colunas is None else colunas
+        dados = {}
+        for nome in nomes:
+            valores = self.colunas[nome]
+            if nome in CATEGORIAS:
+                dados[nome] = pd.Categorical.from_codes(valores, categories=list(CATEGORIAS[nome]))
+            else:
+                dados[nome] = valores
+        return pd.DataFrame(dados)
+
+
+def criar_populacao(n_pessoas, rng=None):
+    """Cria a população inicial com características diversas.
+
+    `rng` segue a API de `np.random.RandomState`; por padrão usa o gerador
+    global do NumPy, consumindo os números na mesma ordem do script original.
+    """
+    rng = np.random if rng is None else rng
+
+    # Características das pessoas
+    # (sortear índices com `choice(k, p=...)` consome o gerador exatamente como sortear os rótulos)
+    pontuacao_inicial = rng.normal(3.5, 0.8, n_pessoas).clip(1, 5)  # Pontuação entre 1-5
+    classe = rng.choice(3, size=n_pessoas, p=[0.3, 0.5, 0.2]).astype(np.int8)
+    educacao = rng.choice(4, size=n_pessoas, p=[0.2, 0.4, 0.3, 0.1]).astype(np.int8)
+    idade = rng.randint(18, 80, n_pessoas).astype(np.int8)
+    conformidade = rng.normal(0.7, 0.2, n_pessoas).clip(0, 1)  # Tendência a seguir normas sociais
+    autenticidade = rng.normal(0.5, 0.2, n_pessoas).clip(0, 1)  # Tendência a ser autêntico vs. fake
+    acesso = rng.normal(0.8, 0.15, n_pessoas).clip(0.3, 1)  # Nível de acesso à tecnologia
+
+    # Classe socioeconômica influencia a pontuação inicial
+    pontuacao_inicial += np.array([class_bonus[c] for c in CATEGORIAS['classe_socioeconomica']])[classe]
+
+    # Nível educacional influencia a pontuação inicial
+    pontuacao_inicial += np.array([edu_bonus[e] for e in CATEGORIAS['nivel_educacional']])[educacao]
+
+    # Acesso à tecnologia influencia a pontuação inicial
+    pontuacao_inicial += (acesso - 0.5) * 0.5
+
+    # Garantir que a pontuação esteja entre 1 e 5
+    np.clip(pontuacao_inicial, 1, 5, out=pontuacao_inicial)
+
+    return Populacao({
+        'id': np.arange(1, n_pessoas + 1, dtype=np.int32),
+        'pontuacao_inicial': pontuacao_inicial,
+        'classe_socioeconomica': classe,
+        'nivel_educacional': educacao,
+        'idade': idade,
+        'conformidade_social': conformidade,
+        'autenticidade': autenticidade,
+        'acesso_tecnologia': acesso,
+    })
@@ -0,0 +1,77 @@
+import numpy as np
+
+from socialdive import instrumentacao
+
+
+# Função para determinar probabilidade de conexão baseada em pontuações
+def prob_conexao(p1, p2, homofilia=0.7):
+    # Diferença de pontuação (aceita escalares ou arrays)
+    diff = np.abs(p1 - p2)
+    # Probabilidade base (quanto menor a diferença, maior a probabilidade)
+    prob_base = np.maximum(0, 1 - (diff / 4) * homofilia)
+    return prob_base
+
+
+def n_conexoes_padrao(n_pessoas):
+    """Número de conexões da rede gerada após a simulação (CLI e serviço)."""
+    return min(20000, n_pessoas * 20)  # Limitar número de conexões para visualização
+
+
+def gerar_arestas(pontuacoes, n_conexoes, homofilia=0.7, rng=None, tamanho_lote=1 << 22):
+    """Gera `n_conexoes` arestas por amostragem com rejeição em lotes.
+
+    Mesmo processo do laço original: pares uniformes de pessoas distintas,
+    aceitos com probabilidade `prob_conexao` (homofilia por pontuação), sem
+    arestas repetidas. Os candidatos são sorteados e avaliados em lotes NumPy
+    e deduplicados por uma chave int64 `min * n + max` do par.
+
+    Retorna `(origem, destino)`: arrays int64 no formato COO com índices
+    (base 0) em `pontuacoes` e `origem < destino`.
+    """
+    rng = np.random if rng is None else rng
+    pontuacoes = np.asarray(pontuacoes, dtype=np.float64)
+    n_pessoas = len(pontuacoes)
+    if n_conexoes > n_pessoas * (n_pessoas - 1) // 2:
+        raise ValueError(f"Impossível criar {n_conexoes} conexões entre {n_pessoas} pessoas.")
+
+    existentes = np.empty(0, dtype=np.int64)  # chaves já aceitas, ordenadas
+    lotes = []
+    aceitas = 0
+    taxa_aceitacao = 0.5  # estimativa inicial, refinada a cada lote
+
+    while aceitas < n_conexoes:
+        faltam = n_conexoes - aceitas
+        n_candidatos = int(min(tamanho_lote, max(1024, 1.2 * faltam / taxa_aceitacao)))
+
+        # Selecionar pares aleatórios e decidir quais se conectam
+        p1 = rng.randint(0, n_pessoas, n_candidatos)
+        p2 = rng.randint(0, n_pessoas, n_candidatos)
+        sorteio = rng.random_sample(n_candidatos)
+        conecta = (p1 != p2) & (sorteio < prob_conexao(pontuacoes[p1], pontuacoes[p2], homofilia))
+        instrumentacao.contar('arestas_candidatas', n_candidatos)
+        instrumentacao.contar('arestas_aceitas', conecta.sum())
+        taxa_aceitacao = max(conecta.mean(), 1e-3)
+
+        chaves = np.minimum(p1, p2)[conecta] * np.int64(n_pessoas) + np.maximum(p1, p2)[conecta]
+
+        # Descartar repetições dentro do lote (np.unique devolve as chaves ordenadas)
+        chaves, primeiras = np.unique(chaves, return_index=True)
+
+        # Descartar pares já conectados em lotes anteriores
+        if len(existentes):
+            pos = np.minimum(np.searchsorted(existentes, chaves), len(existentes) - 1)
+            novas = existentes[pos] != chaves
+            chaves, primeiras = chaves[novas], primeiras[novas]
+
+        # Manter apenas as primeiras sorteadas quando o lote excede o necessário
+        if len(chaves) > faltam:
+            manter = np.sort(np.argsort(primeiras, kind='stable')[:faltam])
+            chaves = chaves[manter]
+
+        lotes.append(chaves)
+        existentes = np.sort(np.concatenate([existentes, chaves]), kind='stable')  # fusão de duas sequências ordenadas
+        aceitas += len(chaves)
+        instrumentacao.contar('arestas_novas', len(chaves))
+
+    chaves = np.concatenate(lotes) if lotes else np.empty(0, dtype=np.int64)
+    return chaves // n_pessoas, chaves % n_pessoas
@@ -0,0 +1,332 @@
+"""Gráficos e textos do relatório.
+
+matplotlib e seaborn só são importados quando o primeiro gráfico é gerado,
+para que o restante do pacote possa ser usado sem esse custo de importação.
+
+Cada gráfico recebe apenas dados já agregados (contagens de histograma,
+estatísticas de boxplot, médias diárias), montados pelas funções `dados_*`
+com NumPy: o custo de desenhar não cresce com o tamanho da população, e as
+tarefas são pequenas o bastante para irem a outros processos. `Renderizador`
+desenha os gráficos num pool de processos (backend Agg) enquanto os
+estágios seguintes continuam.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from socialdive.estratos import ESTRATOS, LIMIARES_ESTRATO
+
+_bibliotecas_graficas = None
+
+
+def _bibliotecas():
+    # Importação e configurações para os gráficos, feitas uma única vez
+    global _bibliotecas_graficas
+    if _bibliotecas_graficas is None:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
+        plt.rcParams['axes.formatter.use_locale'] = True
+        plt.rcParams['figure.figsize'] = (12, 8)
+        sns.set(style="whitegrid")
+        plt.style.use('ggplot')
+        _bibliotecas_graficas = plt, sns
+    return _bibliotecas_graficas
+
+
+def _salvar(plt, diretorio, arquivo):
+    plt.tight_layout()
+    plt.savefig(os.path.join(diretorio, arquivo))
+    plt.close()
+
+
+def dados_distribuicao(pontuacoes, limiares=LIMIARES_ESTRATO, bins=20, subdivisoes=25, pontos_kde=200):
+    """Histograma e curva KDE da pontuação final, pré-calculados.
+
+    A KDE é avaliada sobre um histograma fino (`bins * subdivisoes` classes)
+    com a largura de banda da regra de Scott calculada nos dados completos,
+    como faz `sns.histplot(kde=True)`; o custo é O(n) para contar e
+    O(classes × pontos) para a curva.
+    """
+    pontuacoes = np.asarray(pontuacoes, dtype=np.float64)
+    n = len(pontuacoes)
+    contagens_finas, arestas_finas = np.histogram(pontuacoes, bins=bins * subdivisoes)
+    contagens = contagens_finas.reshape(bins, subdivisoes).sum(axis=1)
+    arestas = arestas_finas[::subdivisoes]
+
+    kde_x = np.linspace(arestas[0], arestas[-1], pontos_kde)
+    desvio = pontuacoes.std(ddof=1) if n > 1 else 0.0
+    if desvio > 0:
+        banda = desvio * n ** (-1 / 5)
+        centros = (arestas_finas[:-1] + arestas_finas[1:]) / 2
+        z = (kde_x[:, None] - centros[None, :]) / banda
+        densidade = (np.exp(-0.5 * z * z) @ contagens_finas) / (n * banda * np.sqrt(2 * np.pi))
+        # Mesma escala das barras (estatística 'count')
+        kde_y = densidade * n * (arestas[1] - arestas[0])
+    else:
+        kde_x = kde_y = None
+    return {'arestas': arestas, 'contagens': contagens, 'kde_x': kde_x, 'kde_y': kde_y,
+            'limiares': tuple(float(limiar) for limiar in limiares)}
+
+
+def dados_mobilidade(grupos, valores, nomes, max_discrepantes=500):
+    """Estatísticas de boxplot (quartis, bigodes a 1,5 IQR e discrepantes) por grupo.
+
+    Os pontos discrepantes são subamostrados, em ordem, para no máximo
+    `max_discrepantes` por grupo.
+    """
+    valores = np.asarray(valores, dtype=np.float64)
+    estatisticas = []
+    for codigo, nome in enumerate(nomes):
+        dados = valores[grupos == codigo]
+        if len(dados) == 0:
+            continue
+        q1, mediana, q3 = np.percentile(dados, [25, 50, 75])
+        iqr = q3 - q1
+        dentro = dados[(dados >= q1 - 1.5 * iqr) & (dados <= q3 + 1.5 * iqr)]
+        discrepantes = np.sort(dados[(dados < q1 - 1.5 * iqr) | (dados > q3 + 1.5 * iqr)])
+        if len(discrepantes) > max_discrepantes:
+            discrepantes = discrepantes[np.linspace(0, len(discrepantes) - 1, max_discrepantes).astype(np.intp)]
+        estatisticas.append({'label': nome, 'med': mediana, 'q1': q1, 'q3': q3,
+                             'whislo': dentro.min(), 'whishi': dentro.max(), 'fliers': discrepantes})
+    return {'estatisticas': estatisticas}
+
+
+def grafico_impactos(impactos_positivos, impactos_negativos, diretorio='.'):
+    """Comparação entre impactos positivos e negativos (impactos_redes_sociais.png).
+
+    Recebe as listas `(impacto, frequência)` de `Counter.most_common(5)`.
+    """
+    import pandas as pd
+    plt, sns = _bibliotecas()
+
+    impactos_positivos_df = pd.DataFrame(impactos_positivos, columns=['Impacto', 'Frequência'])
+    impactos_positivos_df['Tipo'] = 'Positivo'
+
+    impactos_negativos_df = pd.DataFrame(impactos_negativos, columns=['Impacto', 'Frequência'])
+    impactos_negativos_df['Tipo'] = 'Negativo'
+
+    impactos_df = pd.concat([impactos_positivos_df, impactos_negativos_df])
+
+    plt.figure(figsize=(12, 8))
+    colors = {'Positivo': 'green', 'Negativo': 'red'}
+    sns.barplot(x='Frequência', y='Impacto', hue='Tipo', data=impactos_df, palette=colors)
+    plt.title('Impactos Positivos vs. Negativos das Redes Sociais', fontsize=16)
+    plt.xlabel('Frequência nas Fontes Analisadas', fontsize=12)
+    plt.ylabel('Tipo de Impacto', fontsize=12)
+    _salvar(plt, diretorio, 'impactos_redes_sociais.png')
+
+
+def grafico_distribuicao(arestas, contagens, kde_x, kde_y, limiares=LIMIARES_ESTRATO, diretorio='.'):
+    """Distribuição da pontuação final com os limites dos estratos (distribuicao_pontuacao_final.png).
+
+    Recebe o histograma pré-calculado de `dados_distribuicao`.
+    """
+    plt, sns = _bibliotecas()
+
+    plt.figure(figsize=(10, 6))
+    # Barras com a transparência que o seaborn usa quando há KDE; a curva vem pronta
+    ax = sns.histplot(x=(arestas[:-1] + arestas[1:]) / 2, weights=contagens, bins=list(arestas),
+                      alpha=0.5 if kde_x is not None else 0.75)
+    if kde_x is not None:
+        ax.plot(kde_x, kde_y, color=ax.patches[0].get_facecolor()[:3])
+    plt.title('Distribuição de Pontuação Social Final', fontsize=16)
+    plt.xlabel('Pontuação (1-5)', fontsize=12)
+    plt.ylabel('Número de Pessoas', fontsize=12)
+
+    # Adicionar linhas verticais para os limites dos estratos (do mais alto ao mais baixo)
+    cores = ('blue', 'green', 'orange', 'red')
+    for i in reversed(range(len(limiares))):
+        faixa = f'{limiares[i]:.1f}+' if i == len(limiares) - 1 else f'{limiares[i]:.1f}-{limiares[i + 1]:.1f}'
+        plt.axvline(x=limiares[i], color=cores[i], linestyle='--', alpha=0.7, label=f'{ESTRATOS[i + 1]} ({faixa})')
+    plt.legend()
+    _salvar(plt, diretorio, 'distribuicao_pontuacao_final.png')
+
+
+def grafico_classe_estrato(cross_tab, diretorio='.'):
+    """Barras empilhadas de estrato social por classe (classe_vs_estrato.png)."""
+    plt, _ = _bibliotecas()
+
+    plt.figure(figsize=(12, 8))
+    cross_tab.plot(kind='bar', stacked=True, colormap='viridis')
+    plt.title('Estrato Social Digital por Classe Socioeconômica', fontsize=16)
+    plt.xlabel('Classe Socioeconômica', fontsize=12)
+    plt.ylabel('Percentual (%)', fontsize=12)
+    plt.legend(title='Estrato Social Digital')
+    _salvar(plt, diretorio, 'classe_vs_estrato.png')
+
+
+def grafico_evolucao(pontuacoes_por_classe, diretorio='.'):
+    """Evolução diária da pontuação média por classe (evolucao_pontuacao_por_classe.png)."""
+    plt, _ = _bibliotecas()
+
+    plt.figure(figsize=(12, 6))
+    for classe, pontuacoes in pontuacoes_por_classe.items():
+        plt.plot(range(len(pontuacoes)), pontuacoes, label=f'Classe {classe}')
+
+    plt.title('Evolução da Pontuação Social Média por Classe Socioeconômica', fontsize=16)
+    plt.xlabel('Dias', fontsize=12)
+    plt.ylabel('Pontuação Média (1-5)', fontsize=12)
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    _salvar(plt, diretorio, 'evolucao_pontuacao_por_classe.png')
+
+
+def grafico_mobilidade(estatisticas, diretorio='.'):
+    """Boxplot da mobilidade por classe (mobilidade_por_classe.png).
+
+    Recebe as estatísticas pré-calculadas de `dados_mobilidade`.
+    """
+    plt, sns = _bibliotecas()
+
+    plt.figure(figsize=(10, 6))
+    ax = plt.gca()
+    # Mesmo visual do `sns.boxplot`: cores dessaturadas e linhas cinza-escuro
+    linhas = {'color': '.25'}
+    caixas = ax.bxp(estatisticas, positions=range(len(estatisticas)), patch_artist=True, widths=0.8,
+                    boxprops={'edgecolor': '.25'}, whiskerprops=linhas, capprops=linhas, medianprops=linhas,
+                    flierprops={'markeredgecolor': '.25'})
+    for caixa, cor in zip(caixas['boxes'], sns.color_palette('viridis', len(estatisticas), desat=0.75)):
+        caixa.set_facecolor(cor)
+    plt.title('Mobilidade Social por Classe Socioeconômica', fontsize=16)
+    plt.xlabel('Classe Socioeconômica', fontsize=12)
+    plt.ylabel('Variação na Pontuação Social', fontsize=12)
+    plt.axhline(y=0, color='red', linestyle='--', alpha=0.7)
+    _salvar(plt, diretorio, 'mobilidade_por_classe.png')
+
+
+def grafico_fatores(correlacoes, diretorio='.'):
+    """Correlação das características com a mobilidade (fatores_mobilidade.png)."""
+    plt, sns = _bibliotecas()
+
+    plt.figure(figsize=(10, 6))
+    sns.barplot(x=correlacoes.values, y=correlacoes.index, palette='RdBu_r')
+    plt.title('Fatores que Influenciam a Mobilidade Social', fontsize=16)
+    plt.xlabel('Correlação com Mobilidade Social', fontsize=12)
+    plt.axvline(x=0, color='black', linestyle='--', alpha=0.7)
+    _salvar(plt, diretorio, 'fatores_mobilidade.png')
+
+
+GRAFICOS = {
+    'impactos': grafico_impactos,
+    'distribuicao': grafico_distribuicao,
+    'classe_estrato': grafico_classe_estrato,
+    'evolucao': grafico_evolucao,
+    'mobilidade': grafico_mobilidade,
+    'fatores': grafico_fatores,
+}
+
+
+def _renderizar(tarefa):
+    nome, dados, diretorio = tarefa
+    inicio = time.perf_counter()
+    GRAFICOS[nome](**dados, diretorio=diretorio)
+    return nome, time.perf_counter() - inicio
+
+
+class Renderizador:
+    """Desenha os gráficos selecionados fora do caminho crítico.
+
+    `enviar` entrega os dados agregados de um gráfico a um pool de processos
+    e retorna imediatamente; `concluir` espera todos e propaga erros. Com
+    `max_workers=0` os gráficos são desenhados na hora, no próprio processo.
+    `selecionados=None` desenha todos os gráficos de `GRAFICOS`.
+    """
+
+    def __init__(self, diretorio='.', selecionados=None, max_workers=None):
+        selecionados = GRAFICOS if selecionados is None else selecionados
+        desconhecidos = set(selecionados) - set(GRAFICOS)
+        if desconhecidos:
+            raise ValueError(f"Gráficos desconhecidos: {sorted(desconhecidos)}. Opções: {list(GRAFICOS)}.")
+        self.diretorio = diretorio
+        self.selecionados = set(selecionados)
+        n_processos = min(len(self.selecionados), max_workers or os.cpu_count() or 1)
+        self._executor = ProcessPoolExecutor(max_workers=n_processos) if max_workers != 0 and n_processos else None
+        self._pendentes = []
+        self.tempos = {}  # segundos de desenho de cada gráfico, medidos no processo que o desenhou
+
+    def quer(self, nome):
+        return nome in self.selecionados
+
+    def enviar(self, nome, **dados):
+        if not self.quer(nome):
+            return
+        tarefa = (nome, dados, self.diretorio)
+        if self._executor is None:
+            self._registrar(*_renderizar(tarefa))
+        else:
+            self._pendentes.append(self._executor.submit(_renderizar, tarefa))
+
+    def concluir(self):
+        """Espera os gráficos pendentes; retorna os nomes desenhados por este renderizador."""
+        try:
+            for futuro in self._pendentes:
+                self._registrar(*futuro.result())
+            return list(self.tempos)
+        finally:
+            self._pendentes = []
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def _registrar(self, nome, segundos):
+        self.tempos[nome] = round(segundos, 6)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=excecao[0] is not None)
+            self._executor = None
+
+
+# Conclusões baseadas nos artigos e na simulação
+CONCLUSOES = [
+    "A estratificação social digital tende a reproduzir e amplificar desigualdades socioeconômicas existentes.",
+    "O acesso à tecnologia e o nível educacional são fatores determinantes para a mobilidade social em um sistema de pontuação.",
+    "Pessoas com maior conformidade social tendem a se beneficiar mais em sistemas de pontuação, enquanto a autenticidade pode ser penalizada.",
+    "A formação de bolhas sociais (câmaras de eco) é um fenômeno natural em redes baseadas em pontuação, reforçando a polarização.",
+    "O 'Efeito Mateus' digital (rico fica mais rico, pobre fica mais pobre) é observado na evolução das pontuações ao longo do tempo.",
+    "A mobilidade social ascendente é mais difícil para classes socioeconômicas mais baixas, criando um ciclo de exclusão digital."
+]
+
+# Implicações éticas e sociais
+IMPLICACOES = [
+    "Erosão da privacidade: sistemas de pontuação social requerem vigilância constante das ações individuais.",
+    "Conformismo excessivo: pessoas podem sacrificar autenticidade e pensamento crítico para maximizar pontuação.",
+    "Discriminação algorítmica: vieses nos algoritmos podem perpetuar e amplificar desigualdades existentes.",
+    "Exclusão digital: pessoas sem acesso adequado à tecnologia ficam cada vez mais marginalizadas.",
+    "Saúde mental: ansiedade, depressão e outros problemas podem surgir da pressão constante por aprovação social.",
+    "Manipulação comportamental: o sistema pode ser usado como ferramenta de controle social e político."
+]
+
+# Recomendações para mitigar impactos negativos
+RECOMENDACOES = [
+    "Políticas de inclusão digital para garantir acesso equitativo à tecnologia.",
+    "Transparência algorítmica para permitir auditoria e correção de vieses.",
+    "Educação digital crítica para promover uso consciente das redes sociais.",
+    "Regulamentação para proteger privacidade e prevenir discriminação.",
+    "Valorização da diversidade de pensamento e expressão autêntica nas plataformas digitais.",
+    "Desenvolvimento de métricas de valor social que vão além de likes e compartilhamentos."
+]
+
+
+def imprimir_conclusoes():
+    print("\n\n📝 CONCLUSÕES E IMPLICAÇÕES SOCIAIS")
+    print("=" * 70)
+
+    for i, conclusao in enumerate(CONCLUSOES, 1):
+        print(f"{i}. {conclusao}")
+
+    print("\nImplicações éticas e sociais de um sistema de pontuação social:")
+    for i, implicacao in enumerate(IMPLICACOES, 1):
+        print(f"{i}. {implicacao}")
+
+    print("\nRecomendações para mitigar impactos negativos:")
+    for i, recomendacao in enumerate(RECOMENDACOES, 1):
+        print(f"{i}. {recomendacao}")
@@ -0,0 +1,136 @@
+"""Conjunto de réplicas Monte Carlo simuladas em lote, com intervalos de confiança.
+
+Uma única semente diz pouco sobre as conclusões da simulação (efeito Mateus,
+diferenças de mobilidade entre classes). Aqui R réplicas independentes —
+cada uma com sua população e seu fluxo aleatório, filhos de uma
+`np.random.SeedSequence` — evoluem juntas como uma matriz (réplicas,
+n_pessoas) no mesmo laço diário: o núcleo NumPy aplica a atualização à
+matriz inteira, então o custo por dia em Python não cresce com R.
+
+As réplicas são processadas em lotes de `tamanho_lote`, o que limita a
+memória a O(tamanho_lote × n_pessoas) independentemente de R. A réplica i
+reproduz bit a bit a execução i de `executar_varredura` com uma única
+configuração e a mesma semente, então o resultado não depende do tamanho
+do lote.
+
+As métricas de cada réplica são resumidas por média e intervalo de
+confiança bootstrap percentil sobre as réplicas (`intervalos_bootstrap`).
+"""
+import numpy as np
+
+from socialdive import instrumentacao
+from socialdive.estratos import ESTRATOS, LIMIARES_ESTRATO, classificar, percentual_por_linha
+from socialdive.nucleos import NucleoNumPy
+from socialdive.populacao import CATEGORIAS, criar_populacao
+from socialdive.simulacao import PARAMETROS_PADRAO, termos_estaticos
+
+# Arrays float64 (réplicas, n_pessoas) vivos durante o laço: termos (5), atual, nova, ruído e 2 buffers do núcleo
+_ARRAYS_POR_REPLICA = 10
+
+
+def tamanho_lote_padrao(n_pessoas, memoria_bytes=256 << 20):
+    """Quantas réplicas cabem num lote dentro de `memoria_bytes`."""
+    return max(1, memoria_bytes // (_ARRAYS_POR_REPLICA * 8 * n_pessoas))
+
+
+def _metricas_lote(classes, inicial, final, limiares):
+    """Métricas por réplica de um lote; todas as entradas são (réplicas, n_pessoas)."""
+    n_lote, n_pessoas = final.shape
+    n_classes = len(CATEGORIAS['classe_socioeconomica'])
+    n_estratos = len(ESTRATOS)
+    estratos = classificar(final, limiares)
+    # Deslocar os códigos por réplica permite uma única passada `bincount` para o lote inteiro
+    deslocamento = np.arange(n_lote, dtype=np.int64)[:, None]
+
+    tabela = np.bincount(((deslocamento * n_classes + classes) * n_estratos + estratos).ravel(),
+                         minlength=n_lote * n_classes * n_estratos).reshape(n_lote, n_classes, n_estratos)
+    proporcoes = tabela.sum(axis=1) / n_pessoas * 100
+
+    mobilidade = final - inicial
+    chaves_classe = (deslocamento * n_classes + classes).ravel()
+    contagem = np.bincount(chaves_classe, minlength=n_lote * n_classes).reshape(n_lote, n_classes)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        media = np.bincount(chaves_classe, weights=mobilidade.ravel(),
+                            minlength=n_lote * n_classes).reshape(n_lote, n_classes) / contagem
+
+    # Efeito Mateus: correlação entre pontuação inicial e mobilidade dentro de cada réplica
+    x = inicial - inicial.mean(axis=1, keepdims=True)
+    y = mobilidade - mobilidade.mean(axis=1, keepdims=True)
+    mateus = (x * y).sum(axis=1) / np.sqrt((x * x).sum(axis=1) * (y * y).sum(axis=1))
+
+    return {
+        'proporcao_estrato': proporcoes,
+        'classe_estrato': percentual_por_linha(tabela),
+        'mobilidade_classe': media,
+        'lacuna_mobilidade': media[:, -1] - media[:, 0],
+        'efeito_mateus': mateus,
+    }
+
+
+def simular_replicas(n_replicas, parametros=None, n_pessoas=1000, n_dias=365, semente=42,
+                     limiares=LIMIARES_ESTRATO, tamanho_lote=None):
+    """Simula `n_replicas` réplicas independentes e retorna as métricas de cada uma.
+
+    Retorna um dict de arrays com a réplica no primeiro eixo:
+    'proporcao_estrato' (R, estratos) em %, 'classe_estrato' (R, classes,
+    estratos) em % por linha, 'mobilidade_classe' (R, classes),
+    'lacuna_mobilidade' (R,) — mobilidade média da classe Alta menos a da
+    Baixa — e 'efeito_mateus' (R,), a correlação entre pontuação inicial e
+    mobilidade.
+    """
+    parametros = PARAMETROS_PADRAO if parametros is None else parametros
+    tamanho_lote = tamanho_lote or tamanho_lote_padrao(n_pessoas)
+    sequencias = np.random.SeedSequence(semente).spawn(n_replicas)
+
+    partes = []
+    for inicio in range(0, n_replicas, tamanho_lote):
+        # Fluxo independente por réplica, como em `executar_varredura`
+        rngs = [np.random.RandomState(np.random.MT19937(sequencia))
+                for sequencia in sequencias[inicio:inicio + tamanho_lote]]
+        populacoes = [criar_populacao(n_pessoas, rng) for rng in rngs]
+        n_lote = len(rngs)
+
+        termos = np.stack([termos_estaticos(populacao, parametros) for populacao in populacoes], axis=1)
+        inicial = np.stack([populacao['pontuacao_inicial'] for populacao in populacoes])
+        classes = np.stack([populacao['classe_socioeconomica'] for populacao in populacoes])
+
+        # Os buffers do núcleo NumPy aceitam a forma (réplicas, n_pessoas)
+        nucleo = NucleoNumPy((n_lote, n_pessoas))
+        atual = inicial.copy()
+        nova = np.empty_like(atual)
+        ruido = np.empty_like(atual)
+        for _ in range(1, n_dias):
+            for linha, rng in zip(ruido, rngs):
+                linha[:] = rng.normal(0, parametros['volatilidade'], n_pessoas)
+            nucleo.passo(atual, ruido, termos, parametros, out=nova)
+            atual, nova = nova, atual
+
+        partes.append(_metricas_lote(classes, inicial, atual, limiares))
+        instrumentacao.contar('dias_simulados', max(n_dias - 1, 0) * n_lote)
+        instrumentacao.contar('pessoas_dia', max(n_dias - 1, 0) * n_lote * n_pessoas)
+
+    return {nome: np.concatenate([parte[nome] for parte in partes]) for nome in partes[0]}
+
+
+def intervalos_bootstrap(metricas, n_reamostras=2000, confianca=0.95, semente=0):
+    """Média sobre as réplicas e intervalo de confiança bootstrap percentil de cada métrica.
+
+    Cada reamostra é um vetor de pesos multinomiais sobre as réplicas, então
+    as médias de todas as reamostras saem de um único produto matricial.
+    Retorna {nome: {'media', 'inferior', 'superior'}} com a forma de uma
+    réplica da métrica.
+    """
+    n_replicas = len(next(iter(metricas.values())))
+    rng = np.random.RandomState(semente)
+    pesos = rng.multinomial(n_replicas, np.full(n_replicas, 1 / n_replicas), size=n_reamostras) / n_replicas
+    alfa = (1 - confianca) / 2 * 100
+
+    resumo = {}
+    for nome, valores in metricas.items():
+        planos = valores.reshape(n_replicas, -1)
+        medias = pesos @ planos
+        inferior, superior = np.percentile(medias, [alfa, 100 - alfa], axis=0)
+        forma = valores.shape[1:]
+        resumo[nome] = {'media': planos.mean(axis=0).reshape(forma),
+                        'inferior': inferior.reshape(forma), 'superior': superior.reshape(forma)}
+    return resumo
@@ -0,0 +1,417 @@
+"""Serviço HTTP (Flask) de consultas sobre resultados de simulação já calculados.
+
+Os resultados de um cenário — população, médias diárias por classe,
+contingência diária classe × estrato, rede e comunidades — são carregados
+uma única vez num `Resultados`, que monta na carga os índices NumPy das
+consultas (CSR da rede, ids ordenados, estatísticas das comunidades): cada
+requisição é uma fatia ou uma busca binária, sem repetir simulação, grafo
+nem gráficos.
+
+Cenários novos (POST /cenarios) são simulados num pool de processos em
+segundo plano, identificados pela chave das suas entradas (como no cache de
+estágios); os prontos ficam num cache LRU em memória com `tamanho_cache`
+cenários. Os carregados de um diretório de `--exportar` ficam fixos.
+
+    python -m socialdive --exportar resultados/
+    python -m socialdive.servico --resultados resultados/ --porta 5000
+
+Consultas (JSON), para o cenário `<id>` ou 'base':
+    GET  /cenarios/<id>                        estado e resumo
+    GET  /cenarios/<id>/estratos?dia=&classe=  participação de cada estrato por classe (%)
+    GET  /cenarios/<id>/trajetoria?classe=&pontos=
+    GET  /cenarios/<id>/pessoas/<id_pessoa>?vizinhos=N
+    GET  /cenarios/<id>/comunidades?n=N
+    POST /cenarios  {"pessoas": ..., "dias": ..., "semente": ..., "limiares": [...]}
+"""
+import argparse
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from socialdive.cache import chave
+from socialdive.comunidades import detectar_comunidades, estatisticas_comunidades
+from socialdive.estratos import ESTRATOS, LIMIARES_ESTRATO, percentual_por_linha
+from socialdive.grafo import GrafoEsparso
+from socialdive.populacao import CATEGORIAS, Populacao
+from socialdive.rede import n_conexoes_padrao
+
+CENARIO_PADRAO = {'pessoas': 1000, 'dias': 365, 'semente': 42, 'limiares': list(LIMIARES_ESTRATO)}
+MAX_PESSOAS = 5_000_000
+MAX_DIAS = 3650
+_MODULOS_CENARIO = ('socialdive.servico', 'socialdive.populacao', 'socialdive.simulacao', 'socialdive.nucleos',
+                    'socialdive.historico', 'socialdive.estratos', 'socialdive.rede', 'socialdive.comunidades',
+                    'socialdive.grafo', 'socialdive.analise')
+
+
+class CenarioPendente(Exception):
+    """O cenário foi submetido mas ainda não terminou (ou falhou)."""
+
+
+class Resultados:
+    """Resultados de um cenário em memória, com os índices das consultas já montados.
+
+    `origem` e `destino` são posições na população (não ids);
+    `comunidades` é o rótulo de cada pessoa, detectado na carga se omitido.
+    """
+
+    def __init__(self, colunas, medias_classes, contingencia_estratos, origem, destino, comunidades=None):
+        self.populacao = Populacao(colunas)
+        self.medias_classes = np.asarray(medias_classes)
+        self.contingencia_estratos = np.asarray(contingencia_estratos)
+        ids = self.populacao['id']
+        self._ordem_ids = np.argsort(ids, kind='stable')
+        self._ids_ordenados = ids[self._ordem_ids]
+        self.grafo = GrafoEsparso.de_arestas(origem, destino, len(ids))
+        if comunidades is None:
+            comunidades, _ = detectar_comunidades(self.grafo)
+        self.comunidades = np.asarray(comunidades)
+        self._estatisticas = estatisticas_comunidades(self.comunidades, self.populacao['pontuacao_final'])
+        # Posição de cada rótulo na ordem por tamanho (a das respostas)
+        self._posicao_comunidade = np.empty(self.comunidades.max() + 1 if len(self.comunidades) else 0,
+                                            dtype=np.int64)
+        ordem = self._estatisticas['comunidade']
+        self._posicao_comunidade[ordem] = np.arange(len(ordem))
+
+    @classmethod
+    def de_diretorio(cls, diretorio, formato='parquet'):
+        """Carrega os arquivos gravados por `python -m socialdive --exportar DIR`."""
+        from socialdive.exportacao import ler_agregados, ler_colunas
+
+        def caminho(nome):
+            return os.path.join(diretorio, f'{nome}.{formato}')
+
+        colunas = ler_colunas(caminho('populacao'))
+        comunidades = colunas.pop('comunidade', None)
+        medias_classes, contingencia = ler_agregados(caminho('medias_classes'), caminho('estratos_diarios'))
+        arestas = ler_colunas(caminho('arestas'))
+        # As arestas foram gravadas com ids; a conversão para posições usa os ids ordenados
+        ids = colunas['id']
+        ordem = np.argsort(ids, kind='stable')
+        origem = ordem[np.searchsorted(ids[ordem], arestas['origem'])]
+        destino = ordem[np.searchsorted(ids[ordem], arestas['destino'])]
+        return cls(colunas, medias_classes, contingencia, origem, destino, comunidades)
+
+    def _posicao(self, id_pessoa):
+        i = np.searchsorted(self._ids_ordenados, id_pessoa)
+        if i == len(self._ids_ordenados) or self._ids_ordenados[i] != id_pessoa:
+            raise KeyError(f"Pessoa {id_pessoa} não encontrada.")
+        return self._ordem_ids[i]
+
+    def _dia(self, dia):
+        n_dias = len(self.medias_classes)
+        dia = n_dias - 1 if dia is None else int(dia)
+        if not 0 <= dia < n_dias:
+            raise ValueError(f"Dia {dia} fora do horizonte (0 a {n_dias - 1}).")
+        return dia
+
+    @staticmethod
+    def _classes(classe):
+        classes = CATEGORIAS['classe_socioeconomica']
+        if classe is None:
+            return list(enumerate(classes))
+        if classe not in classes:
+            raise ValueError(f"Classe desconhecida: {classe!r}. Opções: {', '.join(classes)}")
+        return [(classes.index(classe), classe)]
+
+    def resumo(self):
+        return {'pessoas': len(self.populacao), 'dias': len(self.medias_classes),
+                'conexoes': self.grafo.n_arestas, 'comunidades': len(self._estatisticas['comunidade'])}
+
+    def estratos(self, dia=None, classe=None):
+        """Participação (%) de cada estrato dentro de cada classe no dia pedido (padrão: o último)."""
+        dia = self._dia(dia)
+        tabela = self.contingencia_estratos[dia]
+        percentuais = percentual_por_linha(tabela)
+        return {'dia': dia, 'classes': {nome: dict(zip(ESTRATOS, np.round(percentuais[codigo], 2).tolist()))
+                                        for codigo, nome in self._classes(classe)}}
+
+    def trajetoria(self, classe=None, pontos=12):
+        """Resumo da pontuação média diária de cada classe, com uma série de `pontos` dias espaçados."""
+        n_dias = len(self.medias_classes)
+        dias = np.unique(np.linspace(0, n_dias - 1, max(2, int(pontos))).round().astype(np.int64))
+        resposta = {}
+        for codigo, nome in self._classes(classe):
+            serie = self.medias_classes[:, codigo]
+            resposta[nome] = {
+                'inicial': float(serie[0]), 'final': float(serie[-1]), 'variacao': float(serie[-1] - serie[0]),
+                'minimo': float(np.nanmin(serie)), 'dia_minimo': int(np.nanargmin(serie)),
+                'maximo': float(np.nanmax(serie)), 'dia_maximo': int(np.nanargmax(serie)),
+                'serie': {'dia': dias.tolist(), 'media': np.round(serie[dias], 4).tolist()},
+            }
+        return resposta
+
+    def pessoa(self, id_pessoa, vizinhos=50):
+        """Atributos de uma pessoa, sua comunidade e até `vizinhos` vizinhos na rede."""
+        posicao = self._posicao(id_pessoa)
+        atributos = {}
+        for nome, valores in self.populacao.colunas.items():
+            valor = valores[posicao]
+            atributos[nome] = CATEGORIAS[nome][valor] if nome in CATEGORIAS else valor.item()
+        adjacentes = self.grafo.vizinhos(posicao)
+        mostrados = adjacentes[:max(0, int(vizinhos))]
+        estratos = self.populacao['estrato_social'][mostrados]
+        return {
+            'pessoa': atributos,
+            'comunidade': int(self._posicao_comunidade[self.comunidades[posicao]]),
+            'grau': len(adjacentes),
+            'vizinhos': [{'id': int(i), 'pontuacao_final': round(float(p), 4), 'estrato_social': ESTRATOS[e]}
+                         for i, p, e in zip(self.populacao['id'][mostrados],
+                                            self.populacao['pontuacao_final'][mostrados], estratos)],
+        }
+
+    def comunidades_maiores(self, n=10):
+        """As `n` maiores comunidades: tamanho, pontuação média e desvio padrão."""
+        e = self._estatisticas
+        n = max(0, int(n))
+        return [{'comunidade': i, 'tamanho': int(t), 'pontuacao_media': round(float(m), 4),
+                 'desvio_pontuacao': round(float(d), 4)}
+                for i, (t, m, d) in enumerate(zip(e['size'][:n], e['mean_score'][:n], e['std_score'][:n]))]
+
+
+def validar_cenario(dados):
+    """Completa um cenário com os valores padrão e confere tipos e limites; retorna um dict novo."""
+    desconhecidos = set(dados) - set(CENARIO_PADRAO)
+    if desconhecidos:
+        raise ValueError(f"Parâmetros desconhecidos: {', '.join(sorted(desconhecidos))}")
+    cenario = {**CENARIO_PADRAO, **dados}
+    for nome in ('pessoas', 'dias', 'semente'):
+        if not isinstance(cenario[nome], int) or isinstance(cenario[nome], bool) or cenario[nome] < 0:
+            raise ValueError(f"'{nome}' deve ser um inteiro não negativo.")
+    if not 1 <= cenario['pessoas'] <= MAX_PESSOAS or not 1 <= cenario['dias'] <= MAX_DIAS:
+        raise ValueError(f"'pessoas' deve estar entre 1 e {MAX_PESSOAS} e 'dias' entre 1 e {MAX_DIAS}.")
+    pessoas = cenario['pessoas']
+    if n_conexoes_padrao(pessoas) > pessoas * (pessoas - 1) // 2:
+        raise ValueError(f"{pessoas} pessoas não comportam as {n_conexoes_padrao(pessoas)} conexões da rede.")
+    limiares = cenario['limiares']
+    if (not isinstance(limiares, list) or len(limiares) != len(ESTRATOS) - 1
+            or not all(isinstance(limiar, (int, float)) for limiar in limiares) or limiares != sorted(limiares)):
+        raise ValueError(f"'limiares' deve ser uma lista crescente de {len(ESTRATOS) - 1} números.")
+    cenario['limiares'] = [float(limiar) for limiar in limiares]
+    return cenario
+
+
+def simular_cenario(cenario):
+    """Executa um cenário como `python -m socialdive` (simulação, rede, comunidades), sem relatório.
+
+    Roda nos processos do pool; retorna os argumentos de `Resultados`.
+    """
+    from socialdive.analise import registrar_resultado
+    from socialdive.historico import RegistroAgregados, RegistroEstratos
+    from socialdive.populacao import criar_populacao
+    from socialdive.rede import gerar_arestas
+    from socialdive.simulacao import PARAMETROS_PADRAO, evoluir
+
+    n_pessoas, n_dias, limiares = cenario['pessoas'], cenario['dias'], cenario['limiares']
+    classes = CATEGORIAS['classe_socioeconomica']
+    np.random.seed(cenario['semente'])
+    populacao = criar_populacao(n_pessoas)
+    registro_classes = RegistroAgregados(populacao['classe_socioeconomica'], len(classes), n_dias, nomes=classes)
+    registro_estratos = RegistroEstratos(n_dias, limiares, grupos=populacao['classe_socioeconomica'],
+                                         n_grupos=len(classes))
+    pontuacao_final = evoluir(populacao, dict(PARAMETROS_PADRAO), n_dias,
+                              registradores=[registro_classes, registro_estratos])
+    registrar_resultado(populacao, pontuacao_final, limiares)
+    # A rede continua o gerador global, como na execução completa
+    origem, destino = gerar_arestas(populacao['pontuacao_final'], n_conexoes_padrao(n_pessoas))
+    rotulos, _ = detectar_comunidades(GrafoEsparso.de_arestas(origem, destino, n_pessoas))
+    return {'colunas': populacao.colunas, 'medias_classes': registro_classes.media,
+            'contingencia_estratos': registro_estratos.contingencia, 'origem': origem, 'destino': destino,
+            'comunidades': rotulos}
+
+
+class Servico:
+    """Cenários prontos (cache LRU), fixos e em execução no pool de processos."""
+
+    def __init__(self, max_workers=1, tamanho_cache=8):
+        self.tamanho_cache = tamanho_cache
+        self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        self._prontos = OrderedDict()
+        self._fixos = {}
+        self._pendentes = {}
+        self._erros = {}
+        self._apelidos = {}
+        self._trava = threading.Lock()
+
+    def fechar(self):
+        self._executor.shutdown(cancel_futures=True)
+
+    def _id(self, id_cenario):
+        return self._apelidos.get(id_cenario, id_cenario)
+
+    def carregar(self, resultados, id_cenario='base'):
+        """Registra resultados já carregados; ficam fora do despejo LRU."""
+        with self._trava:
+            self._fixos[id_cenario] = resultados
+
+    def submeter(self, dados, apelido=None):
+        """Enfileira um cenário (dict de parâmetros) e retorna (id, estado)."""
+        cenario = validar_cenario(dados)
+        id_cenario = chave('cenario', cenario, _MODULOS_CENARIO)
+        with self._trava:
+            if apelido:
+                self._apelidos[apelido] = id_cenario
+            estado = self._estado(id_cenario)
+            if estado in ('pronto', 'pendente'):
+                return id_cenario, estado
+            self._erros.pop(id_cenario, None)
+            futuro = self._executor.submit(simular_cenario, cenario)
+            self._pendentes[id_cenario] = futuro
+        futuro.add_done_callback(lambda futuro: self._concluir(id_cenario, futuro))
+        return id_cenario, 'pendente'
+
+    def _concluir(self, id_cenario, futuro):
+        try:
+            resultados = Resultados(**futuro.result())
+        except Exception as erro:  # o erro é reportado na consulta do estado
+            with self._trava:
+                self._pendentes.pop(id_cenario, None)
+                self._erros[id_cenario] = f"{type(erro).__name__}: {erro}"
+            return
+        with self._trava:
+            self._pendentes.pop(id_cenario, None)
+            self._prontos[id_cenario] = resultados
+            while len(self._prontos) > self.tamanho_cache:
+                self._prontos.popitem(last=False)
+
+    def _estado(self, id_cenario):
+        if id_cenario in self._fixos or id_cenario in self._prontos:
+            return 'pronto'
+        if id_cenario in self._pendentes:
+            return 'pendente'
+        if id_cenario in self._erros:
+            return 'erro'
+        return None
+
+    def estado(self, id_cenario):
+        id_cenario = self._id(id_cenario)
+        with self._trava:
+            estado = self._estado(id_cenario)
+            if estado is None:
+                raise KeyError(f"Cenário {id_cenario} não encontrado.")
+            resposta = {'id': id_cenario, 'estado': estado}
+            if estado == 'erro':
+                resposta['erro'] = self._erros[id_cenario]
+        if estado == 'pronto':
+            resposta['resumo'] = self.obter(id_cenario).resumo()
+        return resposta
+
+    def obter(self, id_cenario):
+        """`Resultados` de um cenário pronto (e o marca como usado recentemente)."""
+        id_cenario = self._id(id_cenario)
+        with self._trava:
+            if id_cenario in self._fixos:
+                return self._fixos[id_cenario]
+            if id_cenario in self._prontos:
+                self._prontos.move_to_end(id_cenario)
+                return self._prontos[id_cenario]
+            estado = self._estado(id_cenario)
+        if estado is None:
+            raise KeyError(f"Cenário {id_cenario} não encontrado.")
+        raise CenarioPendente(f"Cenário {id_cenario} ainda não está pronto ({estado}).")
+
+    def listar(self):
+        with self._trava:
+            ids = [*self._fixos, *self._prontos, *self._pendentes, *self._erros]
+            return [{'id': id_cenario, 'estado': self._estado(id_cenario)} for id_cenario in dict.fromkeys(ids)]
+
+
+def criar_app(servico):
+    """Aplicação Flask com as rotas de consulta sobre `servico`."""
+    from flask import Flask, jsonify, request
+
+    app = Flask('socialdive')
+    # Estratos e classes na ordem de CATEGORIAS; o provedor `app.json` só existe a partir do Flask 2.2
+    if hasattr(app, 'json'):
+        app.json.ensure_ascii = False
+        app.json.sort_keys = False
+    else:
+        app.config.update(JSON_AS_ASCII=False, JSON_SORT_KEYS=False)
+
+    @app.errorhandler(KeyError)
+    def nao_encontrado(erro):
+        return jsonify(erro=erro.args[0] if erro.args else str(erro)), 404
+
+    @app.errorhandler(ValueError)
+    def invalido(erro):
+        return jsonify(erro=str(erro)), 400
+
+    @app.errorhandler(CenarioPendente)
+    def pendente(erro):
+        return jsonify(erro=str(erro)), 409
+
+    def inteiro(nome, padrao=None):
+        valor = request.args.get(nome)
+        if valor is None:
+            return padrao
+        try:
+            return int(valor)
+        except ValueError:
+            raise ValueError(f"'{nome}' deve ser um inteiro.") from None
+
+    @app.get('/cenarios')
+    def cenarios():
+        return {'cenarios': servico.listar()}
+
+    @app.post('/cenarios')
+    def submeter():
+        dados = request.get_json(silent=True)
+        if not isinstance(dados, dict):
+            raise ValueError("Envie os parâmetros do cenário como um objeto JSON.")
+        id_cenario, estado = servico.submeter(dados)
+        return {'id': id_cenario, 'estado': estado}, 200 if estado == 'pronto' else 202
+
+    @app.get('/cenarios/<id_cenario>')
+    def estado(id_cenario):
+        return servico.estado(id_cenario)
+
+    @app.get('/cenarios/<id_cenario>/estratos')
+    def estratos(id_cenario):
+        return servico.obter(id_cenario).estratos(inteiro('dia'), request.args.get('classe'))
+
+    @app.get('/cenarios/<id_cenario>/trajetoria')
+    def trajetoria(id_cenario):
+        return servico.obter(id_cenario).trajetoria(request.args.get('classe'), inteiro('pontos', 12))
+
+    @app.get('/cenarios/<id_cenario>/pessoas/<int:id_pessoa>')
+    def pessoa(id_cenario, id_pessoa):
+        return servico.obter(id_cenario).pessoa(id_pessoa, inteiro('vizinhos', 50))
+
+    @app.get('/cenarios/<id_cenario>/comunidades')
+    def comunidades(id_cenario):
+        return {'comunidades': servico.obter(id_cenario).comunidades_maiores(inteiro('n', 10))}
+
+    return app
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='socialdive.servico', description=__doc__.splitlines()[0])
+    parser.add_argument('--resultados', default=None, metavar='DIR',
+                        help="diretório gravado por --exportar, carregado como o cenário 'base' "
+                             "(padrão: simula o cenário padrão em segundo plano)")
+    parser.add_argument('--formato', choices=['parquet', 'arrow'], default='parquet',
+                        help="formato dos arquivos em --resultados")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--porta', type=int, default=5000)
+    parser.add_argument('--processos', type=int, default=1, metavar='N', help="processos para simular cenários novos")
+    parser.add_argument('--cenarios-em-cache', type=int, default=8, metavar='N',
+                        help="cenários simulados mantidos em memória (LRU)")
+    args = parser.parse_args(argv)
+
+    servico = Servico(args.processos, args.cenarios_em_cache)
+    if args.resultados:
+        servico.carregar(Resultados.de_diretorio(args.resultados, args.formato))
+        print(f"Resultados de {args.resultados} carregados como o cenário 'base'.")
+    else:
+        servico.submeter({}, apelido='base')
+        print("Simulando o cenário padrão como 'base' em segundo plano.")
+    try:
+        criar_app(servico).run(args.host, args.porta, threaded=True)
+    finally:
+        servico.fechar()
+
+
+if __name__ == '__main__':
+    main()
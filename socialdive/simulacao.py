@@ -0,0 +1,187 @@
+import numpy as np
+
+from socialdive import instrumentacao
+from socialdive.historico import RegistroDenso
+from socialdive.nucleos import obter_nucleo
+from socialdive.populacao import codigo
+
+# Parâmetros que influenciam a evolução da pontuação
+# Baseados nos conceitos dos artigos
+PARAMETROS_PADRAO = {
+    'peso_conformidade': 0.3,  # Quanto a conformidade social influencia a pontuação
+    'peso_autenticidade': -0.1,  # Autenticidade pode reduzir pontuação (sistema valoriza conformidade)
+    'peso_classe': 0.2,  # Influência da classe socioeconômica
+    'peso_educacao': 0.15,  # Influência do nível educacional
+    'peso_acesso_tecnologia': 0.25,  # Influência do acesso à tecnologia
+    'volatilidade': 0.1,  # Quanto a pontuação pode variar aleatoriamente
+    'momentum': 0.8,  # Quanto a tendência atual influencia a futura (efeito Mateus)
+    'polarizacao': 0.05  # Tendência de pontuações extremas se distanciarem mais
+}
+
+
+def _coluna(populacao, nome):
+    return np.asarray(populacao[nome], dtype=np.float64)
+
+
+def _indicadora(populacao, nome, categoria):
+    return populacao[nome] == codigo(nome, categoria)
+
+
+def termos_estaticos(populacao, parametros):
+    """Calcula uma única vez os fatores de deriva que não mudam entre os dias.
+
+    Retorna uma matriz float64 (5, n_pessoas) com os fatores de conformidade,
+    autenticidade, classe, educação e tecnologia, nessa ordem. O laço diário
+    soma as linhas na mesma sequência do script original, o que mantém o
+    resultado idêntico bit a bit (somas de ponto flutuante não são associativas,
+    então não os pré-somamos num único vetor).
+    """
+    n_pessoas = len(populacao)
+    termos = np.empty((5, n_pessoas), dtype=np.float64)
+
+    # Fator de conformidade (pessoas conformes tendem a ganhar pontos)
+    np.multiply(_coluna(populacao, 'conformidade_social'), parametros['peso_conformidade'], out=termos[0])
+
+    # Fator de autenticidade (pode reduzir pontos em um sistema que valoriza conformidade)
+    np.multiply(_coluna(populacao, 'autenticidade'), parametros['peso_autenticidade'], out=termos[1])
+
+    # Fator socioeconômico (classe social influencia oportunidades de pontuação)
+    alta = _indicadora(populacao, 'classe_socioeconomica', 'Alta')
+    baixa = _indicadora(populacao, 'classe_socioeconomica', 'Baixa')
+    termos[2] = alta * 0.1 - baixa * 0.1
+    termos[2] *= parametros['peso_classe']
+
+    # Fator educacional
+    superior = _indicadora(populacao, 'nivel_educacional', 'Superior')
+    pos = _indicadora(populacao, 'nivel_educacional', 'Pós-graduação')
+    fundamental = _indicadora(populacao, 'nivel_educacional', 'Fundamental')
+    termos[3] = superior * 0.05 + pos * 0.1 - fundamental * 0.05
+    termos[3] *= parametros['peso_educacao']
+
+    # Fator de acesso à tecnologia
+    termos[4] = (_coluna(populacao, 'acesso_tecnologia') - 0.5) * parametros['peso_acesso_tecnologia']
+
+    return termos
+
+
+def evoluir(populacao, parametros, n_dias, rng=None, nucleo='numpy', registradores=(), checkpoint=None,
+            retomar=False, avaliacoes=None):
+    """Simula a evolução diária da pontuação social e retorna a pontuação final.
+
+    Os fatores estáticos são pré-calculados por `termos_estaticos`; dentro do
+    laço restam apenas ruído, momentum e polarização, aplicados pelo núcleo
+    escolhido (ver `socialdive.nucleos`). O histórico não é guardado: cada
+    registrador (ver `socialdive.historico`) recebe a pontuação de cada dia,
+    inclusive a do dia 0, então a memória fica em O(n_pessoas).
+
+    `avaliacoes` (um `socialdive.avaliacoes.MotorAvaliacoes`) aplica, depois
+    da deriva de cada dia, as avaliações entre vizinhos da rede social.
+
+    Com um `checkpoint` (ver `socialdive.checkpoint`) o estado é gravado
+    periodicamente; com `retomar=True` a simulação continua do último
+    checkpoint gravado, se houver, com o mesmo resultado de uma execução
+    sem interrupção.
+    """
+    rng = np.random if rng is None else rng
+    n_pessoas = len(populacao)
+    termos = termos_estaticos(populacao, parametros)
+    nucleo = obter_nucleo(nucleo, n_pessoas) if isinstance(nucleo, str) else nucleo
+
+    # Buffers contíguos alternados entre os dias
+    atual = _coluna(populacao, 'pontuacao_inicial').copy()
+    nova = np.empty_like(atual)
+    # O motor de avaliações tem estado próprio (seu gerador) e entra no checkpoint depois dos registradores
+    com_estado = list(registradores) + ([avaliacoes] if avaliacoes is not None else [])
+    estado = checkpoint.carregar() if checkpoint is not None and retomar else None
+    if estado is None:
+        inicio = 1
+        for registrador in registradores:
+            registrador.registrar(0, atual)
+    else:
+        from socialdive.checkpoint import restaurar_rng
+
+        inicio = estado['dia'] + 1
+        if inicio > n_dias:
+            raise ValueError(f"Checkpoint no dia {estado['dia']}, além do horizonte de {n_dias} dias.")
+        atual[:] = estado['atual']
+        restaurar_rng(rng, estado)
+        for i, participante in enumerate(com_estado):
+            participante.restaurar(estado['registradores'][i] if i < len(estado['registradores']) else {})
+
+    for dia in range(inicio, n_dias):
+        # Fator aleatório (eventos diários, interações)
+        ruido = rng.normal(0, parametros['volatilidade'], n_pessoas)
+        nucleo.passo(atual, ruido, termos, parametros, out=nova)
+        atual, nova = nova, atual
+        if avaliacoes is not None:
+            avaliacoes.aplicar(atual)
+        for registrador in registradores:
+            registrador.registrar(dia, atual)
+        if checkpoint is not None and checkpoint.deve_salvar(dia, n_dias):
+            checkpoint.salvar(dia, atual, rng, com_estado)
+
+    for registrador in registradores:
+        registrador.finalizar()
+    instrumentacao.contar('dias_simulados', max(n_dias - inicio, 0))
+    instrumentacao.contar('pessoas_dia', max(n_dias - inicio, 0) * n_pessoas)
+    return atual
+
+
+def simular(populacao, parametros, n_dias, rng=None, nucleo='numpy'):
+    """Como `evoluir`, mas retorna a matriz completa `pontuacoes_tempo` (n_pessoas, n_dias).
+
+    Idêntica à do script original para a mesma semente; exige
+    n_pessoas × n_dias float64 em memória.
+    """
+    denso = RegistroDenso(len(populacao), n_dias)
+    evoluir(populacao, parametros, n_dias, rng=rng, nucleo=nucleo, registradores=[denso])
+    return denso.pontuacoes_tempo
+
+
+def simular_referencia(populacao, parametros, n_dias, rng=None):
+    """Laço diário original (pandas), mantido para validação e benchmarks.
+
+    Recebe a população como DataFrame (`Populacao.para_dataframe()`).
+    """
+    import pandas as pd
+
+    rng = np.random if rng is None else rng
+    n_pessoas = len(populacao)
+
+    pontuacoes_tempo = np.zeros((n_pessoas, n_dias))
+    pontuacoes_tempo[:, 0] = populacao['pontuacao_inicial'].values
+
+    for dia in range(1, n_dias):
+        fator_aleatorio = rng.normal(0, parametros['volatilidade'], n_pessoas)
+        fator_conformidade = populacao['conformidade_social'] * parametros['peso_conformidade']
+        fator_autenticidade = populacao['autenticidade'] * parametros['peso_autenticidade']
+
+        fator_classe = pd.get_dummies(populacao['classe_socioeconomica'])
+        fator_classe = fator_classe['Alta'] * 0.1 - fator_classe['Baixa'] * 0.1
+        fator_classe *= parametros['peso_classe']
+
+        fator_educacao = pd.get_dummies(populacao['nivel_educacional'])
+        fator_educacao = (fator_educacao['Superior'] * 0.05 +
+                          fator_educacao['Pós-graduação'] * 0.1 -
+                          fator_educacao['Fundamental'] * 0.05)
+        fator_educacao *= parametros['peso_educacao']
+
+        fator_tecnologia = (populacao['acesso_tecnologia'] - 0.5) * parametros['peso_acesso_tecnologia']
+
+        pontuacao_atual = pontuacoes_tempo[:, dia-1]
+        fator_momentum = (pontuacao_atual - 3) * 0.01 * parametros['momentum']
+        fator_polarizacao = np.abs(pontuacao_atual - 3) * np.sign(pontuacao_atual - 3) * parametros['polarizacao']
+
+        nova_pontuacao = (pontuacao_atual +
+                          fator_aleatorio +
+                          fator_conformidade +
+                          fator_autenticidade +
+                          fator_classe +
+                          fator_educacao +
+                          fator_tecnologia +
+                          fator_momentum +
+                          fator_polarizacao)
+
+        pontuacoes_tempo[:, dia] = np.clip(nova_pontuacao, 1, 5)
+
+    return pontuacoes_tempo
@@ -0,0 +1,91 @@
+"""Varredura de parâmetros: várias simulações independentes num pool de processos."""
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from socialdive.estratos import ESTRATOS, classificar
+from socialdive.populacao import CATEGORIAS, criar_populacao
+from socialdive.simulacao import PARAMETROS_PADRAO, evoluir
+
+
+def grade_parametros(base=None, **valores):
+    """Produto cartesiano dos valores dados, sobre os parâmetros padrão.
+
+    Ex.: `grade_parametros(momentum=[0.4, 0.8], polarizacao=[0.0, 0.05])`
+    gera 4 configurações.
+    """
+    base = PARAMETROS_PADRAO if base is None else base
+    _validar_nomes(valores)
+    nomes = list(valores)
+    return [dict(base, **dict(zip(nomes, combinacao)))
+            for combinacao in itertools.product(*valores.values())]
+
+
+def amostrar_parametros(intervalos, n_amostras, semente=42, base=None):
+    """Amostra uniforme de `n_amostras` configurações dentro de `intervalos` {nome: (min, max)}."""
+    base = PARAMETROS_PADRAO if base is None else base
+    _validar_nomes(intervalos)
+    rng = np.random.RandomState(semente)
+    amostras = {nome: rng.uniform(minimo, maximo, n_amostras)
+                for nome, (minimo, maximo) in intervalos.items()}
+    return [dict(base, **{nome: float(valores[i]) for nome, valores in amostras.items()})
+            for i in range(n_amostras)]
+
+
+def _validar_nomes(valores):
+    desconhecidos = set(valores) - set(PARAMETROS_PADRAO)
+    if desconhecidos:
+        raise ValueError(f"Parâmetros desconhecidos: {', '.join(sorted(desconhecidos))}")
+
+
+def _executar(tarefa):
+    execucao, repeticao, parametros, sequencia, n_pessoas, n_dias, nucleo = tarefa
+    # Fluxo independente por execução, derivado da SeedSequence raiz
+    rng = np.random.RandomState(np.random.MT19937(sequencia))
+    populacao = criar_populacao(n_pessoas, rng)
+    final = evoluir(populacao, parametros, n_dias, rng=rng, nucleo=nucleo)
+
+    base = {'execucao': execucao, 'repeticao': repeticao, **parametros}
+    linhas = []
+
+    estratos = classificar(final)
+    proporcoes = np.bincount(estratos, minlength=len(ESTRATOS)) / n_pessoas
+    for estrato, proporcao in zip(ESTRATOS, proporcoes):
+        linhas.append(dict(base, metrica='proporcao_estrato', grupo=estrato, valor=float(proporcao)))
+
+    mobilidade = final - populacao['pontuacao_inicial']
+    classes = populacao['classe_socioeconomica']
+    n_classes = len(CATEGORIAS['classe_socioeconomica'])
+    medias = (np.bincount(classes, weights=mobilidade, minlength=n_classes)
+              / np.bincount(classes, minlength=n_classes))
+    for classe, media in zip(CATEGORIAS['classe_socioeconomica'], medias):
+        linhas.append(dict(base, metrica='mobilidade_classe', grupo=classe, valor=float(media)))
+    return linhas
+
+
+def executar_varredura(configuracoes, n_repeticoes=1, semente=42, n_pessoas=1000, n_dias=365,
+                       max_workers=None, nucleo='numpy'):
+    """Executa população + laço diário para cada configuração e repetição.
+
+    Cada execução recebe um `np.random.SeedSequence` filho de `semente`, então
+    os resultados não dependem do número de processos nem da ordem em que as
+    tarefas terminam. Retorna uma tabela longa (pandas) com uma linha por
+    execução e métrica: proporção de cada estrato e mobilidade média por classe.
+    """
+    import pandas as pd
+
+    sequencias = np.random.SeedSequence(semente).spawn(len(configuracoes) * n_repeticoes)
+    tarefas = [
+        (execucao, repeticao, parametros, sequencias[execucao * n_repeticoes + repeticao],
+         n_pessoas, n_dias, nucleo)
+        for execucao, parametros in enumerate(configuracoes)
+        for repeticao in range(n_repeticoes)
+    ]
+
+    n_processos = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=n_processos) as executor:
+        resultados = executor.map(_executar, tarefas, chunksize=max(1, len(tarefas) // (4 * n_processos)))
+        linhas = [linha for linhas in resultados for linha in linhas]
+    return pd.DataFrame(linhas)